@@ -65,6 +65,16 @@ def run_migrations_online():
     In this scenario, we need to create an Engine
     and associate a connection with the context.
     """
+    # Callers (e.g. the test-suite) may hand in an existing connection.
+    provided_connection = config.attributes.get("connection", None)
+    if provided_connection is not None:
+        context.configure(
+            connection=provided_connection, target_metadata=target_metadata
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine
 
     with connectable.connect() as connection:
@@ -0,0 +1,90 @@
+"""secondary indexes for read filters
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# jadwal reads always filter on is_active, so its indexes only cover active rows.
+ACTIVE_JADWAL = {
+    "sqlite_where": sa.text("is_active = 1"),
+    "postgresql_where": sa.text("is_active = true"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_mahasiswa_kelas", "mahasiswa", ["kelas"])
+    op.create_index("ix_mahasiswa_status", "mahasiswa", ["status"])
+    op.create_index("ix_mahasiswa_nama", "mahasiswa", ["nama"])
+    op.create_index("ix_mahasiswa_tanggal_lahir", "mahasiswa", ["tanggal_lahir"])
+
+    op.create_index("ix_dosen_status", "dosen", ["status"])
+    op.create_index("ix_dosen_nama", "dosen", ["nama"])
+
+    op.create_index("ix_mata_kuliah_sks", "mata_kuliah", ["sks"])
+    op.create_index("ix_mata_kuliah_nama_mk", "mata_kuliah", ["nama_mk"])
+
+    op.create_index(
+        "ix_jadwal_active_dosen_hari",
+        "jadwal",
+        ["dosen_id", "hari", "jam_mulai"],
+        **ACTIVE_JADWAL,
+    )
+    op.create_index(
+        "ix_jadwal_active_ruangan_hari",
+        "jadwal",
+        ["ruangan", "hari", "jam_mulai"],
+        **ACTIVE_JADWAL,
+    )
+    op.create_index(
+        "ix_jadwal_active_mata_kuliah", "jadwal", ["mata_kuliah_id"], **ACTIVE_JADWAL
+    )
+    op.create_index(
+        "ix_jadwal_active_hari", "jadwal", ["hari", "jam_mulai"], **ACTIVE_JADWAL
+    )
+
+    op.create_index(
+        "ix_tugas_mahasiswa_deadline", "tugas", ["mahasiswa_id", "deadline"]
+    )
+    op.create_index(
+        "ix_tugas_mata_kuliah_deadline", "tugas", ["mata_kuliah_id", "deadline"]
+    )
+    op.create_index("ix_tugas_status_deadline", "tugas", ["status", "deadline"])
+    op.create_index("ix_tugas_deadline", "tugas", ["deadline"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tugas_deadline", table_name="tugas")
+    op.drop_index("ix_tugas_status_deadline", table_name="tugas")
+    op.drop_index("ix_tugas_mata_kuliah_deadline", table_name="tugas")
+    op.drop_index("ix_tugas_mahasiswa_deadline", table_name="tugas")
+
+    op.drop_index("ix_jadwal_active_hari", table_name="jadwal")
+    op.drop_index("ix_jadwal_active_mata_kuliah", table_name="jadwal")
+    op.drop_index("ix_jadwal_active_ruangan_hari", table_name="jadwal")
+    op.drop_index("ix_jadwal_active_dosen_hari", table_name="jadwal")
+
+    op.drop_index("ix_mata_kuliah_nama_mk", table_name="mata_kuliah")
+    op.drop_index("ix_mata_kuliah_sks", table_name="mata_kuliah")
+
+    op.drop_index("ix_dosen_nama", table_name="dosen")
+    op.drop_index("ix_dosen_status", table_name="dosen")
+
+    op.drop_index("ix_mahasiswa_tanggal_lahir", table_name="mahasiswa")
+    op.drop_index("ix_mahasiswa_nama", table_name="mahasiswa")
+    op.drop_index("ix_mahasiswa_status", table_name="mahasiswa")
+    op.drop_index("ix_mahasiswa_kelas", table_name="mahasiswa")
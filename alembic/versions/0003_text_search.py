@@ -0,0 +1,77 @@
+"""text search indexes for substring filters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = {
+    "mahasiswa": ("nama", "tempat_lahir"),
+    "dosen": ("nama", "email"),
+    "mata_kuliah": ("kode_mk", "nama_mk"),
+    "jadwal": ("hari", "ruangan"),
+    "tugas": ("judul", "deskripsi"),
+}
+
+
+def _sqlite_statements(table: str, columns: tuple[str, ...]) -> list[str]:
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{table}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} "
+        f"BEGIN INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for table, columns in SEARCH_COLUMNS.items():
+            for statement in _sqlite_statements(table, columns):
+                op.execute(statement)
+    elif dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, columns in SEARCH_COLUMNS.items():
+            for column in columns:
+                op.execute(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for table in SEARCH_COLUMNS:
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+    elif dialect == "postgresql":
+        for table, columns in SEARCH_COLUMNS.items():
+            for column in columns:
+                op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm")
@@ -0,0 +1,39 @@
+"""per-table change versions
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("mahasiswa", "mata_kuliah", "dosen", "jadwal", "tugas")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    table_versions = op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.bulk_insert(
+        table_versions,
+        [{"table_name": name, "version": 0} for name in VERSIONED_TABLES],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("table_versions")
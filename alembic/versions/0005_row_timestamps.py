@@ -0,0 +1,73 @@
+"""created_at / updated_at on every table
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("mahasiswa", "mata_kuliah", "dosen", "jadwal", "tugas")
+COLUMNS = ("created_at", "updated_at")
+
+# SQLite cannot ADD COLUMN NOT NULL without a constant default, so the columns
+# are added with one, existing rows are stamped and the default is dropped
+# again: the models stamp both columns on the Python side.
+EPOCH = sa.text("'1970-01-01 00:00:00'")
+
+
+def _sqlite_triggers(table: str) -> list[str]:
+    # Batch mode rebuilds the table on SQLite, which drops its triggers (the
+    # full-text index ones from 0003); they are re-created from these.
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return []
+    return list(
+        bind.execute(
+            sa.text(
+                "SELECT sql FROM sqlite_master "
+                "WHERE type = 'trigger' AND tbl_name = :table"
+            ),
+            {"table": table},
+        ).scalars()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        for column in COLUMNS:
+            op.add_column(
+                table,
+                sa.Column(column, sa.DateTime(), nullable=False, server_default=EPOCH),
+            )
+        op.execute(
+            f"UPDATE {table} SET created_at = CURRENT_TIMESTAMP, "
+            "updated_at = CURRENT_TIMESTAMP"
+        )
+        triggers = _sqlite_triggers(table)
+        with op.batch_alter_table(table) as batch_op:
+            for column in COLUMNS:
+                batch_op.alter_column(column, server_default=None)
+        for trigger in triggers:
+            op.execute(trigger)
+        for column in COLUMNS:
+            op.create_index(f"ix_{table}_{column}", table, [column])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        for column in COLUMNS:
+            op.drop_index(f"ix_{table}_{column}", table_name=table)
+            op.drop_column(table, column)
@@ -0,0 +1,75 @@
+"""capitalized hari and jadwal double-booking guards
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GUARDS = {
+    "ruangan": "jadwal_ruangan_double_booked",
+    "dosen_id": "jadwal_dosen_id_double_booked",
+}
+
+
+def _sqlite_statements(column: str, guard: str) -> list[str]:
+    overlap = (
+        f"SELECT RAISE(ABORT, '{guard}') WHERE EXISTS (SELECT 1 FROM jadwal "
+        f"WHERE is_active = 1 AND {column} = new.{column} "
+        "AND hari = new.hari AND jam_mulai < new.jam_selesai "
+        "AND jam_selesai > new.jam_mulai"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {guard}_bi BEFORE INSERT ON jadwal "
+        f"WHEN new.is_active BEGIN {overlap}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {guard}_bu BEFORE UPDATE OF "
+        f"hari, jam_mulai, jam_selesai, {column}, is_active ON jadwal "
+        f"WHEN new.is_active BEGIN {overlap} AND id != new.id); END",
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The API now stores hari capitalized ("senin " -> "Senin"); existing rows
+    # are brought in line so overlap checks compare like with like.
+    op.execute(
+        "UPDATE jadwal SET hari = "
+        "upper(substr(trim(hari), 1, 1)) || lower(substr(trim(hari), 2))"
+    )
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for column, guard in GUARDS.items():
+            for statement in _sqlite_statements(column, guard):
+                op.execute(statement)
+    elif dialect == "postgresql":
+        # Fails if active double-bookings already exist; they have to be
+        # resolved (one side deactivated or moved) before upgrading.
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        for column, guard in GUARDS.items():
+            op.execute(
+                f"ALTER TABLE jadwal ADD CONSTRAINT {guard} EXCLUDE USING gist "
+                f"({column} WITH =, hari WITH =, tsrange(DATE '2000-01-01' + "
+                "jam_mulai, DATE '2000-01-01' + jam_selesai) WITH &&) "
+                "WHERE (is_active)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for guard in GUARDS.values():
+        if dialect == "sqlite":
+            for suffix in ("bi", "bu"):
+                op.execute(f"DROP TRIGGER IF EXISTS {guard}_{suffix}")
+        elif dialect == "postgresql":
+            op.execute(f"ALTER TABLE jadwal DROP CONSTRAINT IF EXISTS {guard}")
@@ -0,0 +1,108 @@
+"""
+Cost of turning 10k mahasiswa rows into DTOs: the validating constructor,
+pydantic's ``model_construct`` and ``construct_dto`` as used by ``to_entity()``.
+
+    python benchmarks/dto_construction.py [--rows 10000] [--repeat 5]
+
+The rows are loaded once from an in-memory SQLite database, so only the
+row-to-DTO step is timed (best of ``--repeat`` runs).
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from src.application.dtos.mahasiswa_dto import MahasiswaDto
+from src.application.enums import MahasiswaStatus
+from src.repositories.database.core import Base
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+
+
+def load_rows(count: int) -> Sequence[MahasiswaModel]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.execute(
+        insert(MahasiswaModel),
+        [
+            {
+                "nim": f"{2024000000 + i}",
+                "nama": f"Mahasiswa {i}",
+                "kelas": "TI-3E",
+                "tempat_lahir": "Bandung",
+                "tanggal_lahir": date(2003, 1, 1),
+                "status": MahasiswaStatus.ACTIVE,
+            }
+            for i in range(count)
+        ],
+    )
+    return session.execute(select(MahasiswaModel)).scalars().all()
+
+
+def validated(m: MahasiswaModel) -> MahasiswaDto:
+    return MahasiswaDto(
+        id=m.id,
+        nim=m.nim,
+        nama=m.nama,
+        kelas=m.kelas,
+        tempat_lahir=m.tempat_lahir,
+        tanggal_lahir=m.tanggal_lahir,
+        status=m.status,
+    )
+
+
+def model_construct(m: MahasiswaModel) -> MahasiswaDto:
+    return MahasiswaDto.model_construct(
+        id=m.id,
+        nim=m.nim,
+        nama=m.nama,
+        kelas=m.kelas,
+        tempat_lahir=m.tempat_lahir,
+        tanggal_lahir=m.tanggal_lahir,
+        status=m.status,
+    )
+
+
+def best_time(
+    convert: Callable[[MahasiswaModel], MahasiswaDto],
+    rows: Sequence[MahasiswaModel],
+    repeat: int,
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            convert(row)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = load_rows(args.rows)
+    assert all(validated(m) == m.to_entity() for m in rows[:100])
+
+    baseline = best_time(validated, rows, args.repeat)
+    constructed = best_time(model_construct, rows, args.repeat)
+    optimized = best_time(MahasiswaModel.to_entity, rows, args.repeat)
+    print(f"{args.rows} rows, best of {args.repeat}")
+    print(f"  MahasiswaDto(...):             {baseline * 1000:8.1f} ms")
+    print(f"  MahasiswaDto.model_construct:  {constructed * 1000:8.1f} ms")
+    print(f"  to_entity (construct_dto):     {optimized * 1000:8.1f} ms")
+    print(f"  speed-up: {baseline / optimized:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Throughput of a 1k-row list response: FastAPI's response_model path versus
+returning the DTOs in a DtoJSONResponse.
+
+    python benchmarks/json_responses.py [--rows 1000] [--requests 200]
+
+No database is involved; both routes return the same prebuilt DTOs, so the
+difference is validation and serialization alone.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.application.dtos.mahasiswa_dto import MahasiswaDto
+from src.application.enums import MahasiswaStatus
+from src.infrastructure.responses import DtoJSONResponse
+
+
+def make_rows(count: int) -> list[MahasiswaDto]:
+    return [
+        MahasiswaDto(
+            id=i,
+            nim=f"{2024000000 + i}",
+            nama=f"Mahasiswa {i}",
+            kelas="TI-3E",
+            tempat_lahir="Bandung",
+            tanggal_lahir=date(2003, 1, 1),
+            status=MahasiswaStatus.ACTIVE,
+        )
+        for i in range(count)
+    ]
+
+
+def make_app(rows: list[MahasiswaDto]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get(
+        "/response-model",
+        response_model=list[MahasiswaDto],
+        response_class=JSONResponse,
+    )
+    def response_model_route():
+        return rows
+
+    @app.get("/dto-json", response_model=list[MahasiswaDto])
+    def dto_json_route():
+        return DtoJSONResponse(rows)
+
+    return app
+
+
+def requests_per_second(client: TestClient, path: str, requests: int) -> float:
+    client.get(path)  # warm-up
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path)
+        response.raise_for_status()
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    client = TestClient(make_app(make_rows(args.rows)))
+    assert client.get("/response-model").json() == client.get("/dto-json").json()
+
+    baseline = requests_per_second(client, "/response-model", args.requests)
+    optimized = requests_per_second(client, "/dto-json", args.requests)
+    print(f"{args.rows} rows per response, {args.requests} requests each")
+    print(f"  response_model + JSONResponse: {baseline:8.1f} req/s")
+    print(f"  DtoJSONResponse:               {optimized:8.1f} req/s")
+    print(f"  speed-up: {optimized / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+"""
+Benchmark suite: repository reads per filter combination, service writes and
+HTTP round trips against a database seeded with ``--rows`` rows per table.
+
+    python benchmarks/suite.py run [--rows 10000] [--repeat 7] [--number 20]
+                                   [--only http/] [--output results.json]
+    python benchmarks/suite.py compare baseline.json results.json [--threshold 0.2]
+
+``run`` drops and recreates every table of ``DB_URL`` (by default a scratch
+SQLite file in the temp directory, never mahasiswa.db), bulk-loads
+deterministic rows and times each case ``--number`` calls at a time,
+``--repeat`` times; the JSON results hold the per-call median and best of
+every case. ``compare`` diffs two result files case by case and exits with
+status 1 when a median got slower than the baseline by more than
+``--threshold``, so a stored baseline can gate a change.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime
+from datetime import time as time_of_day
+from datetime import timedelta, timezone
+from typing import Any
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Must be set before src is imported: the application engine is built from it.
+os.environ.setdefault(
+    "DB_URL",
+    "sqlite:///" + os.path.join(tempfile.gettempdir(), "p-todo-y-benchmark.db"),
+)
+
+import sqlalchemy
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.application.dtos.mahasiswa_dto import CreateMahasiswaDto, UpdateMahasiswaDto
+from src.application.dtos.tugas_dto import CreateTugasDto
+from src.application.enums import DosenStatus, MahasiswaStatus, StatusTugas
+from src.application.usecases.mahasiswa import MahasiswaService
+from src.application.usecases.tugas import TugasService
+from src.infrastructure.app import app
+from src.ports.dosen import GetDosenPort
+from src.ports.jadwal import GetJadwalPort
+from src.ports.mahasiswa import GetMahasiswaPort
+from src.ports.mata_kuliah import GetMataKuliahPort
+from src.ports.tugas import GetTugasPort
+from src.repositories.cache import count_cache, dosen_cache, mata_kuliah_cache
+from src.repositories.database.core import Base, SessionLocal, engine
+from src.repositories.database.dosen import DosenRepository
+from src.repositories.database.jadwal import JadwalRepository
+from src.repositories.database.mahasiswa import MahasiswaRepository
+from src.repositories.database.mata_kuliah import MataKuliahRepository
+from src.repositories.database.models.dosen import DosenModel
+from src.repositories.database.models.jadwal import JadwalModel
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+from src.repositories.database.models.mata_kuliah import MataKuliahModel
+from src.repositories.database.models.tugas import TugasModel
+from src.repositories.database.tugas import TugasRepository
+from src.repositories.database.versions import forget_versions
+
+SEED_BATCH_SIZE = 10_000
+
+FIRST_NAMES = ["Adi", "Budi", "Citra", "Dewi", "Eka", "Fajar", "Gita", "Hadi"]
+LAST_NAMES = ["Pratama", "Saputra", "Lestari", "Wijaya", "Nugroho", "Kusuma"]
+CITIES = ["Bandung", "Jakarta", "Surabaya", "Medan", "Cirebon", "Garut"]
+TOPICS = ["Basis Data", "Jaringan", "Algoritma", "Statistika", "Sistem Operasi"]
+HARI = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat"]
+# Start hours of the two-hour periods a jadwal is placed in.
+PERIODS = [7, 9, 11, 13, 15]
+
+
+# ----------------------------------------------------------------------
+# Seeding
+# ----------------------------------------------------------------------
+def mahasiswa_rows(count: int, rng: random.Random) -> Iterator[dict[str, Any]]:
+    for i in range(count):
+        yield {
+            "nim": f"{2024000000 + i}",
+            "nama": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}",
+            "kelas": f"{rng.choice(['TI', 'SIB'])}-{rng.randint(1, 4)}"
+            f"{rng.choice('ABCDEFGHI')}",
+            "tempat_lahir": rng.choice(CITIES),
+            "tanggal_lahir": date(2000, 1, 1) + timedelta(days=rng.randrange(2500)),
+            "status": rng.choices(list(MahasiswaStatus), weights=[85, 5, 5, 5])[0],
+        }
+
+
+def dosen_rows(count: int, rng: random.Random) -> Iterator[dict[str, Any]]:
+    for i in range(count):
+        yield {
+            "nidn": f"{1000000000 + i}",
+            "nama": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}, M.Kom.",
+            "email": f"dosen{i}@kampus.ac.id",
+            "status": rng.choices(list(DosenStatus), weights=[90, 5, 5])[0],
+        }
+
+
+def mata_kuliah_rows(count: int, rng: random.Random) -> Iterator[dict[str, Any]]:
+    for i in range(count):
+        yield {
+            "kode_mk": f"MK{i:07d}",
+            "nama_mk": f"{rng.choice(TOPICS)} {i}",
+            "sks": rng.randint(1, 4),
+            "is_active": rng.random() < 0.95,
+        }
+
+
+def jadwal_rows(
+    count: int, rng: random.Random, mata_kuliah: int, dosen: int
+) -> Iterator[dict[str, Any]]:
+    # The double-booking guards reject overlapping active rows, so row i takes
+    # ruangan i % rooms in the (i // rooms)-th (hari, period) slot. The rows
+    # sharing a slot are consecutive, so their dosen i % dosen differ as well.
+    slots = len(HARI) * len(PERIODS)
+    rooms = max(200, -(-count // slots))
+    for i in range(count):
+        slot, room = divmod(i, rooms)
+        jam_mulai = PERIODS[slot // len(HARI)]
+        yield {
+            "hari": HARI[slot % len(HARI)],
+            "jam_mulai": time_of_day(jam_mulai),
+            "jam_selesai": time_of_day(jam_mulai + 2),
+            "ruangan": f"R{room + 1:03d}",
+            "is_active": rng.random() < 0.9,
+            "mata_kuliah_id": rng.randint(1, mata_kuliah),
+            "dosen_id": i % dosen + 1,
+        }
+
+
+def tugas_rows(
+    count: int, rng: random.Random, mata_kuliah: int, mahasiswa: int
+) -> Iterator[dict[str, Any]]:
+    start = datetime(2025, 1, 1)
+    for i in range(count):
+        topic = rng.choice(TOPICS)
+        yield {
+            "judul": f"Tugas {topic} {i}",
+            "deskripsi": f"Kerjakan latihan {topic} bab {rng.randint(1, 12)}.",
+            "deadline": start + timedelta(hours=rng.randrange(24 * 365)),
+            "status": rng.choice(list(StatusTugas)),
+            "mata_kuliah_id": rng.randint(1, mata_kuliah),
+            "mahasiswa_id": rng.randint(1, mahasiswa),
+        }
+
+
+def bulk_insert(model: type[Base], rows: Iterable[dict[str, Any]]) -> None:
+    with engine.begin() as connection:
+        iterator = iter(rows)
+        while batch := list(itertools.islice(iterator, SEED_BATCH_SIZE)):
+            connection.execute(insert(model), batch)
+
+
+def seed(rows: int, seed_value: int = 0) -> dict[str, float]:
+    """Recreates the schema and loads ``rows`` rows into every table."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    for cache in (mata_kuliah_cache, dosen_cache, count_cache):
+        cache.clear()
+    forget_versions()
+
+    rng = random.Random(seed_value)
+    timings = {}
+    for model, generated in (
+        (MahasiswaModel, mahasiswa_rows(rows, rng)),
+        (DosenModel, dosen_rows(rows, rng)),
+        (MataKuliahModel, mata_kuliah_rows(rows, rng)),
+        (JadwalModel, jadwal_rows(rows, rng, rows, rows)),
+        (TugasModel, tugas_rows(rows, rng, rows, rows)),
+    ):
+        started = time.perf_counter()
+        bulk_insert(model, generated)
+        timings[model.__tablename__] = time.perf_counter() - started
+    return timings
+
+
+# ----------------------------------------------------------------------
+# Cases
+# ----------------------------------------------------------------------
+Case = Callable[[], Any]
+
+REPOSITORY_READS: dict[str, tuple[type, Any]] = {
+    "mahasiswa/page": (MahasiswaRepository, GetMahasiswaPort(limit=50)),
+    "mahasiswa/kelas": (MahasiswaRepository, GetMahasiswaPort(kelas="TI-3A", limit=50)),
+    "mahasiswa/nim": (MahasiswaRepository, GetMahasiswaPort(nim="2024000042")),
+    "mahasiswa/nama-contains": (
+        MahasiswaRepository,
+        GetMahasiswaPort(nama="Dewi", limit=50),
+    ),
+    "mahasiswa/q": (MahasiswaRepository, GetMahasiswaPort(q="Bandung", limit=50)),
+    "mahasiswa/order-nama-desc": (
+        MahasiswaRepository,
+        GetMahasiswaPort(order_by="nama", order="desc", limit=50),
+    ),
+    "mahasiswa/deep-page": (MahasiswaRepository, GetMahasiswaPort(limit=50, page=100)),
+    "mahasiswa/fields": (
+        MahasiswaRepository,
+        GetMahasiswaPort(fields=["id", "nama"], limit=50),
+    ),
+    "dosen/page": (DosenRepository, GetDosenPort(limit=50)),
+    "dosen/nama-contains": (DosenRepository, GetDosenPort(nama="Wijaya", limit=50)),
+    "mata_kuliah/sks": (MataKuliahRepository, GetMataKuliahPort(sks=3, limit=50)),
+    "jadwal/hari": (JadwalRepository, GetJadwalPort(hari="Rabu", limit=50)),
+    "jadwal/ruangan-hari": (
+        JadwalRepository,
+        GetJadwalPort(ruangan="R042", hari="Rabu", limit=50),
+    ),
+    "jadwal/expand": (
+        JadwalRepository,
+        GetJadwalPort(expand=["dosen", "mata_kuliah"], limit=50),
+    ),
+    "tugas/status": (
+        TugasRepository,
+        GetTugasPort(status=StatusTugas.PENDING, limit=50),
+    ),
+    "tugas/mahasiswa": (TugasRepository, GetTugasPort(mahasiswa_id=7, limit=50)),
+    "tugas/deadline-range": (
+        TugasRepository,
+        GetTugasPort(
+            deadline_from=datetime(2025, 3, 1),
+            deadline_to=datetime(2025, 3, 8),
+            limit=50,
+        ),
+    ),
+    "tugas/q": (TugasRepository, GetTugasPort(q="Jaringan", limit=50)),
+}
+
+HTTP_READS = {
+    "mahasiswa/page": "/mahasiswa/?limit=50",
+    "mahasiswa/kelas": "/mahasiswa/?kelas=TI-3A&limit=50",
+    "mahasiswa/count": "/mahasiswa/count",
+    "dosen/page": "/dosen/?limit=50",
+    "mata-kuliah/page": "/mata-kuliah/?limit=50",
+    "jadwal/expand": "/jadwal/?expand=dosen,mata_kuliah&limit=50",
+    "tugas/status-total": "/tugas/?status=pending&limit=50&include_total=true",
+    "tugas/export-1000": "/tugas/export?format=ndjson&limit=1000",
+}
+
+
+def repository_cases(session: Session) -> dict[str, Case]:
+    cases = {}
+    for name, (repository_type, port) in REPOSITORY_READS.items():
+        repository = repository_type(session_db=session)
+        cases[f"repository/{name}"] = lambda r=repository, p=port: r.read(p)
+    return cases
+
+
+def service_cases(session: Session) -> dict[str, Case]:
+    mahasiswa = MahasiswaService(mahasiswa_repo=MahasiswaRepository(session_db=session))
+    tugas = TugasService(tugas_repo=TugasRepository(session_db=session))
+    nims = itertools.count(9000000000)
+    names = itertools.cycle(["Adi Pratama", "Budi Saputra"])
+
+    def create_mahasiswa():
+        return mahasiswa.create(
+            CreateMahasiswaDto(
+                nim=str(next(nims)),
+                nama="Citra Lestari",
+                kelas="TI-3A",
+                tempat_lahir="Bandung",
+                tanggal_lahir=date(2003, 1, 1),
+            )
+        )
+
+    def update_mahasiswa():
+        return mahasiswa.update(
+            UpdateMahasiswaDto(
+                id=1,
+                nim="2024000000",
+                nama=next(names),
+                kelas="TI-3A",
+                tempat_lahir="Bandung",
+                tanggal_lahir=date(2003, 1, 1),
+                status=MahasiswaStatus.ACTIVE,
+            )
+        )
+
+    def create_tugas():
+        return tugas.create(
+            CreateTugasDto(
+                judul="Laporan praktikum",
+                deskripsi="Kumpulkan dalam format PDF.",
+                deadline=datetime.now(timezone.utc).replace(tzinfo=None),
+                mata_kuliah_id=1,
+                mahasiswa_id=1,
+            )
+        )
+
+    return {
+        "service/mahasiswa/create": create_mahasiswa,
+        "service/mahasiswa/update": update_mahasiswa,
+        "service/tugas/create": create_tugas,
+    }
+
+
+def http_cases(client: TestClient) -> dict[str, Case]:
+    cases: dict[str, Case] = {}
+    for name, path in HTTP_READS.items():
+        cases[f"http/{name}"] = lambda p=path: client.get(p).raise_for_status()
+    nims = itertools.count(9500000000)
+
+    def post_mahasiswa():
+        client.post(
+            "/mahasiswa/",
+            json={
+                "nim": str(next(nims)),
+                "nama": "Dewi Kusuma",
+                "kelas": "SIB-2B",
+                "tempat_lahir": "Garut",
+                "tanggal_lahir": "2002-05-17",
+            },
+        ).raise_for_status()
+
+    cases["http/mahasiswa/create"] = post_mahasiswa
+    return cases
+
+
+def measure(case: Case, repeat: int, number: int) -> dict[str, Any]:
+    case()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            case()
+        samples.append((time.perf_counter() - started) / number * 1000)
+    return {
+        "median_ms": statistics.median(samples),
+        "best_ms": min(samples),
+        "samples_ms": samples,
+    }
+
+
+# ----------------------------------------------------------------------
+# Commands
+# ----------------------------------------------------------------------
+def run(args: argparse.Namespace) -> None:
+    # One log line per request would be timed along with it.
+    for name in ("httpx", "src.infrastructure.instrumentation"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    print(f"Seeding {args.rows} rows per table into {engine.url!r}...")
+    seed_timings = seed(args.rows)
+    for table, seconds in seed_timings.items():
+        print(f"  {table:<12} {seconds:8.2f} s")
+
+    session = SessionLocal()
+    results = {}
+    try:
+        with TestClient(app) as client:
+            cases = {
+                **repository_cases(session),
+                **service_cases(session),
+                **http_cases(client),
+            }
+            for name, case in cases.items():
+                if args.only and not any(name.startswith(p) for p in args.only):
+                    continue
+                results[name] = measure(case, args.repeat, args.number)
+                print(f"  {name:<40} {results[name]['median_ms']:9.3f} ms")
+    finally:
+        session.close()
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "rows": args.rows,
+            "repeat": args.repeat,
+            "number": args.number,
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "seed_s": seed_timings,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+def compare(args: argparse.Namespace) -> None:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.results) as f:
+        current = json.load(f)
+    if baseline["meta"]["rows"] != current["meta"]["rows"]:
+        print(
+            f"Warning: baseline has {baseline['meta']['rows']} rows per table, "
+            f"results have {current['meta']['rows']}."
+        )
+
+    regressions = 0
+    print(f"{'case':<40} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<40} {'-':>10} {result['median_ms']:10.3f}      new")
+            continue
+        change = result["median_ms"] / before["median_ms"] - 1
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "  faster"
+        print(
+            f"{name:<40} {before['median_ms']:10.3f} {result['median_ms']:10.3f} "
+            f"{change:+8.1%}{flag}"
+        )
+    for name in sorted(baseline["results"].keys() - current["results"].keys()):
+        print(f"{name:<40} missing from results")
+
+    if regressions:
+        print(f"{regressions} case(s) slower than the baseline by {args.threshold:.0%}")
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser(
+        "run", help="seed the database and time every case"
+    )
+    run_parser.add_argument("--rows", type=int, default=10_000)
+    run_parser.add_argument("--repeat", type=int, default=7)
+    run_parser.add_argument("--number", type=int, default=20)
+    run_parser.add_argument(
+        "--only",
+        action="append",
+        help="only run cases whose name starts with this prefix (repeatable)",
+    )
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="diff results against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,93 +1,150 @@
 import argparse
 import os
-import random
 import sys
-from datetime import datetime
+import time
 
-from faker import Faker  # type: ignore[import-not-found]
 from sqlalchemy.orm import Session
 
-from src.application.dtos.mahasiswa_dto import CreateMahasiswaDto
-from src.application.usecases.mahasiswa import MahasiswaService
-from src.ports.mahasiswa import GetMahasiswaPort
+from src.application.dtos.import_dto import ImportResultDto
+from src.application.exceptions import ImportInterruptedException
+from src.dependencies import build_mahasiswa_service, build_tugas_service
+from src.infrastructure.imports import csv_rows
 from src.repositories.database.core import Base, engine, get_db_session
-from src.repositories.database.mahasiswa import MahasiswaRepository
+from src.repositories.database.seeding import SEED_TABLES, seed_tables, table_sizes
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 
-def seed_database():
-    """Populates the database with initial Mahasiswa data."""
+def seed_database(
+    scale: int = 10,
+    tables: tuple[str, ...] = SEED_TABLES,
+    workers: int = 1,
+    seed: int = 0,
+):
+    """Populates the database with generated data at the given scale."""
     print("Ensuring all tables are created...")
     Base.metadata.create_all(bind=engine)
 
     db: Session = next(get_db_session())
+    sizes = table_sizes(scale)
+    counts = ", ".join(f"{sizes[table]} {table}" for table in tables)
+    print(f"Seeding {counts} with {workers} worker(s)...")
 
-    try:
-        fake = Faker("id_ID")
-        mahasiswa_repo = MahasiswaRepository(session_db=db)
-        mahasiswa_service = MahasiswaService(mahasiswa_repo=mahasiswa_repo)
-
-        num_records_to_generate = 10
-
-        print(
-            f"Generating and seeding {num_records_to_generate} fake Mahasiswa data..."
-        )
-
-        prodi_options = ["TI", "SIB"]
-        current_year_prefix = str(datetime.now().year)[-2:]
+    def report(table: str, inserted: int, total: int) -> None:
+        print(f"  {table}: {inserted}/{total}", end="\r" if inserted < total else "\n")
 
-        for _ in range(num_records_to_generate):
-            nim_suffix = "".join(random.choices("0123456789", k=8))
-            nim = f"{current_year_prefix}{nim_suffix}"
+    started = time.perf_counter()
+    try:
+        inserted = seed_tables(db, scale, tables, workers, seed, progress=report)
+        elapsed = time.perf_counter() - started
+        rows = sum(inserted.values())
+        print(f"Database seeding complete: {rows} rows in {elapsed:.1f} s.")
+    except Exception as e:
+        print(f"An error occurred during seeding: {e}")
+    finally:
+        db.close()
 
-            prodi = random.choice(prodi_options)
-            class_number = random.randint(1, 4)  # 1 ~ 4
-            class_letter = random.choice([chr(ord("A") + i) for i in range(9)])  # A ~ I
-            kelas = f"{prodi}-{class_number}{class_letter}"
 
-            nama = fake.name()
-            tempat_lahir = fake.city()
-            tanggal_lahir = fake.date_of_birth(minimum_age=18, maximum_age=25)
+IMPORTERS = {"mahasiswa": build_mahasiswa_service, "tugas": build_tugas_service}
 
-            data = CreateMahasiswaDto(
-                nim=nim,
-                nama=nama,
-                kelas=kelas,
-                tempat_lahir=tempat_lahir,
-                tanggal_lahir=tanggal_lahir,
-            )
 
-            existing_mahasiswa = mahasiswa_service.read(GetMahasiswaPort(nim=data.nim))
-            if not existing_mahasiswa:
-                mahasiswa_service.create(data)
-                print(f"Created Mahasiswa: {data.nama} (NIM: {data.nim})")
-            else:
-                print(f"Mahasiswa with NIM {data.nim} already exists. Skipping.")
+def import_file(resource: str, path: str, after_line: int = 0):
+    """Imports the rows of the CSV file ``path`` into ``resource``."""
+    db: Session = next(get_db_session())
+    service = IMPORTERS[resource](db)
 
-        print("Database seeding complete!")
+    def report(result: ImportResultDto) -> None:
+        print(
+            f"  line {result.last_line}: {result.created} created, "
+            f"{result.rejected} rejected"
+        )
 
-    except Exception as e:
-        print(f"An error occurred during seeding: {e}")
+    try:
+        with open(path, "rb") as f:
+            result = service.import_rows(csv_rows(f, after_line), progress=report)
+    except ImportInterruptedException as e:
+        print(f"Import stopped after line {e.last_line}: {e.cause.message}")
+        print(
+            f"Resume with: python manage.py import {resource} {path} "
+            f"--after-line {e.last_line}"
+        )
+        return
     finally:
         db.close()
 
+    for error in result.errors:
+        print(f"  line {error.line}: {error.message}")
+    if result.rejected > len(result.errors):
+        print(f"  ... and {result.rejected - len(result.errors)} more rejected rows")
+    print(f"Import complete: {result.created} created, {result.rejected} rejected.")
+
+
+def parse_tables(value: str) -> tuple[str, ...]:
+    if value == "all":
+        return SEED_TABLES
+    tables = tuple(name.strip() for name in value.split(",") if name.strip())
+    unknown = [name for name in tables if name not in SEED_TABLES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown table(s) {', '.join(unknown)}; "
+            f"choose from all, {', '.join(SEED_TABLES)}"
+        )
+    return tables
+
 
 def main():
     parser = argparse.ArgumentParser(description="Manage your P-ToDo-Y project.")
-    parser.add_argument(
-        "command",
-        choices=["seed"],
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser(
+        "seed", help="Populate the database with generated data."
+    )
+    seed_parser.add_argument(
+        "--scale",
+        type=int,
+        default=10,
         help=(
-            "The command to run (e.g., 'seed' to populate the database with "
-            "initial data)."
+            "Number of mahasiswa to generate; the other tables are sized "
+            "relative to it (tugas: 2x, jadwal: 1/5, mata kuliah: 1/10, "
+            "dosen: 1/25)."
         ),
     )
+    seed_parser.add_argument(
+        "--tables",
+        type=parse_tables,
+        default=SEED_TABLES,
+        help="Comma-separated tables to seed, or 'all' (default).",
+    )
+    seed_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes generating rows (default: one per CPU).",
+    )
+    seed_parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed of the generated data."
+    )
+
+    import_parser = commands.add_parser(
+        "import", help="Import the rows of a CSV file."
+    )
+    import_parser.add_argument("resource", choices=sorted(IMPORTERS))
+    import_parser.add_argument(
+        "file", help="CSV file with a header row naming the fields."
+    )
+    import_parser.add_argument(
+        "--after-line",
+        type=int,
+        default=0,
+        help="Skip records up to this file line (to resume an interrupted import).",
+    )
 
     args = parser.parse_args()
 
     if args.command == "seed":
-        seed_database()
+        seed_database(args.scale, args.tables, args.workers, args.seed)
+    elif args.command == "import":
+        import_file(args.resource, args.file, args.after_line)
     else:
         print(f"Unknown command: {args.command}")
         parser.print_help()
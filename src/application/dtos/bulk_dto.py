@@ -0,0 +1,15 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class BulkItemErrorDto(BaseModel):
+    index: int
+    message: str
+
+
+class BulkCreateResultDto(BaseModel, Generic[T]):
+    created: list[T]
+    errors: list[BulkItemErrorDto]
@@ -0,0 +1,18 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class ChangesDto(BaseModel, Generic[T]):
+    """
+    One page of a delta sync: rows created or updated since the token, and
+    the ids of rows that were soft-deleted (tombstones) in the same window.
+    """
+
+    changed: list[T]
+    deleted: list[int]
+    # Pass back as ``since`` to continue; None only when nothing exists yet.
+    next_token: Optional[str]
+    has_more: bool
@@ -0,0 +1,31 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CountDto(BaseModel):
+    """
+    Number of rows matching a list filter. ``exact`` is False when the filter
+    matches more rows than COUNT_EXACT_LIMIT and the number is a planner
+    estimate or a cached count that may lag recent writes.
+    """
+
+    count: int
+    exact: bool
+
+
+class PageDto(BaseModel, Generic[T]):
+    """A list page wrapped together with the total of the filter (include_total)."""
+
+    items: list[T]
+    total: int
+    total_exact: bool
+
+
+class CursorPageDto(BaseModel, Generic[T]):
+    """A list page and the cursor of the page after it (None on the last page)."""
+
+    items: list[T]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class ImportRowErrorDto(BaseModel):
+    line: int
+    message: str
+
+
+class ImportResultDto(BaseModel):
+    """
+    Outcome of a file import. ``last_line`` is the last line of the file whose
+    chunk was committed; an interrupted import resumes after it. ``errors``
+    holds the first IMPORT_MAX_ERRORS of the ``rejected`` rows.
+    """
+
+    created: int = 0
+    rejected: int = 0
+    last_line: int = 0
+    errors: list[ImportRowErrorDto] = []
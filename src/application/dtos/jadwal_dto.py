@@ -1,10 +1,23 @@
 from datetime import time
+from typing import Annotated, Optional
 
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel
+
+from src.application.dtos.bulk_dto import BulkItemErrorDto
+from src.application.dtos.dosen_dto import DosenDto
+from src.application.dtos.mata_kuliah_dto import MataKuliahDto
+
+
+def normalize_hari(value: str) -> str:
+    """Day names are stored capitalized, so "senin " books the same day as "Senin"."""
+    return value.strip().capitalize()
+
+
+Hari = Annotated[str, AfterValidator(normalize_hari)]
 
 
 class CreateJadwalDto(BaseModel):
-    hari: str
+    hari: Hari
     jam_mulai: time
     jam_selesai: time
     ruangan: str
@@ -15,7 +28,7 @@ class CreateJadwalDto(BaseModel):
 
 class UpdateJadwalDto(BaseModel):
     id: int
-    hari: str
+    hari: Hari
     jam_mulai: time
     jam_selesai: time
     ruangan: str
@@ -36,3 +49,29 @@ class JadwalDto(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class JadwalDetailDto(JadwalDto):
+    """JadwalDto with the relations requested through ``expand`` embedded."""
+
+    dosen: Optional[DosenDto] = None
+    mata_kuliah: Optional[MataKuliahDto] = None
+
+
+class JadwalConflictDto(BaseModel):
+    """
+    A proposed slot (``index``) that overlaps, on the same hari, a stored
+    jadwal (``jadwal_id``) or an earlier proposed slot (``other_index``) with
+    the same ``field``: ``ruangan`` or ``dosen_id``.
+    """
+
+    index: int
+    field: str
+    jadwal_id: Optional[int] = None
+    other_index: Optional[int] = None
+    message: str
+
+
+class JadwalConflictsDto(BaseModel):
+    conflicts: list[JadwalConflictDto] = []
+    errors: list[BulkItemErrorDto] = []
@@ -5,6 +5,8 @@ from typing import Optional
 from pydantic import BaseModel
 
 
+from src.application.dtos.mahasiswa_dto import MahasiswaDto
+from src.application.dtos.mata_kuliah_dto import MataKuliahDto
 from src.application.enums import StatusTugas
 
 
@@ -38,3 +40,19 @@ class TugasDto(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TugasDetailDto(TugasDto):
+    """TugasDto with the relations requested through ``expand`` embedded."""
+
+    mahasiswa: Optional[MahasiswaDto] = None
+    mata_kuliah: Optional[MataKuliahDto] = None
+
+
+class TugasListItemDto(TugasDetailDto):
+    """
+    A Tugas as returned by the list endpoint. deskripsi is left out of the
+    list projection unless requested through ``fields``, so it is optional.
+    """
+
+    deskripsi: Optional[str] = None  # type: ignore[assignment]
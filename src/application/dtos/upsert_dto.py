@@ -0,0 +1,20 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+from src.application.dtos.bulk_dto import BulkItemErrorDto
+
+T = TypeVar("T")
+
+
+class UpsertResultDto(BaseModel, Generic[T]):
+    """
+    Outcome of an upsert by natural key: the rows that were inserted, the rows
+    that were changed, and the keys of the rows that already held the sent
+    values and were left untouched.
+    """
+
+    created: list[T] = []
+    updated: list[T] = []
+    unchanged: list[str] = []
+    errors: list[BulkItemErrorDto] = []
@@ -57,6 +57,13 @@ class InvalidInputException(ApplicationException):
         super().__init__(message)
 
 
+class ScheduleConflictException(ApplicationException):
+    """Exception raised when a jadwal would double-book a ruangan or a dosen."""
+
+    def __init__(self, message: str = "The jadwal overlaps an existing jadwal."):
+        super().__init__(message)
+
+
 class UnauthorizedException(ApplicationException):
     """Exception raised when a user is not authorized to perform an action."""
 
@@ -89,3 +96,18 @@ class DatabaseException(RepositoryException):
 
     def __init__(self, message: str = "A database operation failed."):
         super().__init__(message)
+
+
+class ImportInterruptedException(ApplicationException):
+    """
+    Exception raised when a file import stops part-way; the rows up to
+    ``last_line`` were committed and the import can resume after it.
+    """
+
+    def __init__(self, last_line: int, cause: ApplicationException):
+        self.last_line = last_line
+        self.cause = cause
+        super().__init__(
+            f"Import stopped after line {last_line}: {cause.message} "
+            f"Resume with after_line={last_line}."
+        )
@@ -0,0 +1,51 @@
+from collections.abc import Callable, Collection
+from typing import Optional, TypeVar
+
+from src.application.dtos.bulk_dto import BulkItemErrorDto
+from src.application.exceptions import ApplicationException, DuplicateEntryException
+
+D = TypeVar("D")
+
+
+def validate_items(
+    items: list[D], validate: Callable[[D], None], errors: list[BulkItemErrorDto]
+) -> list[tuple[int, D]]:
+    """Runs ``validate`` on every item, recording failures by position."""
+    valid: list[tuple[int, D]] = []
+    for index, item in enumerate(items):
+        try:
+            validate(item)
+        except ApplicationException as e:
+            errors.append(BulkItemErrorDto(index=index, message=e.message))
+            continue
+        valid.append((index, item))
+    return valid
+
+
+def reject_duplicates(
+    items: list[tuple[int, D]],
+    resource_name: str,
+    field_name: str,
+    existing: Collection[str],
+    errors: list[BulkItemErrorDto],
+    field_label: Optional[str] = None,
+) -> list[tuple[int, D]]:
+    """
+    Drops items whose ``field_name`` already exists in the database or appears
+    earlier in the same batch; the first occurrence in the batch wins.
+    """
+    seen = set(existing)
+    accepted: list[tuple[int, D]] = []
+    for index, item in items:
+        value = getattr(item, field_name)
+        if value in seen:
+            error = DuplicateEntryException(
+                resource_name=resource_name,
+                field_name=field_label or field_name,
+                field_value=value,
+            )
+            errors.append(BulkItemErrorDto(index=index, message=error.message))
+            continue
+        seen.add(value)
+        accepted.append((index, item))
+    return accepted
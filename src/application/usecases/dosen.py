@@ -1,16 +1,23 @@
+from collections.abc import Iterator
+
+from src.application.dtos.bulk_dto import BulkCreateResultDto, BulkItemErrorDto
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.dosen_dto import (
     CreateDosenDto,
     DosenDto,
     UpdateDosenDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
 from src.application.exceptions import (
-    DuplicateEntryException,
     InvalidInputException,
     NotFoundException,
 )
+from src.application.usecases.bulk import reject_duplicates, validate_items
 from src.application.usecases.interfaces.dosen_repository import (
     DosenRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.dosen import GetDosenPort
 
 
@@ -18,7 +25,7 @@ class DosenService:
     def __init__(self, dosen_repo: DosenRepositoryInterface):
         self.dosen_repo = dosen_repo
 
-    def create(self, dosen_dto: CreateDosenDto) -> DosenDto:
+    def _validate_create(self, dosen_dto: CreateDosenDto) -> None:
         if not dosen_dto.nidn:
             raise InvalidInputException("NIDN cannot be empty")
         if not dosen_dto.nama:
@@ -26,54 +33,80 @@ class DosenService:
         if not dosen_dto.email:
             raise InvalidInputException("Email cannot be empty")
 
-        existing_dosen = self.dosen_repo.read(GetDosenPort(nidn=dosen_dto.nidn))
-        if existing_dosen:
-            raise DuplicateEntryException(
+    def create(self, dosen_dto: CreateDosenDto) -> DosenDto:
+        self._validate_create(dosen_dto)
+        return self.dosen_repo.create(dosen_dto)
+
+    def bulk_create(
+        self, dosen_dtos: list[CreateDosenDto]
+    ) -> BulkCreateResultDto[DosenDto]:
+        errors: list[BulkItemErrorDto] = []
+        accepted = validate_items(dosen_dtos, self._validate_create, errors)
+        for field_name in ("nidn", "email"):
+            existing = self.dosen_repo.read_existing_values(
+                field_name, [getattr(dosen, field_name) for _, dosen in accepted]
+            )
+            accepted = reject_duplicates(
+                accepted,
                 resource_name="Dosen",
-                field_name="nidn",
-                field_value=dosen_dto.nidn,
+                field_name=field_name,
+                existing=existing,
+                errors=errors,
             )
+        created = self.dosen_repo.bulk_create([item for _, item in accepted])
+        errors.sort(key=lambda error: error.index)
+        return BulkCreateResultDto[DosenDto](created=created, errors=errors)
 
-        existing_email = self.dosen_repo.read(GetDosenPort(email=dosen_dto.email))
-        if existing_email:
-            raise DuplicateEntryException(
+    def upsert(self, dosen_dto: CreateDosenDto) -> tuple[DosenDto, bool]:
+        """
+        Creates or replaces the dosen with ``dosen_dto.nidn``; returns it and
+        whether it was created.
+        """
+        self._validate_create(dosen_dto)
+        result = self.dosen_repo.upsert([dosen_dto])
+        if result.created:
+            return result.created[0], True
+        if result.updated:
+            return result.updated[0], False
+        [unchanged] = self.dosen_repo.read(GetDosenPort(nidn=dosen_dto.nidn))
+        return unchanged, False
+
+    def bulk_upsert(
+        self, dosen_dtos: list[CreateDosenDto]
+    ) -> UpsertResultDto[DosenDto]:
+        errors: list[BulkItemErrorDto] = []
+        accepted = validate_items(dosen_dtos, self._validate_create, errors)
+        # One statement cannot write the same row twice, so repeated keys are
+        # rejected within the batch only.
+        for field_name in ("nidn", "email"):
+            accepted = reject_duplicates(
+                accepted,
                 resource_name="Dosen",
-                field_name="email",
-                field_value=dosen_dto.email,
+                field_name=field_name,
+                existing=(),
+                errors=errors,
             )
+        result = self.dosen_repo.upsert([item for _, item in accepted])
+        errors.sort(key=lambda error: error.index)
+        result.errors = errors
+        return result
 
-        return self.dosen_repo.create(dosen_dto)
+    def read_page(self, get_dosen_port: GetDosenPort) -> CursorPageDto[DosenDto]:
+        return self.dosen_repo.read_page(get_dosen_port)
 
     def read(self, get_dosen_port: GetDosenPort) -> list[DosenDto]:
         return self.dosen_repo.read(get_dosen_port)
 
-    def update(self, dosen_dto: UpdateDosenDto) -> DosenDto:
-        existing_dosen = self.dosen_repo.read(GetDosenPort(id=dosen_dto.id))
-        if not existing_dosen:
-            raise NotFoundException(resource_name="Dosen", identifier=dosen_dto.id)
+    def stream(self, get_dosen_port: GetDosenPort) -> Iterator[DosenDto]:
+        return self.dosen_repo.stream(get_dosen_port)
 
-        # Check if nidn is being changed to one that already exists
-        if dosen_dto.nidn != existing_dosen[0].nidn:
-            duplicate_check = self.dosen_repo.read(GetDosenPort(nidn=dosen_dto.nidn))
-            if duplicate_check:
-                raise DuplicateEntryException(
-                    resource_name="Dosen",
-                    field_name="nidn",
-                    field_value=dosen_dto.nidn,
-                )
+    def count(self, get_dosen_port: GetDosenPort) -> CountDto:
+        return self.dosen_repo.count(get_dosen_port)
 
-        # Check if email is being changed to one that already exists
-        if dosen_dto.email != existing_dosen[0].email:
-            duplicate_check_email = self.dosen_repo.read(
-                GetDosenPort(email=dosen_dto.email)
-            )
-            if duplicate_check_email:
-                raise DuplicateEntryException(
-                    resource_name="Dosen",
-                    field_name="email",
-                    field_value=dosen_dto.email,
-                )
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[DosenDto]:
+        return self.dosen_repo.changes(get_changes_port)
 
+    def update(self, dosen_dto: UpdateDosenDto) -> DosenDto:
         return self.dosen_repo.update(dosen_dto)
 
     def delete(self, dosen_id: int) -> bool:
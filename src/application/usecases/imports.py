@@ -0,0 +1,83 @@
+from collections.abc import Callable, Iterable, Mapping
+from itertools import islice
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from src.application.dtos.bulk_dto import BulkCreateResultDto
+from src.application.dtos.import_dto import ImportResultDto, ImportRowErrorDto
+from src.application.exceptions import (
+    ApplicationException,
+    ImportInterruptedException,
+)
+
+D = TypeVar("D", bound=BaseModel)
+
+# Rows validated and inserted per transaction.
+IMPORT_CHUNK_SIZE = 1000
+# Rejected rows reported individually; the rest are only counted.
+IMPORT_MAX_ERRORS = 1000
+
+ImportRow = tuple[int, Mapping[str, str]]
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def import_rows(
+    rows: Iterable[ImportRow],
+    dto_type: type[D],
+    bulk_create: Callable[[list[D]], BulkCreateResultDto[Any]],
+    progress: Optional[Callable[[ImportResultDto], None]] = None,
+) -> ImportResultDto:
+    """
+    Imports ``(line, row)`` pairs chunk by chunk: each row is validated as
+    ``dto_type`` (empty cells count as missing) and the valid ones of a chunk
+    go through ``bulk_create``, which commits them. Only one chunk is held at
+    a time, and ``progress`` is called with the running result after each.
+    A chunk that cannot be read or written raises ImportInterruptedException.
+    """
+    result = ImportResultDto()
+    iterator = iter(rows)
+    while True:
+        try:
+            chunk = list(islice(iterator, IMPORT_CHUNK_SIZE))
+        except ApplicationException as e:
+            raise ImportInterruptedException(result.last_line, e)
+        if not chunk:
+            break
+        lines: list[int] = []
+        dtos: list[D] = []
+        rejected: list[ImportRowErrorDto] = []
+        for line, row in chunk:
+            values = {key: value for key, value in row.items() if value}
+            try:
+                dtos.append(dto_type.model_validate(values))
+            except ValidationError as e:
+                rejected.append(
+                    ImportRowErrorDto(line=line, message=validation_message(e))
+                )
+                continue
+            lines.append(line)
+
+        if dtos:
+            try:
+                created = bulk_create(dtos)
+            except ApplicationException as e:
+                raise ImportInterruptedException(result.last_line, e)
+            result.created += len(created.created)
+            rejected.extend(
+                ImportRowErrorDto(line=lines[error.index], message=error.message)
+                for error in created.errors
+            )
+        rejected.sort(key=lambda error: error.line)
+        result.rejected += len(rejected)
+        result.errors.extend(rejected[: IMPORT_MAX_ERRORS - len(result.errors)])
+        result.last_line = chunk[-1][0]
+        if progress is not None:
+            progress(result)
+    return result
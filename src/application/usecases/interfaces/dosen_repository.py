@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterator
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.dosen_dto import (
     CreateDosenDto,
     DosenDto,
     UpdateDosenDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
+from src.ports.changes import GetChangesPort
 from src.ports.dosen import GetDosenPort
 
 
@@ -13,10 +18,29 @@ class DosenRepositoryInterface(ABC):
     def create(self, dosen_dto: CreateDosenDto) -> DosenDto:
         pass
 
+    @abstractmethod
+    def read_page(self, get_dosen_port: GetDosenPort) -> CursorPageDto[DosenDto]:
+        """The requested page of rows and the cursor of the page after it."""
+        pass
+
     @abstractmethod
     def read(self, get_dosen_port: GetDosenPort) -> list[DosenDto]:
         pass
 
+    @abstractmethod
+    def stream(self, get_dosen_port: GetDosenPort) -> Iterator[DosenDto]:
+        pass
+
+    @abstractmethod
+    def count(self, get_dosen_port: GetDosenPort) -> CountDto:
+        """Number of rows matching the filters of ``get_dosen_port``."""
+        pass
+
+    @abstractmethod
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[DosenDto]:
+        """Rows changed since ``get_changes_port.since``, soft deletes included."""
+        pass
+
     @abstractmethod
     def update(self, dosen_dto: UpdateDosenDto) -> DosenDto:
         pass
@@ -24,3 +48,22 @@ class DosenRepositoryInterface(ABC):
     @abstractmethod
     def delete(self, dosen_id: int) -> bool:
         pass
+
+    @abstractmethod
+    def bulk_create(self, dosen_dtos: list[CreateDosenDto]) -> list[DosenDto]:
+        pass
+
+    @abstractmethod
+    def upsert(self, dosen_dtos: list[CreateDosenDto]) -> UpsertResultDto[DosenDto]:
+        """
+        Inserts or updates each row by its ``nidn``; rows already holding the
+        sent values are skipped without a write.
+        """
+        pass
+
+    @abstractmethod
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        """Returns which of ``values`` are already stored in ``field_name``."""
+        pass
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import Optional
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.jadwal_dto import (
     CreateJadwalDto,
     JadwalDto,
     UpdateJadwalDto,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.jadwal import GetJadwalPort
 
 
@@ -13,10 +18,29 @@ class JadwalRepositoryInterface(ABC):
     def create(self, jadwal_dto: CreateJadwalDto) -> JadwalDto:
         pass
 
+    @abstractmethod
+    def read_page(self, get_jadwal_port: GetJadwalPort) -> CursorPageDto[JadwalDto]:
+        """The requested page of rows and the cursor of the page after it."""
+        pass
+
     @abstractmethod
     def read(self, get_jadwal_port: GetJadwalPort) -> list[JadwalDto]:
         pass
 
+    @abstractmethod
+    def stream(self, get_jadwal_port: GetJadwalPort) -> Iterator[JadwalDto]:
+        pass
+
+    @abstractmethod
+    def count(self, get_jadwal_port: GetJadwalPort) -> CountDto:
+        """Number of rows matching the filters of ``get_jadwal_port``."""
+        pass
+
+    @abstractmethod
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[JadwalDto]:
+        """Rows changed since ``get_changes_port.since``, soft deletes included."""
+        pass
+
     @abstractmethod
     def update(self, jadwal_dto: UpdateJadwalDto) -> JadwalDto:
         pass
@@ -24,3 +48,20 @@ class JadwalRepositoryInterface(ABC):
     @abstractmethod
     def delete(self, jadwal_id: int) -> bool:
         pass
+
+    @abstractmethod
+    def bulk_create(self, jadwal_dtos: list[CreateJadwalDto]) -> list[JadwalDto]:
+        pass
+
+    @abstractmethod
+    def find_overlaps(
+        self,
+        jadwal_dtos: list[CreateJadwalDto],
+        field_name: str,
+        exclude_id: Optional[int] = None,
+    ) -> list[tuple[int, JadwalDto]]:
+        """
+        ``(position, jadwal)`` for every active jadwal that shares ``field_name``
+        and hari with ``jadwal_dtos[position]`` and overlaps its time range.
+        """
+        pass
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterator
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.mahasiswa_dto import (
     CreateMahasiswaDto,
     MahasiswaDto,
     UpdateMahasiswaDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
+from src.ports.changes import GetChangesPort
 from src.ports.mahasiswa import GetMahasiswaPort
 
 
@@ -13,10 +18,30 @@ class MahasiswaRepositoryInterface(ABC):
     def create(self, mahasiswa_dto: CreateMahasiswaDto) -> MahasiswaDto:
         raise NotImplementedError("Subclasses must implement create method")
 
+    @abstractmethod
+    def read_page(
+        self, get_mahasiswa_port: GetMahasiswaPort
+    ) -> CursorPageDto[MahasiswaDto]:
+        """The requested page of rows and the cursor of the page after it."""
+        raise NotImplementedError("Subclasses must implement read_page method")
+
     @abstractmethod
     def read(self, get_mahasiswa_port: GetMahasiswaPort) -> list[MahasiswaDto]:
         raise NotImplementedError("Subclasses must implement read method")
 
+    @abstractmethod
+    def stream(self, get_mahasiswa_port: GetMahasiswaPort) -> Iterator[MahasiswaDto]:
+        raise NotImplementedError("Subclasses must implement stream method")
+
+    @abstractmethod
+    def count(self, get_mahasiswa_port: GetMahasiswaPort) -> CountDto:
+        """Number of rows matching the filters of ``get_mahasiswa_port``."""
+        pass
+
+    @abstractmethod
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[MahasiswaDto]:
+        raise NotImplementedError("Subclasses must implement changes method")
+
     @abstractmethod
     def update(self, mahasiswa_dto: UpdateMahasiswaDto) -> MahasiswaDto:
         raise NotImplementedError("Subclasses must implement update method")
@@ -24,3 +49,28 @@ class MahasiswaRepositoryInterface(ABC):
     @abstractmethod
     def delete(self, mahasiswa_id: int) -> bool:
         raise NotImplementedError("Subclasses must implement delete method")
+
+    @abstractmethod
+    def bulk_create(
+        self, mahasiswa_dtos: list[CreateMahasiswaDto]
+    ) -> list[MahasiswaDto]:
+        raise NotImplementedError("Subclasses must implement bulk_create method")
+
+    @abstractmethod
+    def upsert(
+        self, mahasiswa_dtos: list[CreateMahasiswaDto]
+    ) -> UpsertResultDto[MahasiswaDto]:
+        """
+        Inserts or updates each row by its ``nim``; rows already holding the
+        sent values are skipped without a write.
+        """
+        raise NotImplementedError("Subclasses must implement upsert method")
+
+    @abstractmethod
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        """Returns which of ``values`` are already stored in ``field_name``."""
+        raise NotImplementedError(
+            "Subclasses must implement read_existing_values method"
+        )
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterator
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.mata_kuliah_dto import (
     CreateMataKuliahDto,
     MataKuliahDto,
     UpdateMataKuliahDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
+from src.ports.changes import GetChangesPort
 from src.ports.mata_kuliah import GetMataKuliahPort
 
 
@@ -13,10 +18,33 @@ class MataKuliahRepositoryInterface(ABC):
     def create(self, mata_kuliah_dto: CreateMataKuliahDto) -> MataKuliahDto:
         pass
 
+    @abstractmethod
+    def read_page(
+        self, get_mata_kuliah_port: GetMataKuliahPort
+    ) -> CursorPageDto[MataKuliahDto]:
+        """The requested page of rows and the cursor of the page after it."""
+        pass
+
     @abstractmethod
     def read(self, get_mata_kuliah_port: GetMataKuliahPort) -> list[MataKuliahDto]:
         pass
 
+    @abstractmethod
+    def stream(
+        self, get_mata_kuliah_port: GetMataKuliahPort
+    ) -> Iterator[MataKuliahDto]:
+        pass
+
+    @abstractmethod
+    def count(self, get_mata_kuliah_port: GetMataKuliahPort) -> CountDto:
+        """Number of rows matching the filters of ``get_mata_kuliah_port``."""
+        pass
+
+    @abstractmethod
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[MataKuliahDto]:
+        """Rows changed since ``get_changes_port.since``, soft deletes included."""
+        pass
+
     @abstractmethod
     def update(self, mata_kuliah_dto: UpdateMataKuliahDto) -> MataKuliahDto:
         pass
@@ -24,3 +52,26 @@ class MataKuliahRepositoryInterface(ABC):
     @abstractmethod
     def delete(self, mata_kuliah_id: int) -> bool:
         pass
+
+    @abstractmethod
+    def bulk_create(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> list[MataKuliahDto]:
+        pass
+
+    @abstractmethod
+    def upsert(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> UpsertResultDto[MataKuliahDto]:
+        """
+        Inserts or updates each row by its ``kode_mk``; rows already holding the
+        sent values are skipped without a write.
+        """
+        pass
+
+    @abstractmethod
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        """Returns which of ``values`` are already stored in ``field_name``."""
+        pass
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.tugas_dto import (
     CreateTugasDto,
     TugasDto,
     UpdateTugasDto,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.tugas import GetTugasPort
 
 
@@ -13,10 +17,29 @@ class TugasRepositoryInterface(ABC):
     def create(self, tugas_dto: CreateTugasDto) -> TugasDto:
         pass
 
+    @abstractmethod
+    def read_page(self, get_tugas_port: GetTugasPort) -> CursorPageDto[TugasDto]:
+        """The requested page of rows and the cursor of the page after it."""
+        pass
+
     @abstractmethod
     def read(self, get_tugas_port: GetTugasPort) -> list[TugasDto]:
         pass
 
+    @abstractmethod
+    def stream(self, get_tugas_port: GetTugasPort) -> Iterator[TugasDto]:
+        pass
+
+    @abstractmethod
+    def count(self, get_tugas_port: GetTugasPort) -> CountDto:
+        """Number of rows matching the filters of ``get_tugas_port``."""
+        pass
+
+    @abstractmethod
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[TugasDto]:
+        """Rows changed since ``get_changes_port.since``, soft deletes included."""
+        pass
+
     @abstractmethod
     def update(self, tugas_dto: UpdateTugasDto) -> TugasDto:
         pass
@@ -24,3 +47,7 @@ class TugasRepositoryInterface(ABC):
     @abstractmethod
     def delete(self, tugas_id: int) -> bool:
         pass
+
+    @abstractmethod
+    def bulk_create(self, tugas_dtos: list[CreateTugasDto]) -> list[TugasDto]:
+        pass
@@ -1,23 +1,84 @@
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from src.application.dtos.bulk_dto import BulkCreateResultDto, BulkItemErrorDto
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.jadwal_dto import (
     CreateJadwalDto,
+    JadwalConflictDto,
+    JadwalConflictsDto,
     JadwalDto,
     UpdateJadwalDto,
 )
 from src.application.exceptions import (
     InvalidInputException,
     NotFoundException,
+    ScheduleConflictException,
 )
+from src.application.usecases.bulk import validate_items
 from src.application.usecases.interfaces.jadwal_repository import (
     JadwalRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.jadwal import GetJadwalPort
 
+# Resources a jadwal books for its time range on its hari, with their labels.
+BOOKED_FIELDS = {"ruangan": "Ruangan", "dosen_id": "Dosen"}
+
+Slot = tuple[int, CreateJadwalDto]
+
+
+def _conflict_message(
+    field_name: str, slot: CreateJadwalDto, booked: Any, booked_by: str
+) -> str:
+    return (
+        f"{BOOKED_FIELDS[field_name]} {getattr(slot, field_name)} is already "
+        f"booked on {booked.hari} {booked.jam_mulai:%H:%M}-"
+        f"{booked.jam_selesai:%H:%M} by {booked_by}."
+    )
+
+
+def _batch_conflicts(slots: list[Slot]) -> list[JadwalConflictDto]:
+    """
+    Overlaps between the active ``slots`` themselves, each reported on the
+    slot that comes later in the input.
+    """
+    conflicts: list[JadwalConflictDto] = []
+    for field_name in BOOKED_FIELDS:
+        groups: dict[tuple[str, Any], list[Slot]] = defaultdict(list)
+        for index, slot in slots:
+            if slot.is_active:
+                groups[(slot.hari, getattr(slot, field_name))].append((index, slot))
+        for group in groups.values():
+            group.sort(key=lambda item: item[1].jam_mulai)
+            running: list[Slot] = []
+            for current in group:
+                # Sorted by start, so every earlier slot still running overlaps.
+                start = current[1].jam_mulai
+                running = [item for item in running if item[1].jam_selesai > start]
+                for item in running:
+                    earlier, later = sorted([item, current], key=lambda pair: pair[0])
+                    conflicts.append(
+                        JadwalConflictDto(
+                            index=later[0],
+                            field=field_name,
+                            other_index=earlier[0],
+                            message=_conflict_message(
+                                field_name, later[1], earlier[1], f"slot {earlier[0]}"
+                            ),
+                        )
+                    )
+                running.append(current)
+    return conflicts
+
 
 class JadwalService:
     def __init__(self, jadwal_repo: JadwalRepositoryInterface):
         self.jadwal_repo = jadwal_repo
 
-    def create(self, jadwal_dto: CreateJadwalDto) -> JadwalDto:
+    def _validate_create(self, jadwal_dto: CreateJadwalDto) -> None:
         if not jadwal_dto.hari:
             raise InvalidInputException("Hari cannot be empty")
         if not jadwal_dto.ruangan:
@@ -25,6 +86,43 @@ class JadwalService:
         if jadwal_dto.jam_mulai >= jadwal_dto.jam_selesai:
             raise InvalidInputException("Jam mulai must be before jam selesai")
 
+    def _stored_conflicts(
+        self, slots: list[Slot], exclude_id: Optional[int] = None
+    ) -> list[JadwalConflictDto]:
+        """Overlaps between the active ``slots`` and the stored active jadwal."""
+        active = [(index, slot) for index, slot in slots if slot.is_active]
+        conflicts: list[JadwalConflictDto] = []
+        if not active:
+            return conflicts
+        for field_name in BOOKED_FIELDS:
+            overlaps = self.jadwal_repo.find_overlaps(
+                [slot for _, slot in active], field_name, exclude_id
+            )
+            for position, jadwal in overlaps:
+                index, slot = active[position]
+                conflicts.append(
+                    JadwalConflictDto(
+                        index=index,
+                        field=field_name,
+                        jadwal_id=jadwal.id,
+                        message=_conflict_message(
+                            field_name, slot, jadwal, f"jadwal {jadwal.id}"
+                        ),
+                    )
+                )
+        return conflicts
+
+    def _check_bookings(
+        self, jadwal_dto: CreateJadwalDto, exclude_id: Optional[int] = None
+    ) -> None:
+        conflicts = self._stored_conflicts([(0, jadwal_dto)], exclude_id)
+        if conflicts:
+            raise ScheduleConflictException(conflicts[0].message)
+
+    def create(self, jadwal_dto: CreateJadwalDto) -> JadwalDto:
+        self._validate_create(jadwal_dto)
+        self._check_bookings(jadwal_dto)
+
         # TODO: Validate mata_kuliah_id and dosen_id existence
         # (can be done via repo or separate service call)
         # For now, we rely on foreign key constraints in the database
@@ -32,16 +130,59 @@ class JadwalService:
 
         return self.jadwal_repo.create(jadwal_dto)
 
+    def bulk_create(
+        self, jadwal_dtos: list[CreateJadwalDto]
+    ) -> BulkCreateResultDto[JadwalDto]:
+        errors: list[BulkItemErrorDto] = []
+        accepted = validate_items(jadwal_dtos, self._validate_create, errors)
+        # Slots overlapping a stored jadwal go first, then those overlapping
+        # an earlier remaining slot of the batch.
+        for find_conflicts in (self._stored_conflicts, _batch_conflicts):
+            rejected: dict[int, str] = {}
+            for conflict in find_conflicts(accepted):
+                rejected.setdefault(conflict.index, conflict.message)
+            errors.extend(
+                BulkItemErrorDto(index=index, message=message)
+                for index, message in rejected.items()
+            )
+            accepted = [item for item in accepted if item[0] not in rejected]
+        created = self.jadwal_repo.bulk_create([item for _, item in accepted])
+        errors.sort(key=lambda error: error.index)
+        return BulkCreateResultDto[JadwalDto](created=created, errors=errors)
+
+    def check_conflicts(self, jadwal_dtos: list[CreateJadwalDto]) -> JadwalConflictsDto:
+        """
+        Validates a proposed timetable: every slot that is invalid, that
+        double-books a ruangan or a dosen held by a stored jadwal, or that
+        overlaps another slot of the timetable. Nothing is written.
+        """
+        errors: list[BulkItemErrorDto] = []
+        accepted = validate_items(jadwal_dtos, self._validate_create, errors)
+        conflicts = self._stored_conflicts(accepted) + _batch_conflicts(accepted)
+        conflicts.sort(key=lambda conflict: conflict.index)
+        return JadwalConflictsDto(conflicts=conflicts, errors=errors)
+
+    def read_page(self, get_jadwal_port: GetJadwalPort) -> CursorPageDto[JadwalDto]:
+        return self.jadwal_repo.read_page(get_jadwal_port)
+
     def read(self, get_jadwal_port: GetJadwalPort) -> list[JadwalDto]:
         return self.jadwal_repo.read(get_jadwal_port)
 
-    def update(self, jadwal_dto: UpdateJadwalDto) -> JadwalDto:
-        existing_jadwal = self.jadwal_repo.read(GetJadwalPort(id=jadwal_dto.id))
-        if not existing_jadwal:
-            raise NotFoundException(resource_name="Jadwal", identifier=jadwal_dto.id)
+    def stream(self, get_jadwal_port: GetJadwalPort) -> Iterator[JadwalDto]:
+        return self.jadwal_repo.stream(get_jadwal_port)
+
+    def count(self, get_jadwal_port: GetJadwalPort) -> CountDto:
+        return self.jadwal_repo.count(get_jadwal_port)
 
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[JadwalDto]:
+        return self.jadwal_repo.changes(get_changes_port)
+
+    def update(self, jadwal_dto: UpdateJadwalDto) -> JadwalDto:
         if jadwal_dto.jam_mulai >= jadwal_dto.jam_selesai:
             raise InvalidInputException("Jam mulai must be before jam selesai")
+        self._check_bookings(
+            CreateJadwalDto(**jadwal_dto.model_dump(exclude={"id"})), jadwal_dto.id
+        )
 
         return self.jadwal_repo.update(jadwal_dto)
 
@@ -1,12 +1,22 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Optional
+
+from src.application.dtos.bulk_dto import BulkCreateResultDto, BulkItemErrorDto
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
+from src.application.dtos.import_dto import ImportResultDto
 from src.application.dtos.mahasiswa_dto import (
     CreateMahasiswaDto,
     MahasiswaDto,
     UpdateMahasiswaDto,
 )
-from src.application.exceptions import DuplicateEntryException
+from src.application.dtos.upsert_dto import UpsertResultDto
+from src.application.usecases.bulk import reject_duplicates
+from src.application.usecases.imports import ImportRow, import_rows
 from src.application.usecases.interfaces.mahasiswa_repository import (
     MahasiswaRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.mahasiswa import GetMahasiswaPort
 
 
@@ -15,18 +25,82 @@ class MahasiswaService:
         self.mahasiswa_repo: MahasiswaRepositoryInterface = mahasiswa_repo
 
     def create(self, mahasiswa: CreateMahasiswaDto) -> MahasiswaDto:
-        existing_mahasiswa = self.mahasiswa_repo.read(
-            GetMahasiswaPort(nim=mahasiswa.nim)
-        )
-        if existing_mahasiswa:
-            raise DuplicateEntryException(
-                resource_name="Mahasiswa", field_name="NIM", field_value=mahasiswa.nim
-            )
         return self.mahasiswa_repo.create(mahasiswa)
 
+    def bulk_create(
+        self, mahasiswa_dtos: list[CreateMahasiswaDto]
+    ) -> BulkCreateResultDto[MahasiswaDto]:
+        errors: list[BulkItemErrorDto] = []
+        existing_nims = self.mahasiswa_repo.read_existing_values(
+            "nim", [mahasiswa.nim for mahasiswa in mahasiswa_dtos]
+        )
+        accepted = reject_duplicates(
+            list(enumerate(mahasiswa_dtos)),
+            resource_name="Mahasiswa",
+            field_name="nim",
+            existing=existing_nims,
+            errors=errors,
+            field_label="NIM",
+        )
+        created = self.mahasiswa_repo.bulk_create([item for _, item in accepted])
+        return BulkCreateResultDto[MahasiswaDto](created=created, errors=errors)
+
+    def upsert(self, mahasiswa: CreateMahasiswaDto) -> tuple[MahasiswaDto, bool]:
+        """
+        Creates or replaces the mahasiswa with ``mahasiswa.nim``; returns it and
+        whether it was created.
+        """
+        result = self.mahasiswa_repo.upsert([mahasiswa])
+        if result.created:
+            return result.created[0], True
+        if result.updated:
+            return result.updated[0], False
+        [unchanged] = self.mahasiswa_repo.read(GetMahasiswaPort(nim=mahasiswa.nim))
+        return unchanged, False
+
+    def bulk_upsert(
+        self, mahasiswa_dtos: list[CreateMahasiswaDto]
+    ) -> UpsertResultDto[MahasiswaDto]:
+        errors: list[BulkItemErrorDto] = []
+        # One statement cannot write the same row twice, so repeated NIMs are
+        # rejected within the batch only.
+        accepted = reject_duplicates(
+            list(enumerate(mahasiswa_dtos)),
+            resource_name="Mahasiswa",
+            field_name="nim",
+            existing=(),
+            errors=errors,
+            field_label="NIM",
+        )
+        result = self.mahasiswa_repo.upsert([item for _, item in accepted])
+        errors.sort(key=lambda error: error.index)
+        result.errors = errors
+        return result
+
+    def import_rows(
+        self,
+        rows: Iterable[ImportRow],
+        progress: Optional[Callable[[ImportResultDto], None]] = None,
+    ) -> ImportResultDto:
+        return import_rows(rows, CreateMahasiswaDto, self.bulk_create, progress)
+
+    def read_page(
+        self, get_mahasiswa_port: GetMahasiswaPort
+    ) -> CursorPageDto[MahasiswaDto]:
+        return self.mahasiswa_repo.read_page(get_mahasiswa_port)
+
     def read(self, get_mahasiswa_port: GetMahasiswaPort) -> list[MahasiswaDto]:
         return self.mahasiswa_repo.read(get_mahasiswa_port)
 
+    def stream(self, get_mahasiswa_port: GetMahasiswaPort) -> Iterator[MahasiswaDto]:
+        return self.mahasiswa_repo.stream(get_mahasiswa_port)
+
+    def count(self, get_mahasiswa_port: GetMahasiswaPort) -> CountDto:
+        return self.mahasiswa_repo.count(get_mahasiswa_port)
+
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[MahasiswaDto]:
+        return self.mahasiswa_repo.changes(get_changes_port)
+
     def update(self, mahasiswa: UpdateMahasiswaDto) -> MahasiswaDto:
         return self.mahasiswa_repo.update(mahasiswa)
 
@@ -1,16 +1,23 @@
+from collections.abc import Iterator
+
+from src.application.dtos.bulk_dto import BulkCreateResultDto, BulkItemErrorDto
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.mata_kuliah_dto import (
     CreateMataKuliahDto,
     MataKuliahDto,
     UpdateMataKuliahDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
 from src.application.exceptions import (
-    DuplicateEntryException,
     InvalidInputException,
     NotFoundException,
 )
+from src.application.usecases.bulk import reject_duplicates, validate_items
 from src.application.usecases.interfaces.mata_kuliah_repository import (
     MataKuliahRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.mata_kuliah import GetMataKuliahPort
 
 
@@ -18,7 +25,7 @@ class MataKuliahService:
     def __init__(self, mata_kuliah_repo: MataKuliahRepositoryInterface):
         self.mata_kuliah_repo = mata_kuliah_repo
 
-    def create(self, mata_kuliah_dto: CreateMataKuliahDto) -> MataKuliahDto:
+    def _validate_create(self, mata_kuliah_dto: CreateMataKuliahDto) -> None:
         if not mata_kuliah_dto.kode_mk:
             raise InvalidInputException("Kode MK cannot be empty")
         if not mata_kuliah_dto.nama_mk:
@@ -26,42 +33,86 @@ class MataKuliahService:
         if mata_kuliah_dto.sks <= 0:
             raise InvalidInputException("SKS must be greater than 0")
 
-        existing_mk = self.mata_kuliah_repo.read(
+    def create(self, mata_kuliah_dto: CreateMataKuliahDto) -> MataKuliahDto:
+        self._validate_create(mata_kuliah_dto)
+        return self.mata_kuliah_repo.create(mata_kuliah_dto)
+
+    def bulk_create(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> BulkCreateResultDto[MataKuliahDto]:
+        errors: list[BulkItemErrorDto] = []
+        accepted = validate_items(mata_kuliah_dtos, self._validate_create, errors)
+        existing = self.mata_kuliah_repo.read_existing_values(
+            "kode_mk", [mata_kuliah.kode_mk for _, mata_kuliah in accepted]
+        )
+        accepted = reject_duplicates(
+            accepted,
+            resource_name="Mata Kuliah",
+            field_name="kode_mk",
+            existing=existing,
+            errors=errors,
+        )
+        created = self.mata_kuliah_repo.bulk_create([item for _, item in accepted])
+        errors.sort(key=lambda error: error.index)
+        return BulkCreateResultDto[MataKuliahDto](created=created, errors=errors)
+
+    def upsert(
+        self, mata_kuliah_dto: CreateMataKuliahDto
+    ) -> tuple[MataKuliahDto, bool]:
+        """
+        Creates or replaces the mata kuliah with ``mata_kuliah_dto.kode_mk``;
+        returns it and whether it was created.
+        """
+        self._validate_create(mata_kuliah_dto)
+        result = self.mata_kuliah_repo.upsert([mata_kuliah_dto])
+        if result.created:
+            return result.created[0], True
+        if result.updated:
+            return result.updated[0], False
+        [unchanged] = self.mata_kuliah_repo.read(
             GetMataKuliahPort(kode_mk=mata_kuliah_dto.kode_mk)
         )
-        if existing_mk:
-            raise DuplicateEntryException(
-                resource_name="Mata Kuliah",
-                field_name="kode_mk",
-                field_value=mata_kuliah_dto.kode_mk,
-            )
+        return unchanged, False
 
-        return self.mata_kuliah_repo.create(mata_kuliah_dto)
+    def bulk_upsert(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> UpsertResultDto[MataKuliahDto]:
+        errors: list[BulkItemErrorDto] = []
+        accepted = validate_items(mata_kuliah_dtos, self._validate_create, errors)
+        # One statement cannot write the same row twice, so repeated codes are
+        # rejected within the batch only.
+        accepted = reject_duplicates(
+            accepted,
+            resource_name="Mata Kuliah",
+            field_name="kode_mk",
+            existing=(),
+            errors=errors,
+        )
+        result = self.mata_kuliah_repo.upsert([item for _, item in accepted])
+        errors.sort(key=lambda error: error.index)
+        result.errors = errors
+        return result
+
+    def read_page(
+        self, get_mata_kuliah_port: GetMataKuliahPort
+    ) -> CursorPageDto[MataKuliahDto]:
+        return self.mata_kuliah_repo.read_page(get_mata_kuliah_port)
 
     def read(self, get_mata_kuliah_port: GetMataKuliahPort) -> list[MataKuliahDto]:
         return self.mata_kuliah_repo.read(get_mata_kuliah_port)
 
-    def update(self, mata_kuliah_dto: UpdateMataKuliahDto) -> MataKuliahDto:
-        existing_mk = self.mata_kuliah_repo.read(
-            GetMataKuliahPort(id=mata_kuliah_dto.id)
-        )
-        if not existing_mk:
-            raise NotFoundException(
-                resource_name="Mata Kuliah", identifier=mata_kuliah_dto.id
-            )
+    def stream(
+        self, get_mata_kuliah_port: GetMataKuliahPort
+    ) -> Iterator[MataKuliahDto]:
+        return self.mata_kuliah_repo.stream(get_mata_kuliah_port)
 
-        # Check if kode_mk is being changed to one that already exists
-        if mata_kuliah_dto.kode_mk != existing_mk[0].kode_mk:
-            duplicate_check = self.mata_kuliah_repo.read(
-                GetMataKuliahPort(kode_mk=mata_kuliah_dto.kode_mk)
-            )
-            if duplicate_check:
-                raise DuplicateEntryException(
-                    resource_name="Mata Kuliah",
-                    field_name="kode_mk",
-                    field_value=mata_kuliah_dto.kode_mk,
-                )
+    def count(self, get_mata_kuliah_port: GetMataKuliahPort) -> CountDto:
+        return self.mata_kuliah_repo.count(get_mata_kuliah_port)
 
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[MataKuliahDto]:
+        return self.mata_kuliah_repo.changes(get_changes_port)
+
+    def update(self, mata_kuliah_dto: UpdateMataKuliahDto) -> MataKuliahDto:
         return self.mata_kuliah_repo.update(mata_kuliah_dto)
 
     def delete(self, mata_kuliah_id: int) -> bool:
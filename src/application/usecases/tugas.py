@@ -1,3 +1,10 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Optional
+
+from src.application.dtos.bulk_dto import BulkCreateResultDto, BulkItemErrorDto
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
+from src.application.dtos.import_dto import ImportResultDto
 from src.application.dtos.tugas_dto import (
     CreateTugasDto,
     TugasDto,
@@ -7,9 +14,12 @@ from src.application.exceptions import (
     InvalidInputException,
     NotFoundException,
 )
+from src.application.usecases.bulk import validate_items
+from src.application.usecases.imports import ImportRow, import_rows
 from src.application.usecases.interfaces.tugas_repository import (
     TugasRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.tugas import GetTugasPort
 
 
@@ -17,22 +27,48 @@ class TugasService:
     def __init__(self, tugas_repo: TugasRepositoryInterface):
         self.tugas_repo = tugas_repo
 
-    def create(self, tugas_dto: CreateTugasDto) -> TugasDto:
+    def _validate_create(self, tugas_dto: CreateTugasDto) -> None:
         if not tugas_dto.judul:
             raise InvalidInputException("Judul cannot be empty")
 
+    def create(self, tugas_dto: CreateTugasDto) -> TugasDto:
+        self._validate_create(tugas_dto)
+
         # Basic validation, more complex logic can be added here
 
         return self.tugas_repo.create(tugas_dto)
 
+    def bulk_create(
+        self, tugas_dtos: list[CreateTugasDto]
+    ) -> BulkCreateResultDto[TugasDto]:
+        errors: list[BulkItemErrorDto] = []
+        accepted = validate_items(tugas_dtos, self._validate_create, errors)
+        created = self.tugas_repo.bulk_create([item for _, item in accepted])
+        return BulkCreateResultDto[TugasDto](created=created, errors=errors)
+
+    def import_rows(
+        self,
+        rows: Iterable[ImportRow],
+        progress: Optional[Callable[[ImportResultDto], None]] = None,
+    ) -> ImportResultDto:
+        return import_rows(rows, CreateTugasDto, self.bulk_create, progress)
+
+    def read_page(self, get_tugas_port: GetTugasPort) -> CursorPageDto[TugasDto]:
+        return self.tugas_repo.read_page(get_tugas_port)
+
     def read(self, get_tugas_port: GetTugasPort) -> list[TugasDto]:
         return self.tugas_repo.read(get_tugas_port)
 
-    def update(self, tugas_dto: UpdateTugasDto) -> TugasDto:
-        existing_tugas = self.tugas_repo.read(GetTugasPort(id=tugas_dto.id))
-        if not existing_tugas:
-            raise NotFoundException(resource_name="Tugas", identifier=tugas_dto.id)
+    def stream(self, get_tugas_port: GetTugasPort) -> Iterator[TugasDto]:
+        return self.tugas_repo.stream(get_tugas_port)
 
+    def count(self, get_tugas_port: GetTugasPort) -> CountDto:
+        return self.tugas_repo.count(get_tugas_port)
+
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[TugasDto]:
+        return self.tugas_repo.changes(get_changes_port)
+
+    def update(self, tugas_dto: UpdateTugasDto) -> TugasDto:
         return self.tugas_repo.update(tugas_dto)
 
     def delete(self, tugas_id: int) -> bool:
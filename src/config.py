@@ -12,3 +12,82 @@ class Config:
             load_dotenv()  # Load from default .env location
 
         self.DATABASE_URL: Final[str] = os.getenv("DB_URL", "sqlite:///./mahasiswa.db")
+        # "sync" serves requests with blocking sessions in Starlette's threadpool,
+        # "async" uses an AsyncEngine (aiosqlite/asyncpg) on the event loop.
+        self.DB_MODE: Final[str] = os.getenv("DB_MODE", "sync").lower()
+        self.ASYNC_DATABASE_URL: Final[str] = os.getenv(
+            "DB_ASYNC_URL", to_async_url(self.DATABASE_URL)
+        )
+
+        self.LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO").upper()
+
+        # Connection pool (server databases such as PostgreSQL).
+        self.DB_POOL_SIZE: Final[int] = int(os.getenv("DB_POOL_SIZE", "10"))
+        self.DB_MAX_OVERFLOW: Final[int] = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+        self.DB_POOL_TIMEOUT: Final[int] = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.DB_POOL_RECYCLE: Final[int] = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        self.DB_POOL_PRE_PING: Final[bool] = env_flag("DB_POOL_PRE_PING", True)
+
+        # PRAGMAs applied to every new SQLite connection.
+        self.SQLITE_JOURNAL_MODE: Final[str] = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+        self.SQLITE_SYNCHRONOUS: Final[str] = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+        self.SQLITE_BUSY_TIMEOUT_MS: Final[int] = int(
+            os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")
+        )
+        # Negative cache_size is in KiB: -65536 is a 64 MiB page cache.
+        self.SQLITE_CACHE_SIZE: Final[int] = int(
+            os.getenv("SQLITE_CACHE_SIZE", "-65536")
+        )
+        self.SQLITE_MMAP_SIZE: Final[int] = int(
+            os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))
+        )
+
+        # In-process read cache for reference data (mata kuliah, dosen);
+        # CACHE_TTL_SECONDS=0 disables it.
+        self.CACHE_TTL_SECONDS: Final[float] = float(
+            os.getenv("CACHE_TTL_SECONDS", "60")
+        )
+        self.CACHE_MAX_ENTRIES: Final[int] = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+
+        # /count and include_total count exactly up to this many matching rows;
+        # larger totals are estimated (PostgreSQL) or cached. 0 always counts.
+        self.COUNT_EXACT_LIMIT: Final[int] = int(
+            os.getenv("COUNT_EXACT_LIMIT", "10000")
+        )
+
+        # /changes withholds rows updated less than this long ago. updated_at is
+        # stamped before commit, so a transaction that stamps earlier but
+        # commits later than another would otherwise land behind a sync token
+        # already handed out; writes must commit within the lag.
+        self.CHANGES_SAFETY_LAG_SECONDS: Final[float] = float(
+            os.getenv("CHANGES_SAFETY_LAG_SECONDS", "5")
+        )
+
+        # Warn when one request runs the same SQL statement more than this
+        # many times (the usual sign of an N+1 query); 0 disables the check.
+        self.SQL_REPEAT_WARN_THRESHOLD: Final[int] = int(
+            os.getenv("SQL_REPEAT_WARN_THRESHOLD", "10")
+        )
+
+    @property
+    def is_async(self) -> bool:
+        return self.DB_MODE == "async"
+
+
+def env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def to_async_url(url: str) -> str:
+    """Maps a sync DB_URL onto the matching async driver."""
+    for sync_prefix, async_prefix in (
+        ("sqlite://", "sqlite+aiosqlite://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+    ):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix) :]
+    return url
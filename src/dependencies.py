@@ -1,52 +1,167 @@
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Concatenate, Generic, ParamSpec, TypeVar
+
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.repositories.database.core import (
+    AsyncSessionRunner,
+    SessionRunner,
+    ThreadpoolSessionRunner,
+    config,
+    get_async_db_session,
+    get_db_session,
+)
+from src.repositories.database.streaming import STREAM_BATCH_SIZE
+
+ServiceT = TypeVar("ServiceT")
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class AsyncService(Generic[ServiceT]):
+    """
+    Awaitable facade over one of the synchronous services.
+
+    ``await facade.call(Service.create, dto)`` builds the service (and its
+    repository) on the request's session and runs the method through the
+    configured SessionRunner, so the business rules stay in a single
+    implementation for both DB modes. The method is passed unbound, which
+    keeps its argument and return types visible to the type checker.
+    """
+
+    def __init__(self, runner: SessionRunner, build: Callable[[Session], ServiceT]):
+        self._runner = runner
+        self._build = build
+
+    async def call(
+        self,
+        method: Callable[Concatenate[ServiceT, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return await self._runner.run(
+            lambda session: method(self._build(session), *args, **kwargs)
+        )
+
+    def stream(
+        self,
+        method: Callable[Concatenate[ServiceT, P], Iterator[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[list[R]]:
+        """Batches of the items yielded by the service's streaming ``method``."""
+        return self._runner.stream(
+            lambda session: method(self._build(session), *args, **kwargs),
+            batch_size=STREAM_BATCH_SIZE,
+        )
+
+
+async def get_sync_session_runner(
+    db: Session = Depends(get_db_session),
+) -> SessionRunner:
+    return ThreadpoolSessionRunner(db)
+
+
+async def get_async_session_runner(
+    db: AsyncSession = Depends(get_async_db_session),
+) -> SessionRunner:
+    return AsyncSessionRunner(db)
+
+
+get_session_runner = (
+    get_async_session_runner if config.is_async else get_sync_session_runner
+)
+
+
 from src.application.usecases.mahasiswa import MahasiswaService
-from src.repositories.database.core import get_db_session
 from src.repositories.database.mahasiswa import MahasiswaRepository
 
 
-def get_mahasiswa_service(db: Session = Depends(get_db_session)) -> MahasiswaService:
+def build_mahasiswa_service(db: Session) -> MahasiswaService:
     repository = MahasiswaRepository(session_db=db)
     service = MahasiswaService(mahasiswa_repo=repository)
     return service
 
 
+async def get_mahasiswa_service(
+    runner: SessionRunner = Depends(get_session_runner),
+) -> AsyncService[MahasiswaService]:
+    return AsyncService(runner, build_mahasiswa_service)
+
+
+from src.application.usecases.interfaces.mata_kuliah_repository import (
+    MataKuliahRepositoryInterface,
+)
 from src.application.usecases.mata_kuliah import MataKuliahService
+from src.repositories.cache import CachedMataKuliahRepository, cache_enabled
 from src.repositories.database.mata_kuliah import MataKuliahRepository
 
 
-def get_mata_kuliah_service(db: Session = Depends(get_db_session)) -> MataKuliahService:
-    repository = MataKuliahRepository(session_db=db)
+def build_mata_kuliah_service(db: Session) -> MataKuliahService:
+    repository: MataKuliahRepositoryInterface = MataKuliahRepository(session_db=db)
+    if cache_enabled():
+        repository = CachedMataKuliahRepository(repository)
     service = MataKuliahService(mata_kuliah_repo=repository)
     return service
 
 
+async def get_mata_kuliah_service(
+    runner: SessionRunner = Depends(get_session_runner),
+) -> AsyncService[MataKuliahService]:
+    return AsyncService(runner, build_mata_kuliah_service)
+
+
 from src.application.usecases.dosen import DosenService
+from src.application.usecases.interfaces.dosen_repository import (
+    DosenRepositoryInterface,
+)
+from src.repositories.cache import CachedDosenRepository
 from src.repositories.database.dosen import DosenRepository
 
 
-def get_dosen_service(db: Session = Depends(get_db_session)) -> DosenService:
-    repository = DosenRepository(session_db=db)
+def build_dosen_service(db: Session) -> DosenService:
+    repository: DosenRepositoryInterface = DosenRepository(session_db=db)
+    if cache_enabled():
+        repository = CachedDosenRepository(repository)
     service = DosenService(dosen_repo=repository)
     return service
 
 
+async def get_dosen_service(
+    runner: SessionRunner = Depends(get_session_runner),
+) -> AsyncService[DosenService]:
+    return AsyncService(runner, build_dosen_service)
+
+
 from src.application.usecases.jadwal import JadwalService
 from src.repositories.database.jadwal import JadwalRepository
 
 
-def get_jadwal_service(db: Session = Depends(get_db_session)) -> JadwalService:
+def build_jadwal_service(db: Session) -> JadwalService:
     repository = JadwalRepository(session_db=db)
     service = JadwalService(jadwal_repo=repository)
     return service
 
 
+async def get_jadwal_service(
+    runner: SessionRunner = Depends(get_session_runner),
+) -> AsyncService[JadwalService]:
+    return AsyncService(runner, build_jadwal_service)
+
+
 from src.application.usecases.tugas import TugasService
 from src.repositories.database.tugas import TugasRepository
 
 
-def get_tugas_service(db: Session = Depends(get_db_session)) -> TugasService:
+def build_tugas_service(db: Session) -> TugasService:
     repository = TugasRepository(session_db=db)
     service = TugasService(tugas_repo=repository)
     return service
+
+
+async def get_tugas_service(
+    runner: SessionRunner = Depends(get_session_runner),
+) -> AsyncService[TugasService]:
+    return AsyncService(runner, build_tugas_service)
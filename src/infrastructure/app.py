@@ -1,5 +1,11 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from src.infrastructure.instrumentation import QueryStatsMiddleware
+from src.infrastructure.responses import DtoJSONResponse
 from src.infrastructure.routes import (
     dosen_router,
     jadwal_router,
@@ -7,12 +13,32 @@ from src.infrastructure.routes import (
     mata_kuliah_router,
     tugas_router,
 )
-from src.repositories.database.core import Base, engine
+from src.repositories.database.core import (
+    Base,
+    async_engine,
+    config,
+    engine,
+    log_engine_settings,
+)
+
+logging.basicConfig(level=config.LOG_LEVEL)
 
 # Create all tables in the database
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    log_engine_settings()
+    yield
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=DtoJSONResponse)
+app.add_middleware(
+    QueryStatsMiddleware, repeat_threshold=config.SQL_REPEAT_WARN_THRESHOLD
+)
 
 # The get_mahasiswa_service dependency is now imported from src.dependencies
 app.include_router(mahasiswa_router, prefix="/mahasiswa", tags=["mahasiswa"])
@@ -0,0 +1,82 @@
+"""
+Conditional GET support for the list endpoints.
+
+A list's ETag is derived from the change versions of the tables it reads (see
+``src.repositories.database.versions``) and the request's query, so it is
+known before the query runs: when the client's ``If-None-Match`` still names
+it, the endpoint answers 304 without reading or serializing a single row.
+"""
+
+import hashlib
+import json
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from src.application.dtos.count_dto import CountDto, PageDto
+from src.infrastructure.responses import DtoJSONResponse
+from src.repositories.database.core import SessionRunner
+from src.repositories.database.versions import read_versions
+
+
+async def list_etag(
+    runner: SessionRunner, request: Request, table_names: Collection[str]
+) -> str:
+    """
+    Weak ETag of a list read of ``table_names`` with the request's filters.
+
+    The versions are read before the list itself: a write committed in
+    between yields newer rows under the older ETag, which only costs the
+    client one extra full response on its next poll.
+    """
+    versions = await runner.run(lambda session: read_versions(session, table_names))
+    token = json.dumps(
+        [
+            request.url.path,
+            sorted(request.query_params.multi_items()),
+            sorted(versions.items()),
+        ]
+    )
+    return f'W/"{hashlib.blake2b(token.encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header value."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def list_response(
+    items: Sequence[BaseModel],
+    etag: str,
+    headers: Optional[Mapping[str, str]] = None,
+    exclude_unset: bool = False,
+    total: Optional[CountDto] = None,
+) -> Response:
+    """
+    The list body for ``items``; wrapped in a PageDto envelope when ``total``
+    was requested (``include_total``).
+    """
+    content: Any = list(items)
+    if total is not None:
+        content = PageDto.model_construct(
+            items=content, total=total.count, total_exact=total.exact
+        )
+    return DtoJSONResponse(
+        content,
+        headers={**(headers or {}), "ETag": etag},
+        exclude_unset=exclude_unset,
+    )
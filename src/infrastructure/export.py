@@ -0,0 +1,77 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from typing import Literal, Optional
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+async def _ndjson_chunks(
+    batches: AsyncIterator[Sequence[BaseModel]],
+) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield "".join(item.model_dump_json(exclude_unset=True) + "\n" for item in batch)
+
+
+async def _csv_chunks(
+    batches: AsyncIterator[Sequence[BaseModel]], fields: list[str]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    # Embedded relations (``expand``) have no flat column and are left out.
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    async for batch in batches:
+        writer.writerows(item.model_dump(mode="json") for item in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Only the header is left when the result set was empty.
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+
+async def export_response(
+    batches: AsyncIterator[Sequence[BaseModel]],
+    export_format: ExportFormat,
+    dto_type: type[BaseModel],
+    filename: str,
+    fields: Optional[list[str]] = None,
+) -> StreamingResponse:
+    """
+    Streams ``batches`` of DTOs as NDJSON or CSV, one chunk per batch. When the
+    query was projected, ``fields`` are the projected fields and the CSV
+    columns.
+
+    The first batch is fetched before the response starts, so errors from the
+    query itself (e.g. an invalid cursor) still reach the caller as a regular
+    exception instead of a truncated 200 response.
+    """
+    first_batch = await anext(batches, None)
+
+    async def all_batches() -> AsyncIterator[Sequence[BaseModel]]:
+        if first_batch is not None:
+            yield first_batch
+            async for batch in batches:
+                yield batch
+
+    if export_format == "csv":
+        chunks = _csv_chunks(all_batches(), fields or list(dto_type.model_fields))
+    else:
+        chunks = _ndjson_chunks(all_batches())
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format}"'
+            )
+        },
+    )
@@ -0,0 +1,77 @@
+"""
+CSV input for the ``/import`` endpoints and ``manage.py import``.
+
+Files are read row by row, so memory use does not depend on their size. The
+request body of an upload is first spooled to a temporary file (in memory up
+to IMPORT_SPOOL_SIZE bytes, on disk beyond) so the synchronous import can read
+it at its own pace.
+"""
+
+import codecs
+import csv
+import tempfile
+from collections.abc import Iterator
+from typing import IO, Any
+
+from fastapi import Request, status
+
+from src.application.exceptions import (
+    DuplicateEntryException,
+    ImportInterruptedException,
+    InvalidInputException,
+)
+from src.application.usecases.imports import ImportRow
+
+IMPORT_SPOOL_SIZE = 1024 * 1024
+
+# Documents the raw CSV request body of the import routes in the OpenAPI schema.
+CSV_REQUEST_BODY: dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {"text/csv": {"schema": {"type": "string"}}},
+    }
+}
+
+
+def _decoded_lines(stream: IO[bytes]) -> Iterator[str]:
+    # Decoded line by line so that an encoding error names its line.
+    for number, raw in enumerate(stream, start=1):
+        if number == 1:
+            raw = raw.removeprefix(codecs.BOM_UTF8)
+        try:
+            yield raw.decode("utf-8")
+        except UnicodeDecodeError:
+            raise InvalidInputException(f"Line {number} is not valid UTF-8.")
+
+
+def csv_rows(stream: IO[bytes], after_line: int = 0) -> Iterator[ImportRow]:
+    """
+    ``(line, row)`` for each record of the UTF-8 CSV ``stream``, keyed by the
+    header row. ``line`` is the file line the record ends on (the header is
+    line 1); records ending on or before ``after_line`` are skipped.
+    """
+    reader = csv.DictReader(_decoded_lines(stream))
+    try:
+        for row in reader:
+            if reader.line_num > after_line:
+                # Cells beyond the header are collected under the None key.
+                yield reader.line_num, {k: v for k, v in row.items() if k is not None}
+    except csv.Error as e:
+        raise InvalidInputException(f"Line {reader.line_num} is not valid CSV: {e}")
+
+
+async def spooled_body(request: Request) -> IO[bytes]:
+    body = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_SIZE)
+    async for chunk in request.stream():
+        body.write(chunk)
+    body.seek(0)
+    return body
+
+
+def import_error_status(error: ImportInterruptedException) -> int:
+    """HTTP status of an import stopped by ``error``."""
+    if isinstance(error.cause, InvalidInputException):
+        return status.HTTP_400_BAD_REQUEST
+    if isinstance(error.cause, DuplicateEntryException):
+        return status.HTTP_409_CONFLICT
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -0,0 +1,79 @@
+"""
+Reports the SQL each request runs (see
+``src.repositories.database.instrumentation``).
+
+The statement count and database time are sent to the client as a
+``Server-Timing`` entry, covering the statements run before the response
+starts, and logged with the request once the body has been sent, so streamed
+exports are accounted for in full. Statement shapes repeated more than
+``SQL_REPEAT_WARN_THRESHOLD`` times in one request are logged as warnings.
+"""
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.repositories.database.instrumentation import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+
+def server_timing(stats: QueryStats) -> str:
+    return f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} statements"'
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 0):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(stats))
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self.report(scope, status_code, stats)
+
+    def report(self, scope: Scope, status_code: int, stats: QueryStats) -> None:
+        method, path = scope["method"], scope["path"]
+        logger.info(
+            "%s %s %d: %d SQL statements in %.2f ms",
+            method,
+            path,
+            status_code,
+            stats.count,
+            stats.duration * 1000,
+            extra={
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "db_statements": stats.count,
+                "db_time_ms": round(stats.duration * 1000, 2),
+            },
+        )
+        if self.repeat_threshold <= 0:
+            return
+        for statement, count in stats.repeated(self.repeat_threshold):
+            logger.warning(
+                "%s %s ran the same statement %d times (possible N+1 query): %s",
+                method,
+                path,
+                count,
+                statement,
+                extra={"method": method, "path": path, "repeat_count": count},
+            )
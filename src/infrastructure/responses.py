@@ -0,0 +1,39 @@
+"""
+JSON responses rendered by pydantic-core.
+
+A route declaring ``response_model`` makes FastAPI re-validate the returned
+DTOs into that model, turn them into plain Python with ``jsonable_encoder`` and
+finally ``json.dumps`` the result. The DTOs built by the repositories are
+already validated, so routes returning large payloads wrap them in
+``DtoJSONResponse`` instead: FastAPI then skips the response_model round trip
+and every DTO is serialized once, straight to bytes, by its own serializer.
+``response_model`` stays on the route for the OpenAPI schema.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+
+# Serializes models by their runtime type, so subclasses such as
+# JadwalDetailDto keep their extra fields.
+_any_adapter: TypeAdapter[Any] = TypeAdapter(Any)
+
+
+class DtoJSONResponse(JSONResponse):
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        exclude_unset: bool = False,
+    ):
+        self.exclude_unset = exclude_unset
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        return _any_adapter.dump_json(content, exclude_unset=self.exclude_unset)
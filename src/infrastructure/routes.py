@@ -1,8 +1,12 @@
 from datetime import date, datetime, time  # Import date, datetime, and time
-from typing import Optional
+from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
+from src.application.dtos.bulk_dto import BulkCreateResultDto
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, PageDto
+from src.application.dtos.import_dto import ImportResultDto
 from src.application.dtos.mahasiswa_dto import (
     CreateMahasiswaDto,
     MahasiswaDto,
@@ -13,22 +17,50 @@ from src.application.dtos.mata_kuliah_dto import (
     MataKuliahDto,
     UpdateMataKuliahDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
 from src.application.exceptions import (
     ApplicationException,
     DatabaseException,
     DuplicateEntryException,
+    ImportInterruptedException,
     InvalidInputException,
     NotFoundException,
     RepositoryException,
+    ScheduleConflictException,
 )
 from src.application.usecases.mahasiswa import MahasiswaService
 from src.application.usecases.mata_kuliah import MataKuliahService
 from src.dependencies import (  # Import the dependency from new dependencies file
+    AsyncService,
     get_mahasiswa_service,
     get_mata_kuliah_service,
+    get_session_runner,
 )
+from src.infrastructure.conditional import (
+    etag_matches,
+    list_etag,
+    list_response,
+    not_modified,
+)
+from src.infrastructure.export import ExportFormat, export_response
+from src.infrastructure.imports import (
+    CSV_REQUEST_BODY,
+    csv_rows,
+    import_error_status,
+    spooled_body,
+)
+from src.infrastructure.responses import DtoJSONResponse
+from src.ports.changes import (
+    DEFAULT_CHANGES_LIMIT,
+    MAX_CHANGES_LIMIT,
+    GetChangesPort,
+)
+from src.ports.cursor import NEXT_CURSOR_HEADER
+from src.ports.expand import parse_expand
+from src.ports.fields import parse_fields
 from src.ports.mahasiswa import GetMahasiswaPort
 from src.ports.mata_kuliah import GetMataKuliahPort
+from src.repositories.database.core import SessionRunner
 
 mahasiswa_router = APIRouter()
 mata_kuliah_router = APIRouter()
@@ -37,12 +69,14 @@ mata_kuliah_router = APIRouter()
 @mahasiswa_router.post(
     "/", response_model=MahasiswaDto, status_code=status.HTTP_201_CREATED
 )
-def create_mahasiswa(
+async def create_mahasiswa(
     mahasiswa_dto: CreateMahasiswaDto,
-    mahasiswa_service: MahasiswaService = Depends(get_mahasiswa_service),
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
 ):
     try:
-        new_mahasiswa = mahasiswa_service.create(mahasiswa_dto)
+        new_mahasiswa = await mahasiswa_service.call(
+            MahasiswaService.create, mahasiswa_dto
+        )
         return new_mahasiswa
     except DuplicateEntryException as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
@@ -66,8 +100,69 @@ def create_mahasiswa(
         )
 
 
-@mahasiswa_router.get("/", response_model=list[MahasiswaDto])
-def read_mahasiswa(
+@mahasiswa_router.post(
+    "/bulk",
+    response_model=BulkCreateResultDto[MahasiswaDto],
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_mahasiswa(
+    response: Response,
+    mahasiswa_dtos: list[CreateMahasiswaDto],
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+):
+    try:
+        result = await mahasiswa_service.call(
+            MahasiswaService.bulk_create, mahasiswa_dtos
+        )
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+@mahasiswa_router.post(
+    "/import",
+    response_model=ImportResultDto,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=CSV_REQUEST_BODY,
+)
+async def import_mahasiswa(
+    request: Request,
+    response: Response,
+    after_line: int = Query(0, ge=0),
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+):
+    body = await spooled_body(request)
+    try:
+        result = await mahasiswa_service.call(
+            MahasiswaService.import_rows, csv_rows(body, after_line)
+        )
+    except ImportInterruptedException as e:
+        raise HTTPException(status_code=import_error_status(e), detail=e.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    finally:
+        body.close()
+    if result.rejected:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+def parse_mahasiswa_query(
     id: Optional[int] = None,
     nim: Optional[str] = None,
     nama: Optional[str] = None,
@@ -76,12 +171,19 @@ def read_mahasiswa(
     tanggal_lahir: Optional[
         str
     ] = None,  # Use str for query param, convert here if needed
+    q: Optional[str] = None,
     order_by: Optional[str] = None,
     order: Optional[str] = None,
     limit: Optional[int] = None,
     page: Optional[int] = None,
-    mahasiswa_service: MahasiswaService = Depends(get_mahasiswa_service),
-):
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> GetMahasiswaPort:
+    try:
+        field_names = parse_fields(fields, MahasiswaDto)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
     parsed_tanggal_lahir: Optional[date] = None
     if tanggal_lahir:
         try:
@@ -92,27 +194,173 @@ def read_mahasiswa(
                 detail="Invalid date format for tanggal_lahir. Expected YYYY-MM-DD.",
             )
 
-    get_mahasiswa_port = GetMahasiswaPort(
+    return GetMahasiswaPort(
         id=id,
         nim=nim,
         nama=nama,
         kelas=kelas,
         tempat_lahir=tempat_lahir,
         tanggal_lahir=parsed_tanggal_lahir,  # Pass the converted date object
+        q=q,
         order_by=order_by,
         order=order,
         limit=limit,
         page=page,
+        cursor=cursor,
+        fields=field_names,
     )
-    mahasiswa_list = mahasiswa_service.read(get_mahasiswa_port)
-    return mahasiswa_list
+
+
+@mahasiswa_router.get(
+    "/",
+    response_model=Union[list[MahasiswaDto], PageDto[MahasiswaDto]],
+    response_model_exclude_unset=True,
+)
+async def read_mahasiswa(
+    request: Request,
+    get_mahasiswa_port: GetMahasiswaPort = Depends(parse_mahasiswa_query),
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+    runner: SessionRunner = Depends(get_session_runner),
+    include_total: bool = False,
+):
+    etag = await list_etag(runner, request, ["mahasiswa"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        page = await mahasiswa_service.call(
+            MahasiswaService.read_page, get_mahasiswa_port
+        )
+        total = None
+        if include_total:
+            total = await mahasiswa_service.call(
+                MahasiswaService.count, get_mahasiswa_port
+            )
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    headers: dict[str, str] = {}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return list_response(page.items, etag, headers, exclude_unset=True, total=total)
+
+
+@mahasiswa_router.get("/export")
+async def export_mahasiswa(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    get_mahasiswa_port: GetMahasiswaPort = Depends(parse_mahasiswa_query),
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+):
+    try:
+        return await export_response(
+            mahasiswa_service.stream(MahasiswaService.stream, get_mahasiswa_port),
+            export_format,
+            MahasiswaDto,
+            "mahasiswa",
+            fields=get_mahasiswa_port.fields,
+        )
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@mahasiswa_router.get("/count", response_model=CountDto)
+async def count_mahasiswa(
+    request: Request,
+    get_mahasiswa_port: GetMahasiswaPort = Depends(parse_mahasiswa_query),
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+    runner: SessionRunner = Depends(get_session_runner),
+):
+    etag = await list_etag(runner, request, ["mahasiswa"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        count = await mahasiswa_service.call(MahasiswaService.count, get_mahasiswa_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(count, headers={"ETag": etag})
+
+
+@mahasiswa_router.get("/changes", response_model=ChangesDto[MahasiswaDto])
+async def read_mahasiswa_changes(
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+):
+    try:
+        changes_port = GetChangesPort(since=since, limit=limit)
+        changes = await mahasiswa_service.call(MahasiswaService.changes, changes_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(changes)
+
+
+@mahasiswa_router.put("/by-nim/{nim}", response_model=MahasiswaDto)
+async def upsert_mahasiswa(
+    nim: str,
+    response: Response,
+    mahasiswa_dto: CreateMahasiswaDto,
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+):
+    if mahasiswa_dto.nim != nim:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The NIM in the body does not match the NIM in the URL.",
+        )
+    try:
+        mahasiswa, created = await mahasiswa_service.call(
+            MahasiswaService.upsert, mahasiswa_dto
+        )
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except InvalidInputException as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message
+        )
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if created:
+        response.status_code = status.HTTP_201_CREATED
+    return mahasiswa
+
+
+@mahasiswa_router.put("/by-nim", response_model=UpsertResultDto[MahasiswaDto])
+async def bulk_upsert_mahasiswa(
+    response: Response,
+    mahasiswa_dtos: list[CreateMahasiswaDto],
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
+):
+    try:
+        result = await mahasiswa_service.call(
+            MahasiswaService.bulk_upsert, mahasiswa_dtos
+        )
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
 
 
 @mahasiswa_router.put("/{mahasiswa_id}", response_model=MahasiswaDto)
-def update_mahasiswa(
+async def update_mahasiswa(
     mahasiswa_id: int,
     mahasiswa_dto: CreateMahasiswaDto,
-    mahasiswa_service: MahasiswaService = Depends(get_mahasiswa_service),
+    mahasiswa_service: AsyncService[MahasiswaService] = Depends(get_mahasiswa_service),
 ):
     update_data = UpdateMahasiswaDto(
         id=mahasiswa_id,
@@ -124,10 +372,14 @@ def update_mahasiswa(
         status=mahasiswa_dto.status,
     )
     try:
-        updated_mahasiswa = mahasiswa_service.update(update_data)
+        updated_mahasiswa = await mahasiswa_service.call(
+            MahasiswaService.update, update_data
+        )
         return updated_mahasiswa
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
     except InvalidInputException as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message
@@ -157,12 +409,16 @@ def update_mahasiswa(
 @mata_kuliah_router.post(
     "/", response_model=MataKuliahDto, status_code=status.HTTP_201_CREATED
 )
-def create_mata_kuliah(
+async def create_mata_kuliah(
     mata_kuliah_dto: CreateMataKuliahDto,
-    mata_kuliah_service: MataKuliahService = Depends(get_mata_kuliah_service),
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
 ):
     try:
-        new_mk = mata_kuliah_service.create(mata_kuliah_dto)
+        new_mk = await mata_kuliah_service.call(
+            MataKuliahService.create, mata_kuliah_dto
+        )
         return new_mk
     except DuplicateEntryException as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
@@ -177,36 +433,233 @@ def create_mata_kuliah(
         )
 
 
-@mata_kuliah_router.get("/", response_model=list[MataKuliahDto])
-def read_mata_kuliah(
+@mata_kuliah_router.post(
+    "/bulk",
+    response_model=BulkCreateResultDto[MataKuliahDto],
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_mata_kuliah(
+    response: Response,
+    mata_kuliah_dtos: list[CreateMataKuliahDto],
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
+):
+    try:
+        result = await mata_kuliah_service.call(
+            MataKuliahService.bulk_create, mata_kuliah_dtos
+        )
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+def parse_mata_kuliah_query(
     id: Optional[int] = None,
     kode_mk: Optional[str] = None,
     nama_mk: Optional[str] = None,
     sks: Optional[int] = None,
+    q: Optional[str] = None,
     order_by: Optional[str] = None,
     order: Optional[str] = None,
     limit: Optional[int] = None,
     page: Optional[int] = None,
-    mata_kuliah_service: MataKuliahService = Depends(get_mata_kuliah_service),
-):
-    get_mk_port = GetMataKuliahPort(
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> GetMataKuliahPort:
+    try:
+        field_names = parse_fields(fields, MataKuliahDto)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return GetMataKuliahPort(
         id=id,
         kode_mk=kode_mk,
         nama_mk=nama_mk,
         sks=sks,
+        q=q,
         order_by=order_by,
         order=order,
         limit=limit,
         page=page,
+        cursor=cursor,
+        fields=field_names,
     )
-    return mata_kuliah_service.read(get_mk_port)
+
+
+@mata_kuliah_router.get(
+    "/",
+    response_model=Union[list[MataKuliahDto], PageDto[MataKuliahDto]],
+    response_model_exclude_unset=True,
+)
+async def read_mata_kuliah(
+    request: Request,
+    get_mk_port: GetMataKuliahPort = Depends(parse_mata_kuliah_query),
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
+    runner: SessionRunner = Depends(get_session_runner),
+    include_total: bool = False,
+):
+    etag = await list_etag(runner, request, ["mata_kuliah"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        page = await mata_kuliah_service.call(MataKuliahService.read_page, get_mk_port)
+        total = None
+        if include_total:
+            total = await mata_kuliah_service.call(MataKuliahService.count, get_mk_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    headers: dict[str, str] = {}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return list_response(page.items, etag, headers, exclude_unset=True, total=total)
+
+
+@mata_kuliah_router.get("/export")
+async def export_mata_kuliah(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    get_mk_port: GetMataKuliahPort = Depends(parse_mata_kuliah_query),
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
+):
+    try:
+        return await export_response(
+            mata_kuliah_service.stream(MataKuliahService.stream, get_mk_port),
+            export_format,
+            MataKuliahDto,
+            "mata_kuliah",
+            fields=get_mk_port.fields,
+        )
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@mata_kuliah_router.get("/count", response_model=CountDto)
+async def count_mata_kuliah(
+    request: Request,
+    get_mk_port: GetMataKuliahPort = Depends(parse_mata_kuliah_query),
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
+    runner: SessionRunner = Depends(get_session_runner),
+):
+    etag = await list_etag(runner, request, ["mata_kuliah"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        count = await mata_kuliah_service.call(MataKuliahService.count, get_mk_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(count, headers={"ETag": etag})
+
+
+@mata_kuliah_router.get("/changes", response_model=ChangesDto[MataKuliahDto])
+async def read_mata_kuliah_changes(
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
+):
+    try:
+        changes_port = GetChangesPort(since=since, limit=limit)
+        changes = await mata_kuliah_service.call(
+            MataKuliahService.changes, changes_port
+        )
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(changes)
+
+
+@mata_kuliah_router.put("/by-kode/{kode_mk}", response_model=MataKuliahDto)
+async def upsert_mata_kuliah(
+    kode_mk: str,
+    response: Response,
+    mata_kuliah_dto: CreateMataKuliahDto,
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
+):
+    if mata_kuliah_dto.kode_mk != kode_mk:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The kode_mk in the body does not match the kode_mk in the URL.",
+        )
+    try:
+        mata_kuliah, created = await mata_kuliah_service.call(
+            MataKuliahService.upsert, mata_kuliah_dto
+        )
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except InvalidInputException as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message
+        )
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if created:
+        response.status_code = status.HTTP_201_CREATED
+    return mata_kuliah
+
+
+@mata_kuliah_router.put("/by-kode", response_model=UpsertResultDto[MataKuliahDto])
+async def bulk_upsert_mata_kuliah(
+    response: Response,
+    mata_kuliah_dtos: list[CreateMataKuliahDto],
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
+):
+    try:
+        result = await mata_kuliah_service.call(
+            MataKuliahService.bulk_upsert, mata_kuliah_dtos
+        )
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
 
 
 @mata_kuliah_router.put("/{mata_kuliah_id}", response_model=MataKuliahDto)
-def update_mata_kuliah(
+async def update_mata_kuliah(
     mata_kuliah_id: int,
     mata_kuliah_dto: CreateMataKuliahDto,
-    mata_kuliah_service: MataKuliahService = Depends(get_mata_kuliah_service),
+    mata_kuliah_service: AsyncService[MataKuliahService] = Depends(
+        get_mata_kuliah_service
+    ),
 ):
     update_data = UpdateMataKuliahDto(
         id=mata_kuliah_id,
@@ -216,7 +669,7 @@ def update_mata_kuliah(
         is_active=mata_kuliah_dto.is_active,
     )
     try:
-        return mata_kuliah_service.update(update_data)
+        return await mata_kuliah_service.call(MataKuliahService.update, update_data)
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except DuplicateEntryException as e:
@@ -250,12 +703,12 @@ dosen_router = APIRouter()
 
 
 @dosen_router.post("/", response_model=DosenDto, status_code=status.HTTP_201_CREATED)
-def create_dosen(
+async def create_dosen(
     dosen_dto: CreateDosenDto,
-    dosen_service: DosenService = Depends(get_dosen_service),
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
 ):
     try:
-        new_dosen = dosen_service.create(dosen_dto)
+        new_dosen = await dosen_service.call(DosenService.create, dosen_dto)
         return new_dosen
     except DuplicateEntryException as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
@@ -270,36 +723,209 @@ def create_dosen(
         )
 
 
-@dosen_router.get("/", response_model=list[DosenDto])
-def read_dosen(
+@dosen_router.post(
+    "/bulk",
+    response_model=BulkCreateResultDto[DosenDto],
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_dosen(
+    response: Response,
+    dosen_dtos: list[CreateDosenDto],
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
+):
+    try:
+        result = await dosen_service.call(DosenService.bulk_create, dosen_dtos)
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+def parse_dosen_query(
     id: Optional[int] = None,
     nidn: Optional[str] = None,
     nama: Optional[str] = None,
     email: Optional[str] = None,
+    q: Optional[str] = None,
     order_by: Optional[str] = None,
     order: Optional[str] = None,
     limit: Optional[int] = None,
     page: Optional[int] = None,
-    dosen_service: DosenService = Depends(get_dosen_service),
-):
-    get_dosen_port = GetDosenPort(
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> GetDosenPort:
+    try:
+        field_names = parse_fields(fields, DosenDto)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return GetDosenPort(
         id=id,
         nidn=nidn,
         nama=nama,
         email=email,
+        q=q,
         order_by=order_by,
         order=order,
         limit=limit,
         page=page,
+        cursor=cursor,
+        fields=field_names,
     )
-    return dosen_service.read(get_dosen_port)
+
+
+@dosen_router.get(
+    "/",
+    response_model=Union[list[DosenDto], PageDto[DosenDto]],
+    response_model_exclude_unset=True,
+)
+async def read_dosen(
+    request: Request,
+    get_dosen_port: GetDosenPort = Depends(parse_dosen_query),
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
+    runner: SessionRunner = Depends(get_session_runner),
+    include_total: bool = False,
+):
+    etag = await list_etag(runner, request, ["dosen"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        page = await dosen_service.call(DosenService.read_page, get_dosen_port)
+        total = None
+        if include_total:
+            total = await dosen_service.call(DosenService.count, get_dosen_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    headers: dict[str, str] = {}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return list_response(page.items, etag, headers, exclude_unset=True, total=total)
+
+
+@dosen_router.get("/export")
+async def export_dosen(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    get_dosen_port: GetDosenPort = Depends(parse_dosen_query),
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
+):
+    try:
+        return await export_response(
+            dosen_service.stream(DosenService.stream, get_dosen_port),
+            export_format,
+            DosenDto,
+            "dosen",
+            fields=get_dosen_port.fields,
+        )
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@dosen_router.get("/count", response_model=CountDto)
+async def count_dosen(
+    request: Request,
+    get_dosen_port: GetDosenPort = Depends(parse_dosen_query),
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
+    runner: SessionRunner = Depends(get_session_runner),
+):
+    etag = await list_etag(runner, request, ["dosen"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        count = await dosen_service.call(DosenService.count, get_dosen_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(count, headers={"ETag": etag})
+
+
+@dosen_router.get("/changes", response_model=ChangesDto[DosenDto])
+async def read_dosen_changes(
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
+):
+    try:
+        changes_port = GetChangesPort(since=since, limit=limit)
+        changes = await dosen_service.call(DosenService.changes, changes_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(changes)
+
+
+@dosen_router.put("/by-nidn/{nidn}", response_model=DosenDto)
+async def upsert_dosen(
+    nidn: str,
+    response: Response,
+    dosen_dto: CreateDosenDto,
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
+):
+    if dosen_dto.nidn != nidn:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The NIDN in the body does not match the NIDN in the URL.",
+        )
+    try:
+        dosen, created = await dosen_service.call(DosenService.upsert, dosen_dto)
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except InvalidInputException as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message
+        )
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if created:
+        response.status_code = status.HTTP_201_CREATED
+    return dosen
+
+
+@dosen_router.put("/by-nidn", response_model=UpsertResultDto[DosenDto])
+async def bulk_upsert_dosen(
+    response: Response,
+    dosen_dtos: list[CreateDosenDto],
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
+):
+    try:
+        result = await dosen_service.call(DosenService.bulk_upsert, dosen_dtos)
+    except DuplicateEntryException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
 
 
 @dosen_router.put("/{dosen_id}", response_model=DosenDto)
-def update_dosen(
+async def update_dosen(
     dosen_id: int,
     dosen_dto: CreateDosenDto,
-    dosen_service: DosenService = Depends(get_dosen_service),
+    dosen_service: AsyncService[DosenService] = Depends(get_dosen_service),
 ):
     update_data = UpdateDosenDto(
         id=dosen_id,
@@ -309,7 +935,7 @@ def update_dosen(
         status=dosen_dto.status,
     )
     try:
-        return dosen_service.update(update_data)
+        return await dosen_service.call(DosenService.update, update_data)
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except DuplicateEntryException as e:
@@ -332,24 +958,28 @@ def update_dosen(
 
 from src.application.dtos.jadwal_dto import (
     CreateJadwalDto,
+    JadwalConflictsDto,
+    JadwalDetailDto,
     JadwalDto,
     UpdateJadwalDto,
 )
 from src.application.usecases.jadwal import JadwalService
 from src.dependencies import get_jadwal_service
-from src.ports.jadwal import GetJadwalPort
+from src.ports.jadwal import JADWAL_EXPANDABLE, GetJadwalPort
 
 jadwal_router = APIRouter()
 
 
 @jadwal_router.post("/", response_model=JadwalDto, status_code=status.HTTP_201_CREATED)
-def create_jadwal(
+async def create_jadwal(
     jadwal_dto: CreateJadwalDto,
-    jadwal_service: JadwalService = Depends(get_jadwal_service),
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
 ):
     try:
-        new_jadwal = jadwal_service.create(jadwal_dto)
+        new_jadwal = await jadwal_service.call(JadwalService.create, jadwal_dto)
         return new_jadwal
+    except ScheduleConflictException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
     except InvalidInputException as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message
@@ -361,8 +991,55 @@ def create_jadwal(
         )
 
 
-@jadwal_router.get("/", response_model=list[JadwalDto])
-def read_jadwal(
+@jadwal_router.post(
+    "/bulk",
+    response_model=BulkCreateResultDto[JadwalDto],
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_jadwal(
+    response: Response,
+    jadwal_dtos: list[CreateJadwalDto],
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
+):
+    try:
+        result = await jadwal_service.call(JadwalService.bulk_create, jadwal_dtos)
+    except ScheduleConflictException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+@jadwal_router.post("/conflicts", response_model=JadwalConflictsDto)
+async def check_jadwal_conflicts(
+    jadwal_dtos: list[CreateJadwalDto],
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
+):
+    try:
+        return await jadwal_service.call(JadwalService.check_conflicts, jadwal_dtos)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+
+
+def parse_jadwal_query(
     id: Optional[int] = None,
     hari: Optional[str] = None,
     jam_mulai: Optional[time] = None,
@@ -370,13 +1047,21 @@ def read_jadwal(
     ruangan: Optional[str] = None,
     mata_kuliah_id: Optional[int] = None,
     dosen_id: Optional[int] = None,
+    q: Optional[str] = None,
     order_by: Optional[str] = None,
     order: Optional[str] = None,
     limit: Optional[int] = None,
     page: Optional[int] = None,
-    jadwal_service: JadwalService = Depends(get_jadwal_service),
-):
-    get_jadwal_port = GetJadwalPort(
+    cursor: Optional[str] = None,
+    expand: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> GetJadwalPort:
+    try:
+        expand_names = parse_expand(expand, JADWAL_EXPANDABLE)
+        field_names = parse_fields(fields, JadwalDto)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return GetJadwalPort(
         id=id,
         hari=hari,
         jam_mulai=jam_mulai,
@@ -384,19 +1069,100 @@ def read_jadwal(
         ruangan=ruangan,
         mata_kuliah_id=mata_kuliah_id,
         dosen_id=dosen_id,
+        q=q,
         order_by=order_by,
         order=order,
         limit=limit,
         page=page,
+        cursor=cursor,
+        expand=expand_names,
+        fields=field_names,
     )
-    return jadwal_service.read(get_jadwal_port)
+
+
+@jadwal_router.get(
+    "/",
+    response_model=Union[list[JadwalDetailDto], PageDto[JadwalDetailDto]],
+    response_model_exclude_unset=True,
+)
+async def read_jadwal(
+    request: Request,
+    get_jadwal_port: GetJadwalPort = Depends(parse_jadwal_query),
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
+    runner: SessionRunner = Depends(get_session_runner),
+    include_total: bool = False,
+):
+    # Expandable relation names are also the names of their tables.
+    etag = await list_etag(runner, request, ["jadwal", *(get_jadwal_port.expand or [])])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        page = await jadwal_service.call(JadwalService.read_page, get_jadwal_port)
+        total = None
+        if include_total:
+            total = await jadwal_service.call(JadwalService.count, get_jadwal_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    headers: dict[str, str] = {}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return list_response(page.items, etag, headers, exclude_unset=True, total=total)
+
+
+@jadwal_router.get("/export")
+async def export_jadwal(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    get_jadwal_port: GetJadwalPort = Depends(parse_jadwal_query),
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
+):
+    try:
+        return await export_response(
+            jadwal_service.stream(JadwalService.stream, get_jadwal_port),
+            export_format,
+            JadwalDto,
+            "jadwal",
+            fields=get_jadwal_port.fields,
+        )
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@jadwal_router.get("/count", response_model=CountDto)
+async def count_jadwal(
+    request: Request,
+    get_jadwal_port: GetJadwalPort = Depends(parse_jadwal_query),
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
+    runner: SessionRunner = Depends(get_session_runner),
+):
+    etag = await list_etag(runner, request, ["jadwal"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        count = await jadwal_service.call(JadwalService.count, get_jadwal_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(count, headers={"ETag": etag})
+
+
+@jadwal_router.get("/changes", response_model=ChangesDto[JadwalDto])
+async def read_jadwal_changes(
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
+):
+    try:
+        changes_port = GetChangesPort(since=since, limit=limit)
+        changes = await jadwal_service.call(JadwalService.changes, changes_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(changes)
 
 
 @jadwal_router.put("/{jadwal_id}", response_model=JadwalDto)
-def update_jadwal(
+async def update_jadwal(
     jadwal_id: int,
     jadwal_dto: CreateJadwalDto,
-    jadwal_service: JadwalService = Depends(get_jadwal_service),
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
 ):
     update_data = UpdateJadwalDto(
         id=jadwal_id,
@@ -409,9 +1175,11 @@ def update_jadwal(
         is_active=jadwal_dto.is_active,
     )
     try:
-        return jadwal_service.update(update_data)
+        return await jadwal_service.call(JadwalService.update, update_data)
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except ScheduleConflictException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
     except InvalidInputException as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message
@@ -424,12 +1192,12 @@ def update_jadwal(
 
 
 @jadwal_router.delete("/{jadwal_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_jadwal(
+async def delete_jadwal(
     jadwal_id: int,
-    jadwal_service: JadwalService = Depends(get_jadwal_service),
+    jadwal_service: AsyncService[JadwalService] = Depends(get_jadwal_service),
 ):
     try:
-        jadwal_service.delete(jadwal_id)
+        await jadwal_service.call(JadwalService.delete, jadwal_id)
         return
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
@@ -446,22 +1214,23 @@ from src.application.dtos.tugas_dto import (
     CreateTugasDto,
     StatusTugas,
     TugasDto,
+    TugasListItemDto,
     UpdateTugasDto,
 )
 from src.application.usecases.tugas import TugasService
 from src.dependencies import get_tugas_service
-from src.ports.tugas import GetTugasPort
+from src.ports.tugas import TUGAS_EXPANDABLE, TUGAS_LIST_FIELDS, GetTugasPort
 
 tugas_router = APIRouter()
 
 
 @tugas_router.post("/", response_model=TugasDto, status_code=status.HTTP_201_CREATED)
-def create_tugas(
+async def create_tugas(
     tugas_dto: CreateTugasDto,
-    tugas_service: TugasService = Depends(get_tugas_service),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
 ):
     try:
-        new_tugas = tugas_service.create(tugas_dto)
+        new_tugas = await tugas_service.call(TugasService.create, tugas_dto)
         return new_tugas
     except InvalidInputException as e:
         raise HTTPException(
@@ -474,8 +1243,65 @@ def create_tugas(
         )
 
 
-@tugas_router.get("/", response_model=list[TugasDto])
-def read_tugas(
+@tugas_router.post(
+    "/bulk",
+    response_model=BulkCreateResultDto[TugasDto],
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_tugas(
+    response: Response,
+    tugas_dtos: list[CreateTugasDto],
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
+):
+    try:
+        result = await tugas_service.call(TugasService.bulk_create, tugas_dtos)
+    except (DatabaseException, RepositoryException):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="A database error occurred.",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+@tugas_router.post(
+    "/import",
+    response_model=ImportResultDto,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=CSV_REQUEST_BODY,
+)
+async def import_tugas(
+    request: Request,
+    response: Response,
+    after_line: int = Query(0, ge=0),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
+):
+    body = await spooled_body(request)
+    try:
+        result = await tugas_service.call(
+            TugasService.import_rows, csv_rows(body, after_line)
+        )
+    except ImportInterruptedException as e:
+        raise HTTPException(status_code=import_error_status(e), detail=e.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+    finally:
+        body.close()
+    if result.rejected:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+def parse_tugas_query(
     id: Optional[int] = None,
     judul: Optional[str] = None,
     status_tugas: Optional[StatusTugas] = None,
@@ -483,12 +1309,21 @@ def read_tugas(
     mahasiswa_id: Optional[int] = None,
     deadline_from: Optional[str] = None,
     deadline_to: Optional[str] = None,
+    q: Optional[str] = None,
     order_by: Optional[str] = None,
     order: Optional[str] = None,
     limit: Optional[int] = None,
     page: Optional[int] = None,
-    tugas_service: TugasService = Depends(get_tugas_service),
-):
+    cursor: Optional[str] = None,
+    expand: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> GetTugasPort:
+    try:
+        expand_names = parse_expand(expand, TUGAS_EXPANDABLE)
+        field_names = parse_fields(fields, TugasDto)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
     parsed_deadline_from: Optional[datetime] = None
     if deadline_from:
         try:
@@ -509,7 +1344,7 @@ def read_tugas(
                 detail="Invalid date format for deadline_to. Expected ISO format.",
             )
 
-    get_tugas_port = GetTugasPort(
+    return GetTugasPort(
         id=id,
         judul=judul,
         status=status_tugas,
@@ -517,19 +1352,102 @@ def read_tugas(
         mahasiswa_id=mahasiswa_id,
         deadline_from=parsed_deadline_from,
         deadline_to=parsed_deadline_to,
+        q=q,
         order_by=order_by,
         order=order,
         limit=limit,
         page=page,
+        cursor=cursor,
+        expand=expand_names,
+        fields=field_names,
     )
-    return tugas_service.read(get_tugas_port)
+
+
+@tugas_router.get(
+    "/",
+    response_model=Union[list[TugasListItemDto], PageDto[TugasListItemDto]],
+    response_model_exclude_unset=True,
+)
+async def read_tugas(
+    request: Request,
+    get_tugas_port: GetTugasPort = Depends(parse_tugas_query),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
+    runner: SessionRunner = Depends(get_session_runner),
+    include_total: bool = False,
+):
+    # Expandable relation names are also the names of their tables.
+    etag = await list_etag(runner, request, ["tugas", *(get_tugas_port.expand or [])])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    if get_tugas_port.fields is None:
+        get_tugas_port.fields = list(TUGAS_LIST_FIELDS)
+    try:
+        page = await tugas_service.call(TugasService.read_page, get_tugas_port)
+        total = None
+        if include_total:
+            total = await tugas_service.call(TugasService.count, get_tugas_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    headers: dict[str, str] = {}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return list_response(page.items, etag, headers, exclude_unset=True, total=total)
+
+
+@tugas_router.get("/export")
+async def export_tugas(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    get_tugas_port: GetTugasPort = Depends(parse_tugas_query),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
+):
+    try:
+        return await export_response(
+            tugas_service.stream(TugasService.stream, get_tugas_port),
+            export_format,
+            TugasDto,
+            "tugas",
+            fields=get_tugas_port.fields,
+        )
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@tugas_router.get("/count", response_model=CountDto)
+async def count_tugas(
+    request: Request,
+    get_tugas_port: GetTugasPort = Depends(parse_tugas_query),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
+    runner: SessionRunner = Depends(get_session_runner),
+):
+    etag = await list_etag(runner, request, ["tugas"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    try:
+        count = await tugas_service.call(TugasService.count, get_tugas_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(count, headers={"ETag": etag})
+
+
+@tugas_router.get("/changes", response_model=ChangesDto[TugasDto])
+async def read_tugas_changes(
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
+):
+    try:
+        changes_port = GetChangesPort(since=since, limit=limit)
+        changes = await tugas_service.call(TugasService.changes, changes_port)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return DtoJSONResponse(changes)
 
 
 @tugas_router.put("/{tugas_id}", response_model=TugasDto)
-def update_tugas(
+async def update_tugas(
     tugas_id: int,
     tugas_dto: CreateTugasDto,
-    tugas_service: TugasService = Depends(get_tugas_service),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
 ):
     update_data = UpdateTugasDto(
         id=tugas_id,
@@ -541,7 +1459,7 @@ def update_tugas(
         mahasiswa_id=tugas_dto.mahasiswa_id,
     )
     try:
-        return tugas_service.update(update_data)
+        return await tugas_service.call(TugasService.update, update_data)
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except InvalidInputException as e:
@@ -556,12 +1474,12 @@ def update_tugas(
 
 
 @tugas_router.delete("/{tugas_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_tugas(
+async def delete_tugas(
     tugas_id: int,
-    tugas_service: TugasService = Depends(get_tugas_service),
+    tugas_service: AsyncService[TugasService] = Depends(get_tugas_service),
 ):
     try:
-        tugas_service.delete(tugas_id)
+        await tugas_service.call(TugasService.delete, tugas_id)
         return
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
@@ -0,0 +1,14 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+DEFAULT_CHANGES_LIMIT = 500
+MAX_CHANGES_LIMIT = 1000
+
+# Sync tokens are keyset cursors over (updated_at, id).
+CHANGES_ORDER_BY = "updated_at"
+
+
+class GetChangesPort(BaseModel):
+    since: Optional[str] = None
+    limit: int = DEFAULT_CHANGES_LIMIT
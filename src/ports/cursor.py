@@ -0,0 +1,50 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Optional
+
+from src.application.exceptions import InvalidInputException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def is_descending(order: Optional[str]) -> bool:
+    return order is not None and order.lower() == "desc"
+
+
+def encode_cursor(order_by: str, descending: bool, value: Any, last_id: int) -> str:
+    """Encodes the last ``(order_by value, id)`` of a page into an opaque token."""
+    if isinstance(value, Enum):
+        value = value.value
+    elif isinstance(value, (date, datetime, time)):
+        value = value.isoformat()
+    payload = {"k": order_by, "d": int(descending), "v": value, "id": last_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, descending: bool) -> tuple[Any, int]:
+    """
+    Returns the ``(value, id)`` pair stored in ``cursor``.
+
+    The cursor must have been issued for the same ``order_by``/``order``
+    combination, otherwise the seek position would be meaningless.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, desc, value, last_id = (
+            payload["k"],
+            bool(payload["d"]),
+            payload["v"],
+            int(payload["id"]),
+        )
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidInputException("Invalid pagination cursor.")
+    if key != order_by or desc != descending:
+        raise InvalidInputException(
+            "Pagination cursor does not match the requested order_by/order."
+        )
+    return value, last_id
@@ -8,7 +8,10 @@ class GetDosenPort(BaseModel):
     nidn: Optional[str] = None
     nama: Optional[str] = None
     email: Optional[str] = None
+    q: Optional[str] = None
     order_by: Optional[str] = None
     order: Optional[str] = None
     limit: Optional[int] = None
     page: Optional[int] = None
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
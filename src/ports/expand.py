@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+from typing import Optional
+
+from src.application.exceptions import InvalidInputException
+
+
+def parse_expand(expand: Optional[str], allowed: Sequence[str]) -> Optional[list[str]]:
+    """Splits a comma-separated ``expand`` value, checking names against ``allowed``."""
+    if not expand:
+        return None
+    names = list(dict.fromkeys(n.strip() for n in expand.split(",") if n.strip()))
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise InvalidInputException(
+            f"Cannot expand {', '.join(unknown)}. "
+            f"Expandable relations: {', '.join(allowed)}."
+        )
+    return names or None
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.application.exceptions import InvalidInputException
+
+
+def parse_fields(
+    fields: Optional[str], dto_type: type[BaseModel]
+) -> Optional[list[str]]:
+    """
+    Splits a comma-separated ``fields`` value, checking names against the fields
+    of ``dto_type``. ``id`` is always part of the projection and comes first.
+    """
+    if not fields:
+        return None
+    names = [n.strip() for n in fields.split(",") if n.strip()]
+    allowed = dto_type.model_fields
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise InvalidInputException(
+            f"Unknown fields: {', '.join(unknown)}. "
+            f"Available fields: {', '.join(allowed)}."
+        )
+    return list(dict.fromkeys(["id", *names]))
@@ -5,7 +5,10 @@ from typing import Optional
 
 @dataclass
 class GetBasePort(ABC):
+    q: Optional[str] = None
     order_by: Optional[str] = None
     order: Optional[str] = None
     limit: Optional[int] = None
     page: Optional[int] = None
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
@@ -3,6 +3,9 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+# Relations that ``expand`` can embed in the response.
+JADWAL_EXPANDABLE = ("dosen", "mata_kuliah")
+
 
 class GetJadwalPort(BaseModel):
     id: Optional[int] = None
@@ -12,7 +15,11 @@ class GetJadwalPort(BaseModel):
     ruangan: Optional[str] = None
     mata_kuliah_id: Optional[int] = None
     dosen_id: Optional[int] = None
+    q: Optional[str] = None
     order_by: Optional[str] = None
     order: Optional[str] = None
     limit: Optional[int] = None
     page: Optional[int] = None
+    cursor: Optional[str] = None
+    expand: Optional[list[str]] = None
+    fields: Optional[list[str]] = None
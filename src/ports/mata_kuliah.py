@@ -8,7 +8,10 @@ class GetMataKuliahPort(BaseModel):
     kode_mk: Optional[str] = None
     nama_mk: Optional[str] = None
     sks: Optional[int] = None
+    q: Optional[str] = None
     order_by: Optional[str] = None
     order: Optional[str] = None
     limit: Optional[int] = None
     page: Optional[int] = None
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
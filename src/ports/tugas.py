@@ -5,6 +5,20 @@ from pydantic import BaseModel
 
 from src.application.dtos.tugas_dto import StatusTugas
 
+# Relations that ``expand`` can embed in the response.
+TUGAS_EXPANDABLE = ("mahasiswa", "mata_kuliah")
+
+# Fields of a list response without ``fields``. deskripsi is unbounded text that
+# list views never show, so it is only loaded when asked for by name.
+TUGAS_LIST_FIELDS = (
+    "id",
+    "judul",
+    "deadline",
+    "status",
+    "mata_kuliah_id",
+    "mahasiswa_id",
+)
+
 
 class GetTugasPort(BaseModel):
     id: Optional[int] = None
@@ -14,7 +28,11 @@ class GetTugasPort(BaseModel):
     mahasiswa_id: Optional[int] = None
     deadline_from: Optional[datetime] = None
     deadline_to: Optional[datetime] = None
+    q: Optional[str] = None
     order_by: Optional[str] = None
     order: Optional[str] = None
     limit: Optional[int] = None
     page: Optional[int] = None
+    cursor: Optional[str] = None
+    expand: Optional[list[str]] = None
+    fields: Optional[list[str]] = None
@@ -0,0 +1,307 @@
+"""
+In-process read-through cache for reference data.
+
+Mata kuliah and dosen change rarely but are read on almost every request, so
+their repositories are wrapped in a cache keyed on the normalized Get*Port.
+Every write through the wrapper invalidates the whole resource, since any
+cached page may contain (or now need to contain) the changed row. Entries also
+remember the table's change version when they were loaded and are dropped once
+the process has seen a newer one, which catches writes made through other
+code paths, or by other processes once a list ETag check has read the new
+version. The TTL bounds staleness in every remaining case.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterator
+from typing import Any, Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+from typing_extensions import override
+
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
+from src.application.dtos.dosen_dto import CreateDosenDto, DosenDto, UpdateDosenDto
+from src.application.dtos.mata_kuliah_dto import (
+    CreateMataKuliahDto,
+    MataKuliahDto,
+    UpdateMataKuliahDto,
+)
+from src.application.dtos.upsert_dto import UpsertResultDto
+from src.application.usecases.interfaces.dosen_repository import (
+    DosenRepositoryInterface,
+)
+from src.application.usecases.interfaces.mata_kuliah_repository import (
+    MataKuliahRepositoryInterface,
+)
+from src.ports.changes import GetChangesPort
+from src.ports.dosen import GetDosenPort
+from src.ports.mata_kuliah import GetMataKuliahPort
+from src.repositories.database.core import config
+from src.repositories.database.versions import known_version
+
+T = TypeVar("T")
+
+
+def cache_key(port: BaseModel) -> str:
+    """Canonical form of a query port: unset filters and field order don't matter."""
+    return json.dumps(port.model_dump(mode="json", exclude_none=True), sort_keys=True)
+
+
+class ReadCache(Generic[T]):
+    """
+    Thread-safe LRU cache whose entries expire ``ttl`` seconds after loading,
+    or as soon as ``version()`` no longer returns the value seen at load time.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        version: Optional[Callable[[], int]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._version = version or (lambda: 0)
+        self._entries: OrderedDict[str, tuple[float, int, T]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a load that started before one is
+        # not stored, so a read racing a write cannot re-cache stale rows.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: str, load: Callable[[], T]) -> T:
+        version = self._version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock() and entry[1] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (self._clock() + self.ttl, version, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Drops all entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+            }
+
+
+mata_kuliah_cache: ReadCache[CursorPageDto[MataKuliahDto]] = ReadCache(
+    config.CACHE_MAX_ENTRIES,
+    config.CACHE_TTL_SECONDS,
+    version=lambda: known_version("mata_kuliah"),
+)
+dosen_cache: ReadCache[CursorPageDto[DosenDto]] = ReadCache(
+    config.CACHE_MAX_ENTRIES,
+    config.CACHE_TTL_SECONDS,
+    version=lambda: known_version("dosen"),
+)
+
+# Totals of filters matching more than COUNT_EXACT_LIMIT rows, keyed on the
+# table's change version and the compiled filter (see database/counting.py).
+count_cache: ReadCache[int] = ReadCache(
+    config.CACHE_MAX_ENTRIES, config.CACHE_TTL_SECONDS
+)
+
+
+def cache_enabled() -> bool:
+    return config.CACHE_TTL_SECONDS > 0 and config.CACHE_MAX_ENTRIES > 0
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    return {
+        "mata_kuliah": mata_kuliah_cache.stats(),
+        "dosen": dosen_cache.stats(),
+        "count": count_cache.stats(),
+    }
+
+
+class CachedMataKuliahRepository(MataKuliahRepositoryInterface):
+    def __init__(
+        self,
+        repository: MataKuliahRepositoryInterface,
+        cache: ReadCache[CursorPageDto[MataKuliahDto]] = mata_kuliah_cache,
+    ):
+        self.repository = repository
+        self.cache = cache
+
+    @override
+    def create(self, mata_kuliah_dto: CreateMataKuliahDto) -> MataKuliahDto:
+        try:
+            return self.repository.create(mata_kuliah_dto)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def read_page(
+        self, get_mata_kuliah_port: GetMataKuliahPort
+    ) -> CursorPageDto[MataKuliahDto]:
+        return self.cache.get_or_load(
+            cache_key(get_mata_kuliah_port),
+            lambda: self.repository.read_page(get_mata_kuliah_port),
+        )
+
+    @override
+    def read(self, get_mata_kuliah_port: GetMataKuliahPort) -> list[MataKuliahDto]:
+        return list(self.read_page(get_mata_kuliah_port).items)
+
+    @override
+    def stream(
+        self, get_mata_kuliah_port: GetMataKuliahPort
+    ) -> Iterator[MataKuliahDto]:
+        # Exports are one-off full scans; caching them would only evict pages.
+        return self.repository.stream(get_mata_kuliah_port)
+
+    @override
+    def count(self, get_mata_kuliah_port: GetMataKuliahPort) -> CountDto:
+        return self.repository.count(get_mata_kuliah_port)
+
+    @override
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[MataKuliahDto]:
+        return self.repository.changes(get_changes_port)
+
+    @override
+    def update(self, mata_kuliah_dto: UpdateMataKuliahDto) -> MataKuliahDto:
+        try:
+            return self.repository.update(mata_kuliah_dto)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def delete(self, mata_kuliah_id: int) -> bool:
+        try:
+            return self.repository.delete(mata_kuliah_id)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def bulk_create(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> list[MataKuliahDto]:
+        try:
+            return self.repository.bulk_create(mata_kuliah_dtos)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def upsert(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> UpsertResultDto[MataKuliahDto]:
+        try:
+            return self.repository.upsert(mata_kuliah_dtos)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        return self.repository.read_existing_values(field_name, values)
+
+
+class CachedDosenRepository(DosenRepositoryInterface):
+    def __init__(
+        self,
+        repository: DosenRepositoryInterface,
+        cache: ReadCache[CursorPageDto[DosenDto]] = dosen_cache,
+    ):
+        self.repository = repository
+        self.cache = cache
+
+    @override
+    def create(self, dosen_dto: CreateDosenDto) -> DosenDto:
+        try:
+            return self.repository.create(dosen_dto)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def read_page(self, get_dosen_port: GetDosenPort) -> CursorPageDto[DosenDto]:
+        return self.cache.get_or_load(
+            cache_key(get_dosen_port),
+            lambda: self.repository.read_page(get_dosen_port),
+        )
+
+    @override
+    def read(self, get_dosen_port: GetDosenPort) -> list[DosenDto]:
+        return list(self.read_page(get_dosen_port).items)
+
+    @override
+    def stream(self, get_dosen_port: GetDosenPort) -> Iterator[DosenDto]:
+        return self.repository.stream(get_dosen_port)
+
+    @override
+    def count(self, get_dosen_port: GetDosenPort) -> CountDto:
+        return self.repository.count(get_dosen_port)
+
+    @override
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[DosenDto]:
+        return self.repository.changes(get_changes_port)
+
+    @override
+    def update(self, dosen_dto: UpdateDosenDto) -> DosenDto:
+        try:
+            return self.repository.update(dosen_dto)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def delete(self, dosen_id: int) -> bool:
+        try:
+            return self.repository.delete(dosen_id)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def bulk_create(self, dosen_dtos: list[CreateDosenDto]) -> list[DosenDto]:
+        try:
+            return self.repository.bulk_create(dosen_dtos)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def upsert(self, dosen_dtos: list[CreateDosenDto]) -> UpsertResultDto[DosenDto]:
+        try:
+            return self.repository.upsert(dosen_dtos)
+        finally:
+            self.cache.invalidate()
+
+    @override
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        return self.repository.read_existing_values(field_name, values)
@@ -0,0 +1,23 @@
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.repositories.database.core import Base
+
+# Keeps IN (...) lists well below the bind-parameter limits of every backend.
+EXISTENCE_CHECK_CHUNK_SIZE = 1000
+
+
+def read_existing_values(
+    session: Session, model: type[Base], field_name: str, values: Collection[Any]
+) -> set[Any]:
+    """Set-based lookup of which ``values`` already exist in ``field_name``."""
+    column = getattr(model, field_name)
+    pending = list(set(values))
+    existing: set[Any] = set()
+    for start in range(0, len(pending), EXISTENCE_CHECK_CHUNK_SIZE):
+        chunk = pending[start : start + EXISTENCE_CHECK_CHUNK_SIZE]
+        existing.update(session.scalars(select(column).where(column.in_(chunk))))
+    return existing
@@ -0,0 +1,68 @@
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import inspect, literal, select
+from sqlalchemy.orm import Session
+
+from src.application.dtos.changes_dto import ChangesDto
+from src.ports.changes import CHANGES_ORDER_BY, GetChangesPort
+from src.ports.cursor import encode_cursor
+from src.repositories.database.core import Base, config
+from src.repositories.database.models.timestamps import utc_now
+from src.repositories.database.pagination import (
+    cursor_position,
+    order_clauses,
+    seek_predicate,
+)
+
+
+def read_changes(
+    session: Session,
+    model: type[Base],
+    port: GetChangesPort,
+    is_deleted: Callable[[Any], bool],
+) -> ChangesDto[Any]:
+    """
+    The next ``port.limit`` rows of ``model`` by ``(updated_at, id)`` after the
+    ``port.since`` token, split into live rows and tombstones (rows for which
+    ``is_deleted`` holds). Soft-deleted rows are included on purpose, so that
+    clients learn about the deletion.
+
+    Rows updated within the last CHANGES_SAFETY_LAG_SECONDS are left for a
+    later call: their ``updated_at`` was stamped before commit, and a
+    transaction still in flight may yet commit a row stamped before them.
+    """
+    settled = utc_now() - timedelta(seconds=config.CHANGES_SAFETY_LAG_SECONDS)
+    stmt = select(model).where(getattr(model, CHANGES_ORDER_BY) <= settled)
+    if port.since:
+        value, last_id = cursor_position(model, port.since, CHANGES_ORDER_BY, False)
+        column_type = inspect(model).columns[CHANGES_ORDER_BY].type
+        value_literal = None if value is None else literal(value, column_type)
+        stmt = stmt.where(
+            seek_predicate(
+                model, CHANGES_ORDER_BY, False, value_literal, literal(last_id)
+            )
+        )
+    stmt = stmt.order_by(*order_clauses(model, CHANGES_ORDER_BY, False))
+    instances: Sequence[Any] = session.scalars(stmt.limit(port.limit)).all()
+    changed = []
+    deleted = []
+    for instance in instances:
+        if is_deleted(instance):
+            deleted.append(instance.id)
+        else:
+            changed.append(instance.to_entity())
+
+    next_token = port.since
+    if instances:
+        last = instances[-1]
+        next_token = encode_cursor(
+            CHANGES_ORDER_BY, False, getattr(last, CHANGES_ORDER_BY), last.id
+        )
+    return ChangesDto(
+        changed=changed,
+        deleted=deleted,
+        next_token=next_token,
+        has_more=len(instances) == port.limit,
+    )
@@ -1,31 +1,231 @@
+import logging
 from abc import abstractmethod
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
+from itertools import islice
+from typing import Any, Optional, TypeVar
 
-from sqlalchemy import create_engine
+from anyio import to_thread
+from pydantic import BaseModel
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from src.config import Config  # Import the Config class
+from src.repositories.database.instrumentation import install_query_instrumentation
 
 # Initialize Config to load environment variables
 config = Config()
 
+logger = logging.getLogger(__name__)
+
+SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SQLITE_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def sqlite_pragmas() -> dict[str, Any]:
+    """The PRAGMA profile applied to every new SQLite connection."""
+    journal_mode = config.SQLITE_JOURNAL_MODE.upper()
+    synchronous = config.SQLITE_SYNCHRONOUS.upper()
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ValueError(f"Unsupported SQLITE_JOURNAL_MODE: {journal_mode}")
+    if synchronous not in SQLITE_SYNCHRONOUS_MODES:
+        raise ValueError(f"Unsupported SQLITE_SYNCHRONOUS: {synchronous}")
+    return {
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_MS,
+        "cache_size": config.SQLITE_CACHE_SIZE,
+        "mmap_size": config.SQLITE_MMAP_SIZE,
+        "temp_store": "MEMORY",
+    }
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """create_engine()/create_async_engine() keyword arguments for ``url``."""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {"connect_args": {"check_same_thread": False}}
+    return {
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+
+
+def install_sqlite_pragmas(target: Engine) -> None:
+    if target.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(target, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def describe_engine(target: Engine) -> dict[str, Any]:
+    """Effective settings of ``target``, read back from a live connection."""
+    settings: dict[str, Any] = {
+        "url": target.url.render_as_string(hide_password=True)
+    }
+    if target.dialect.name == "sqlite":
+        with target.connect() as connection:
+            for name in sqlite_pragmas():
+                pragma = connection.exec_driver_sql(f"PRAGMA {name}")
+                settings[name] = pragma.scalar()
+    else:
+        settings.update(
+            pool_class=type(target.pool).__name__,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+            pool_pre_ping=config.DB_POOL_PRE_PING,
+        )
+    return settings
+
+
+def log_engine_settings() -> None:
+    logger.info("Database engine settings: %s", describe_engine(engine))
+    if async_engine is not None:
+        logger.info(
+            "Async database engine settings: %s",
+            describe_engine(async_engine.sync_engine),
+        )
+
+
 engine: Engine = create_engine(
-    config.DATABASE_URL, connect_args={"check_same_thread": False}
+    config.DATABASE_URL, **engine_options(config.DATABASE_URL)
 )
+install_sqlite_pragmas(engine)
+install_query_instrumentation(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Only created in DB_MODE=async so the async driver stays an optional install.
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+if config.is_async:
+    async_engine = create_async_engine(
+        config.ASYNC_DATABASE_URL, **engine_options(config.ASYNC_DATABASE_URL)
+    )
+    install_sqlite_pragmas(async_engine.sync_engine)
+    install_query_instrumentation(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+T = TypeVar("T")
+DtoT = TypeVar("DtoT", bound=BaseModel)
+
 
 class Base(DeclarativeBase):
     @abstractmethod
     def to_entity(self):
+        """
+        The row as its DTO. Values read back from the database already satisfy
+        the schema, so implementations build it with ``construct_dto``.
+        """
         raise NotImplementedError("Subclasses must implement to_entity method")
 
 
+def construct_dto(
+    dto_type: type[DtoT], _fields_set: Optional[set[str]] = None, **values: Any
+) -> DtoT:
+    """
+    An instance of ``dto_type`` holding ``values`` as-is, without validation.
+
+    ``values`` must name every field of ``dto_type``. This is the state
+    ``model_construct`` ends up building, minus its per-field default and alias
+    handling, which on a flat DTO costs more than validating would. As with
+    ``model_construct``, ``_fields_set`` defaults to every name in ``values``.
+    It relies on pydantic's instance layout, so the tests compare its result
+    with ``model_validate`` for the DTO of every model.
+    """
+    dto = dto_type.__new__(dto_type)
+    object.__setattr__(dto, "__dict__", values)
+    if _fields_set is None:
+        _fields_set = set(values)
+    object.__setattr__(dto, "__pydantic_fields_set__", _fields_set)
+    object.__setattr__(dto, "__pydantic_extra__", None)
+    object.__setattr__(dto, "__pydantic_private__", None)
+    return dto
+
+
 def get_db_session() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async sessions require DB_MODE=async.")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+class SessionRunner:
+    """
+    Runs synchronous repository/service code against a request's session
+    without blocking the event loop.
+    """
+
+    async def run(self, work: Callable[[Session], T]) -> T:
+        raise NotImplementedError("Subclasses must implement run method")
+
+    async def stream(
+        self, work: Callable[[Session], Iterator[T]], batch_size: int
+    ) -> AsyncIterator[list[T]]:
+        """
+        Yields the items of the iterator returned by ``work`` in batches, each
+        batch pulled through ``run`` so that the database reads behind the
+        iterator never block the event loop.
+        """
+        iterator: Optional[Iterator[T]] = None
+
+        def next_batch(session: Session) -> list[T]:
+            nonlocal iterator
+            if iterator is None:
+                iterator = work(session)
+            return list(islice(iterator, batch_size))
+
+        while batch := await self.run(next_batch):
+            yield batch
+
+
+class ThreadpoolSessionRunner(SessionRunner):
+    """DB_MODE=sync: each unit of work occupies a threadpool slot."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run(self, work: Callable[[Session], T]) -> T:
+        return await to_thread.run_sync(work, self.session)
+
+
+class AsyncSessionRunner(SessionRunner):
+    """
+    DB_MODE=async: the work runs through ``AsyncSession.run_sync``, i.e. on the
+    event loop with every database round trip awaited on the async driver, so
+    concurrency is bounded by the connection pool rather than the threadpool.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def run(self, work: Callable[[Session], T]) -> T:
+        return await self.session.run_sync(work)
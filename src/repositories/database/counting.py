@@ -0,0 +1,104 @@
+"""
+Row counts behind ``GET /<resource>/count`` and ``include_total``.
+
+A count first runs ``COUNT(*)`` over at most COUNT_EXACT_LIMIT + 1 matching
+rows, so its cost is bounded by the limit however large the table is; with an
+indexed filter that is a range scan of the index. Only a filter matching more
+rows than that gets a cheaper total: the planner's row estimate on PostgreSQL,
+elsewhere a full count that is computed once and then served from
+``count_cache`` until the table's change version moves or the TTL runs out.
+"""
+
+import json
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Optional, cast
+
+from sqlalchemy import Integer, Select, Table, bindparam, func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.application.dtos.count_dto import CountDto
+from src.repositories.cache import count_cache
+from src.repositories.database.core import Base, config
+from src.repositories.database.query import STATEMENT_CACHE_SIZE
+from src.repositories.database.versions import known_version
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, stmt: Select):
+        self.stmt = stmt
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _count_statements(
+    model: type[Base], filtered: Select
+) -> tuple[Select, Select, Select]:
+    """
+    The ids selected by ``filtered``, the count of at most ``:count_limit`` of
+    them and the full count. Keyed on the ``filtered`` statement itself, which
+    QuerySpec reuses for every query of the same shape.
+    """
+    ids = filtered.with_only_columns(getattr(model, "id"))
+    bounded = ids.limit(bindparam("count_limit", type_=Integer))
+    return ids, _count(bounded), _count(ids)
+
+
+def _count(stmt: Select) -> Select:
+    return select(func.count()).select_from(stmt.subquery())
+
+
+def _planner_estimate(
+    session: Session, stmt: Select, params: Mapping[str, Any]
+) -> int:
+    plan = session.execute(_Explain(stmt), params).scalar_one()
+    if isinstance(plan, str):  # asyncpg does not decode json
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _cached_count(
+    session: Session, model: type[Base], stmt: Select, params: Mapping[str, Any]
+) -> int:
+    table_name = cast(Table, model.__table__).name
+    compiled = stmt.compile(dialect=session.get_bind().dialect)
+    key = json.dumps(
+        [table_name, known_version(table_name), str(compiled), sorted(params.items())],
+        default=str,
+    )
+    return count_cache.get_or_load(
+        key, lambda: session.execute(stmt, params).scalar_one()
+    )
+
+
+def count_rows(
+    session: Session,
+    model: type[Base],
+    filtered: Select,
+    params: Optional[Mapping[str, Any]] = None,
+) -> CountDto:
+    """
+    Number of rows of ``model`` selected by the filtered query ``filtered``
+    executed with ``params``.
+    """
+    params = dict(params or {})
+    ids, bounded, full = _count_statements(model, filtered)
+    limit = config.COUNT_EXACT_LIMIT
+    if limit <= 0:
+        return CountDto(count=session.execute(full, params).scalar_one(), exact=True)
+
+    count = session.execute(bounded, {**params, "count_limit": limit + 1}).scalar_one()
+    if count <= limit:
+        return CountDto(count=count, exact=True)
+    if session.get_bind().dialect.name == "postgresql":
+        estimate = _planner_estimate(session, ids, params)
+        return CountDto(count=max(estimate, count), exact=False)
+    return CountDto(count=_cached_count(session, model, full, params), exact=False)
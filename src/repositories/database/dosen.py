@@ -1,20 +1,49 @@
+from collections.abc import Collection, Iterator
 from typing import Optional
 from typing_extensions import override
 
-from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.dosen_dto import (
     CreateDosenDto,
     DosenDto,
     UpdateDosenDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
+from src.application.enums import DosenStatus
 from src.application.exceptions import NotFoundException
 from src.application.usecases.interfaces.dosen_repository import (
     DosenRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.dosen import GetDosenPort
+from src.repositories.database import bulk
+from src.repositories.database.changes import read_changes
+from src.repositories.database.counting import count_rows
+from src.repositories.database.errors import translate_unique_violations
 from src.repositories.database.models.dosen import DosenModel
+from src.repositories.database.projection import entity_converter
+from src.repositories.database.query import Filter, QuerySpec
+from src.repositories.database.streaming import stream_entities
+from src.repositories.database.writes import (
+    insert_returning,
+    update_returning,
+    upsert_returning,
+)
+
+
+DOSEN_QUERY = QuerySpec(
+    DosenModel,
+    filters=[
+        Filter("id"),
+        Filter("nidn"),
+        Filter("nama", "contains"),
+        Filter("email", "contains"),
+    ],
+    sortable=("nidn", "nama", "email", "status", "created_at", "updated_at"),
+)
 
 
 class DosenRepository(DosenRepositoryInterface):
@@ -23,65 +52,55 @@ class DosenRepository(DosenRepositoryInterface):
 
     @override
     def create(self, dosen_dto: CreateDosenDto) -> DosenDto:
-        dosen_model = DosenModel(
-            nidn=dosen_dto.nidn,
-            nama=dosen_dto.nama,
-            email=dosen_dto.email,
-            status=dosen_dto.status,
+        values = dosen_dto.model_dump()
+        with translate_unique_violations(self.session, DosenModel, "Dosen", values):
+            [created] = insert_returning(self.session, DosenModel, [values])
+        return created
+
+    @override
+    def read_page(self, get_dosen_port: GetDosenPort) -> CursorPageDto[DosenDto]:
+        query = DOSEN_QUERY.select(self.session, get_dosen_port)
+        dosen_models = self.session.scalars(query.statement, query.params).all()
+        convert = entity_converter(DosenModel, DosenDto, get_dosen_port)
+        return CursorPageDto[DosenDto](
+            items=[convert(d) for d in dosen_models],
+            next_cursor=DOSEN_QUERY.next_cursor(dosen_models, get_dosen_port),
         )
-        self.session.add(dosen_model)
-        self.session.commit()
-        self.session.refresh(dosen_model)
-        return dosen_model.to_entity()
 
     @override
     def read(self, get_dosen_port: GetDosenPort) -> list[DosenDto]:
-        stmt = select(DosenModel)
-
-        filters = []
-        if get_dosen_port.id:
-            filters.append(DosenModel.id == get_dosen_port.id)
-        if get_dosen_port.nidn:
-            filters.append(DosenModel.nidn == get_dosen_port.nidn)
-        if get_dosen_port.nama:
-            filters.append(DosenModel.nama.ilike(f"%{get_dosen_port.nama}%"))
-        if get_dosen_port.email:
-            filters.append(DosenModel.email.ilike(f"%{get_dosen_port.email}%"))
-
-        if filters:
-            stmt = stmt.where(and_(*filters))
-
-        if get_dosen_port.order_by:
-            order_column = getattr(DosenModel, get_dosen_port.order_by, None)
-            if order_column:
-                if get_dosen_port.order and get_dosen_port.order.lower() == "desc":
-                    stmt = stmt.order_by(order_column.desc())
-                else:
-                    stmt = stmt.order_by(order_column.asc())
-
-        if get_dosen_port.limit:
-            stmt = stmt.limit(get_dosen_port.limit)
-        if get_dosen_port.page and get_dosen_port.limit:
-            stmt = stmt.offset((get_dosen_port.page - 1) * get_dosen_port.limit)
-
-        dosen_models = self.session.execute(stmt).scalars().all()
-        return [d.to_entity() for d in dosen_models]
+        return self.read_page(get_dosen_port).items
 
     @override
-    def update(self, dosen_dto: UpdateDosenDto) -> DosenDto:
-        dosen_model: Optional[DosenModel] = self.session.get(DosenModel, dosen_dto.id)
-        if not dosen_model:
-            raise NotFoundException(resource_name="Dosen", identifier=dosen_dto.id)
+    def stream(self, get_dosen_port: GetDosenPort) -> Iterator[DosenDto]:
+        query = DOSEN_QUERY.select(self.session, get_dosen_port)
+        convert = entity_converter(DosenModel, DosenDto, get_dosen_port)
+        return stream_entities(self.session, query.statement, convert, query.params)
 
-        dosen_model.nidn = dosen_dto.nidn
-        dosen_model.nama = dosen_dto.nama
-        dosen_model.email = dosen_dto.email
-        dosen_model.status = dosen_dto.status
+    @override
+    def count(self, get_dosen_port: GetDosenPort) -> CountDto:
+        query = DOSEN_QUERY.filtered(self.session, get_dosen_port)
+        return count_rows(self.session, DosenModel, query.statement, query.params)
 
-        self.session.add(dosen_model)
-        self.session.commit()
-        self.session.refresh(dosen_model)
-        return dosen_model.to_entity()
+    @override
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[DosenDto]:
+        return read_changes(
+            self.session,
+            DosenModel,
+            get_changes_port,
+            is_deleted=lambda d: d.status == DosenStatus.INACTIVE,
+        )
+
+    @override
+    def update(self, dosen_dto: UpdateDosenDto) -> DosenDto:
+        values = dosen_dto.model_dump(exclude={"id"})
+        with translate_unique_violations(
+            self.session, DosenModel, "Dosen", values
+        ):
+            updated = update_returning(self.session, DosenModel, dosen_dto.id, values)
+        if updated is None:
+            raise NotFoundException(resource_name="Dosen", identifier=dosen_dto.id)
+        return updated
 
     @override
     def delete(self, dosen_id: int) -> bool:
@@ -94,3 +113,28 @@ class DosenRepository(DosenRepositoryInterface):
         self.session.add(dosen_model)
         self.session.commit()
         return True
+
+    @override
+    def bulk_create(self, dosen_dtos: list[CreateDosenDto]) -> list[DosenDto]:
+        rows = [dto.model_dump() for dto in dosen_dtos]
+        with translate_unique_violations(self.session, DosenModel, "Dosen", {}):
+            return insert_returning(self.session, DosenModel, rows)
+
+    @override
+    def upsert(self, dosen_dtos: list[CreateDosenDto]) -> UpsertResultDto[DosenDto]:
+        rows = [dto.model_dump() for dto in dosen_dtos]
+        with translate_unique_violations(self.session, DosenModel, "Dosen", {}):
+            upserted = upsert_returning(self.session, DosenModel, rows, "nidn")
+        return UpsertResultDto[DosenDto](
+            created=upserted.created,
+            updated=upserted.updated,
+            unchanged=upserted.unchanged,
+        )
+
+    @override
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        if field_name not in ("nidn", "email"):
+            raise ValueError(f"{field_name} is not a unique Dosen field")
+        return bulk.read_existing_values(self.session, DosenModel, field_name, values)
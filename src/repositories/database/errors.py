@@ -0,0 +1,108 @@
+"""
+Translation of database constraint violations into application exceptions.
+
+Uniqueness is enforced by the database's unique constraints rather than by a
+read before every write: the write is attempted directly and a violation is
+turned into a DuplicateEntryException naming the offending field. This costs
+no extra round trip and stays correct when concurrent requests race. Jadwal
+double-bookings are checked by the service up front, and database guards
+(triggers or exclusion constraints) turn away the concurrent write that slips
+in between; those violations become a ScheduleConflictException.
+"""
+
+import re
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any, Optional, cast
+
+from sqlalchemy import Table
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.application.exceptions import (
+    DuplicateEntryException,
+    ScheduleConflictException,
+)
+from src.repositories.database.core import Base
+
+# SQLite: "UNIQUE constraint failed: mahasiswa.nim"
+_SQLITE_UNIQUE_FAILED = re.compile(r"UNIQUE constraint failed: (\w+)\.(\w+)")
+# PostgreSQL: "DETAIL:  Key (nim)=(2024000001) already exists."
+_POSTGRES_KEY_DETAIL = re.compile(r"Key \((\w+)\)=\(.*\) already exists")
+
+
+def unique_violation_column(error: IntegrityError, table: Table) -> Optional[str]:
+    """
+    Name of the column of ``table`` whose unique constraint ``error`` violated,
+    or None when ``error`` is some other integrity error.
+    """
+    unique_columns = {c.name for c in table.columns if c.unique}
+    diag = getattr(error.orig, "diag", None)  # psycopg / psycopg2
+    constraint_name = getattr(diag, "constraint_name", None)
+    if constraint_name:
+        for column_name in unique_columns:
+            # Default names of a UniqueConstraint and of a unique=True index.
+            if constraint_name in (
+                f"{table.name}_{column_name}_key",
+                f"ix_{table.name}_{column_name}",
+            ):
+                return column_name
+
+    message = str(error.orig)
+    match = _SQLITE_UNIQUE_FAILED.search(message)
+    if match and match.group(1) == table.name and match.group(2) in unique_columns:
+        return match.group(2)
+    match = _POSTGRES_KEY_DETAIL.search(message)
+    if match and match.group(1) in unique_columns:
+        return match.group(1)
+    return None
+
+
+@contextmanager
+def translate_unique_violations(
+    session: Session,
+    model: type[Base],
+    resource_name: str,
+    values: Mapping[str, Any],
+    field_labels: Optional[Mapping[str, str]] = None,
+) -> Iterator[None]:
+    """
+    Rolls back and raises DuplicateEntryException when the wrapped write
+    violates a unique constraint of ``model``; ``values`` supplies the
+    offending value for the message and ``field_labels`` optional display
+    names for the fields. Other integrity errors are rolled back and re-raised.
+    """
+    try:
+        yield
+    except IntegrityError as error:
+        session.rollback()
+        column_name = unique_violation_column(error, cast(Table, model.__table__))
+        if column_name is None:
+            raise
+        raise DuplicateEntryException(
+            resource_name=resource_name,
+            field_name=(field_labels or {}).get(column_name, column_name),
+            field_value=values.get(column_name),
+        ) from error
+
+
+@contextmanager
+def translate_schedule_conflicts(
+    session: Session, guards: Mapping[str, str]
+) -> Iterator[None]:
+    """
+    Rolls back and raises ScheduleConflictException when the wrapped write is
+    rejected by one of ``guards``, a mapping of trigger or constraint name to
+    the conflict message. Other integrity errors are rolled back and re-raised.
+    """
+    try:
+        yield
+    except IntegrityError as error:
+        session.rollback()
+        # Both the SQLite RAISE() message and the PostgreSQL exclusion
+        # violation carry the guard's name.
+        reported = str(error.orig)
+        for guard, message in guards.items():
+            if guard in reported:
+                raise ScheduleConflictException(message) from error
+        raise
@@ -0,0 +1,76 @@
+"""
+Per-request accounting of the SQL statements an engine executes.
+
+``install_query_instrumentation`` hooks ``before_cursor_execute`` and
+``after_cursor_execute`` on an engine; every statement run while a
+``track_queries()`` block is active is added to that block's QueryStats. The
+stats live in a context variable, which anyio copies into the worker threads
+of DB_MODE=sync and which ``AsyncSession.run_sync`` never leaves, so they
+follow a request's work in both modes. Outside a tracked block the hooks only
+cost a context variable lookup.
+"""
+
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one ``track_queries()`` block."""
+
+    count: int = 0
+    # Seconds spent inside the DBAPI cursor calls.
+    duration: float = 0.0
+    # Executions per SQL string, i.e. per statement shape.
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed more than ``threshold`` times."""
+        return [(sql, n) for sql, n in self.shapes.most_common() if n > threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_started", None)
+    stats = _current_stats.get()
+    if stats is None or started is None:
+        return
+    stats.duration += time.perf_counter() - started
+    stats.count += 1
+    stats.shapes[statement] += 1
+
+
+def install_query_instrumentation(target: Union[Engine, Connection]) -> None:
+    for name, hook in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        if not event.contains(target, name, hook):
+            event.listen(target, name, hook)
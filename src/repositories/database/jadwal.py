@@ -1,11 +1,15 @@
+from collections.abc import Callable, Iterator
 from typing import Optional
 from typing_extensions import override
 
-from sqlalchemy import and_, select
+from sqlalchemy import Integer, String, Time, and_, column, select, values
 from sqlalchemy.orm import Session
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.jadwal_dto import (
     CreateJadwalDto,
+    JadwalDetailDto,
     JadwalDto,
     UpdateJadwalDto,
 )
@@ -13,8 +17,63 @@ from src.application.exceptions import NotFoundException
 from src.application.usecases.interfaces.jadwal_repository import (
     JadwalRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.jadwal import GetJadwalPort
-from src.repositories.database.models.jadwal import JadwalModel
+from src.repositories.database.changes import read_changes
+from src.repositories.database.counting import count_rows
+from src.repositories.database.errors import translate_schedule_conflicts
+from src.repositories.database.models.jadwal import BOOKING_GUARDS, JadwalModel
+from src.repositories.database.projection import entity_converter
+from src.repositories.database.query import Filter, QuerySpec
+from src.repositories.database.streaming import stream_entities
+from src.repositories.database.writes import insert_returning, update_returning
+
+# Proposed slots per overlap query; keeps the bind parameters of the VALUES
+# list well below the limits of every backend.
+OVERLAP_CHECK_CHUNK_SIZE = 500
+
+# Relationships loaded for each name accepted by ``expand``. selectinload keeps
+# the paginated main query untouched and costs one extra query per relation,
+# however many rows the page holds.
+EXPANDABLE_RELATIONS = {
+    "dosen": JadwalModel.dosen,
+    "mata_kuliah": JadwalModel.mata_kuliah,
+}
+
+
+JADWAL_QUERY = QuerySpec(
+    JadwalModel,
+    filters=[
+        Filter("id"),
+        Filter("hari", "contains"),
+        Filter("jam_mulai", "ge"),
+        Filter("jam_selesai", "le"),
+        Filter("ruangan", "contains"),
+        Filter("mata_kuliah_id"),
+        Filter("dosen_id"),
+    ],
+    sortable=(
+        "hari",
+        "jam_mulai",
+        "jam_selesai",
+        "ruangan",
+        "mata_kuliah_id",
+        "dosen_id",
+        "created_at",
+        "updated_at",
+    ),
+    # Soft-deleted jadwal are never listed.
+    where=[JadwalModel.is_active == True],  # noqa: E712
+    relations=EXPANDABLE_RELATIONS,
+)
+
+
+# Messages for a write rejected by a database double-booking guard, which only
+# happens when another request booked the slot after the service's check.
+BOOKING_CONFLICTS = {
+    BOOKING_GUARDS["ruangan"]: "Ruangan was just booked for an overlapping time.",
+    BOOKING_GUARDS["dosen_id"]: "Dosen was just booked for an overlapping time.",
+}
 
 
 class JadwalRepository(JadwalRepositoryInterface):
@@ -33,72 +92,70 @@ class JadwalRepository(JadwalRepositoryInterface):
             is_active=jadwal_dto.is_active,
         )
         self.session.add(jadwal_model)
-        self.session.commit()
+        with translate_schedule_conflicts(self.session, BOOKING_CONFLICTS):
+            self.session.commit()
         self.session.refresh(jadwal_model)
         return jadwal_model.to_entity()
 
+    def _converter(
+        self, get_jadwal_port: GetJadwalPort
+    ) -> Callable[[JadwalModel], JadwalDto]:
+        expand = get_jadwal_port.expand
+        if get_jadwal_port.fields:
+            dto_type = JadwalDetailDto if expand else JadwalDto
+            return entity_converter(JadwalModel, dto_type, get_jadwal_port)
+        if expand:
+            return lambda model: model.to_detail_entity(expand)
+        return JadwalModel.to_entity
+
+    @override
+    def read_page(self, get_jadwal_port: GetJadwalPort) -> CursorPageDto[JadwalDto]:
+        query = JADWAL_QUERY.select(self.session, get_jadwal_port)
+        jadwal_models = self.session.scalars(query.statement, query.params).all()
+        convert = self._converter(get_jadwal_port)
+        return CursorPageDto[JadwalDto](
+            items=[convert(j) for j in jadwal_models],
+            next_cursor=JADWAL_QUERY.next_cursor(jadwal_models, get_jadwal_port),
+        )
+
     @override
     def read(self, get_jadwal_port: GetJadwalPort) -> list[JadwalDto]:
-        stmt = select(JadwalModel)
-
-        filters = []
-        # Always filter by is_active=True (soft delete)
-        filters.append(JadwalModel.is_active == True)  # noqa: E712
-
-        if get_jadwal_port.id:
-            filters.append(JadwalModel.id == get_jadwal_port.id)
-        if get_jadwal_port.hari:
-            filters.append(JadwalModel.hari.ilike(f"%{get_jadwal_port.hari}%"))
-        if get_jadwal_port.jam_mulai:
-            filters.append(JadwalModel.jam_mulai >= get_jadwal_port.jam_mulai)
-        if get_jadwal_port.jam_selesai:
-            filters.append(JadwalModel.jam_selesai <= get_jadwal_port.jam_selesai)
-        if get_jadwal_port.ruangan:
-            filters.append(JadwalModel.ruangan.ilike(f"%{get_jadwal_port.ruangan}%"))
-        if get_jadwal_port.mata_kuliah_id:
-            filters.append(JadwalModel.mata_kuliah_id == get_jadwal_port.mata_kuliah_id)
-        if get_jadwal_port.dosen_id:
-            filters.append(JadwalModel.dosen_id == get_jadwal_port.dosen_id)
-
-        if filters:
-            stmt = stmt.where(and_(*filters))
-
-        if get_jadwal_port.order_by:
-            order_column = getattr(JadwalModel, get_jadwal_port.order_by, None)
-            if order_column:
-                if get_jadwal_port.order and get_jadwal_port.order.lower() == "desc":
-                    stmt = stmt.order_by(order_column.desc())
-                else:
-                    stmt = stmt.order_by(order_column.asc())
-
-        if get_jadwal_port.limit:
-            stmt = stmt.limit(get_jadwal_port.limit)
-        if get_jadwal_port.page and get_jadwal_port.limit:
-            stmt = stmt.offset((get_jadwal_port.page - 1) * get_jadwal_port.limit)
-
-        jadwal_models = self.session.execute(stmt).scalars().all()
-        return [j.to_entity() for j in jadwal_models]
+        return self.read_page(get_jadwal_port).items
 
     @override
-    def update(self, jadwal_dto: UpdateJadwalDto) -> JadwalDto:
-        jadwal_model: Optional[JadwalModel] = self.session.get(
-            JadwalModel, jadwal_dto.id
-        )
-        if not jadwal_model:
-            raise NotFoundException(resource_name="Jadwal", identifier=jadwal_dto.id)
+    def stream(self, get_jadwal_port: GetJadwalPort) -> Iterator[JadwalDto]:
+        query = JADWAL_QUERY.select(self.session, get_jadwal_port)
+        convert = self._converter(get_jadwal_port)
+        return stream_entities(self.session, query.statement, convert, query.params)
 
-        jadwal_model.hari = jadwal_dto.hari
-        jadwal_model.jam_mulai = jadwal_dto.jam_mulai
-        jadwal_model.jam_selesai = jadwal_dto.jam_selesai
-        jadwal_model.ruangan = jadwal_dto.ruangan
-        jadwal_model.mata_kuliah_id = jadwal_dto.mata_kuliah_id
-        jadwal_model.dosen_id = jadwal_dto.dosen_id
-        jadwal_model.is_active = jadwal_dto.is_active
+    @override
+    def count(self, get_jadwal_port: GetJadwalPort) -> CountDto:
+        query = JADWAL_QUERY.filtered(self.session, get_jadwal_port)
+        return count_rows(self.session, JadwalModel, query.statement, query.params)
 
-        self.session.add(jadwal_model)
-        self.session.commit()
-        self.session.refresh(jadwal_model)
-        return jadwal_model.to_entity()
+    @override
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[JadwalDto]:
+        return read_changes(
+            self.session,
+            JadwalModel,
+            get_changes_port,
+            is_deleted=lambda j: not j.is_active,
+        )
+
+    @override
+    def update(self, jadwal_dto: UpdateJadwalDto) -> JadwalDto:
+        values = jadwal_dto.model_dump(exclude={"id"})
+        with translate_schedule_conflicts(self.session, BOOKING_CONFLICTS):
+            updated = update_returning(
+                self.session,
+                JadwalModel,
+                jadwal_dto.id,
+                values,
+                JadwalModel.is_active.is_(True),
+            )
+        if updated is None:
+            raise NotFoundException(resource_name="Jadwal", identifier=jadwal_dto.id)
+        return updated
 
     @override
     def delete(self, jadwal_id: int) -> bool:
@@ -110,3 +167,69 @@ class JadwalRepository(JadwalRepositoryInterface):
         self.session.add(jadwal_model)
         self.session.commit()
         return True
+
+    @override
+    def bulk_create(self, jadwal_dtos: list[CreateJadwalDto]) -> list[JadwalDto]:
+        with translate_schedule_conflicts(self.session, BOOKING_CONFLICTS):
+            return insert_returning(
+                self.session, JadwalModel, [dto.model_dump() for dto in jadwal_dtos]
+            )
+
+    @override
+    def find_overlaps(
+        self,
+        jadwal_dtos: list[CreateJadwalDto],
+        field_name: str,
+        exclude_id: Optional[int] = None,
+    ) -> list[tuple[int, JadwalDto]]:
+        if field_name not in ("ruangan", "dosen_id"):
+            raise ValueError(f"{field_name} is not a bookable Jadwal field")
+        overlaps: list[tuple[int, JadwalDto]] = []
+        for start in range(0, len(jadwal_dtos), OVERLAP_CHECK_CHUNK_SIZE):
+            chunk = jadwal_dtos[start : start + OVERLAP_CHECK_CHUNK_SIZE]
+            # The slots are joined as a VALUES list, so each one is answered by
+            # a range seek on the partial (field, hari, jam_mulai) index.
+            proposed = (
+                values(
+                    column("position", Integer),
+                    column("hari", String),
+                    column("jam_mulai", Time),
+                    column("jam_selesai", Time),
+                    column("value", getattr(JadwalModel, field_name).type),
+                    name="proposed",
+                )
+                .data(
+                    [
+                        (
+                            start + offset,
+                            dto.hari,
+                            dto.jam_mulai,
+                            dto.jam_selesai,
+                            getattr(dto, field_name),
+                        )
+                        for offset, dto in enumerate(chunk)
+                    ]
+                )
+                .cte("proposed")
+            )
+            stmt = (
+                select(proposed.c.position, JadwalModel)
+                .join(
+                    JadwalModel,
+                    and_(
+                        getattr(JadwalModel, field_name) == proposed.c.value,
+                        JadwalModel.hari == proposed.c.hari,
+                        JadwalModel.jam_mulai < proposed.c.jam_selesai,
+                        JadwalModel.jam_selesai > proposed.c.jam_mulai,
+                        JadwalModel.is_active == True,  # noqa: E712
+                    ),
+                )
+                .order_by(proposed.c.position, JadwalModel.jam_mulai)
+            )
+            if exclude_id is not None:
+                stmt = stmt.where(JadwalModel.id != exclude_id)
+            overlaps.extend(
+                (position, jadwal.to_entity())
+                for position, jadwal in self.session.execute(stmt).tuples()
+            )
+        return overlaps
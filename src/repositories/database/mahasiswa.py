@@ -1,20 +1,63 @@
+from collections.abc import Collection, Iterator
 from typing import Optional
 from typing_extensions import override
 
-from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.mahasiswa_dto import (
     CreateMahasiswaDto,
     MahasiswaDto,
     UpdateMahasiswaDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
+from src.application.enums import MahasiswaStatus
 from src.application.exceptions import NotFoundException
 from src.application.usecases.interfaces.mahasiswa_repository import (
     MahasiswaRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.mahasiswa import GetMahasiswaPort
+from src.repositories.database import bulk
+from src.repositories.database.changes import read_changes
+from src.repositories.database.counting import count_rows
+from src.repositories.database.errors import translate_unique_violations
 from src.repositories.database.models.mahasiswa import MahasiswaModel
+from src.repositories.database.projection import entity_converter
+from src.repositories.database.query import Filter, QuerySpec
+from src.repositories.database.streaming import stream_entities
+from src.repositories.database.writes import (
+    insert_returning,
+    update_returning,
+    upsert_returning,
+)
+
+
+FIELD_LABELS = {"nim": "NIM"}
+
+
+MAHASISWA_QUERY = QuerySpec(
+    MahasiswaModel,
+    filters=[
+        Filter("id"),
+        Filter("nim"),
+        Filter("nama", "contains"),
+        Filter("kelas"),
+        Filter("tempat_lahir", "contains"),
+        Filter("tanggal_lahir"),
+    ],
+    sortable=(
+        "nim",
+        "nama",
+        "kelas",
+        "tempat_lahir",
+        "tanggal_lahir",
+        "status",
+        "created_at",
+        "updated_at",
+    ),
+)
 
 
 class MahasiswaRepository(MahasiswaRepositoryInterface):
@@ -23,113 +66,65 @@ class MahasiswaRepository(MahasiswaRepositoryInterface):
 
     @override
     def create(self, mahasiswa_dto: CreateMahasiswaDto) -> MahasiswaDto:
-        mahasiswa_model = MahasiswaModel(
-            nim=mahasiswa_dto.nim,
-            nama=mahasiswa_dto.nama,
-            kelas=mahasiswa_dto.kelas,
-            tempat_lahir=mahasiswa_dto.tempat_lahir,
-            tanggal_lahir=mahasiswa_dto.tanggal_lahir,
-            status=mahasiswa_dto.status,
-        )
-        self.session.add(mahasiswa_model)
-        self.session.commit()
-        self.session.refresh(mahasiswa_model)
-        return MahasiswaDto(
-            id=mahasiswa_model.id,
-            nim=mahasiswa_model.nim,
-            nama=mahasiswa_model.nama,
-            kelas=mahasiswa_model.kelas,
-            tempat_lahir=mahasiswa_model.tempat_lahir,
-            tanggal_lahir=mahasiswa_model.tanggal_lahir,
-            status=mahasiswa_model.status,
+        values = mahasiswa_dto.model_dump()
+        with translate_unique_violations(
+            self.session, MahasiswaModel, "Mahasiswa", values, FIELD_LABELS
+        ):
+            [created] = insert_returning(self.session, MahasiswaModel, [values])
+        return created
+
+    @override
+    def read_page(
+        self, get_mahasiswa_port: GetMahasiswaPort
+    ) -> CursorPageDto[MahasiswaDto]:
+        query = MAHASISWA_QUERY.select(self.session, get_mahasiswa_port)
+        mahasiswa_models = self.session.scalars(query.statement, query.params).all()
+        convert = entity_converter(MahasiswaModel, MahasiswaDto, get_mahasiswa_port)
+        return CursorPageDto[MahasiswaDto](
+            items=[convert(m) for m in mahasiswa_models],
+            next_cursor=MAHASISWA_QUERY.next_cursor(
+                mahasiswa_models, get_mahasiswa_port
+            ),
         )
 
     @override
     def read(self, get_mahasiswa_port: GetMahasiswaPort) -> list[MahasiswaDto]:
-        stmt = select(MahasiswaModel)
-
-        filters = []
-        if get_mahasiswa_port.id:
-            filters.append(MahasiswaModel.id == get_mahasiswa_port.id)
-        if get_mahasiswa_port.nim:
-            filters.append(MahasiswaModel.nim == get_mahasiswa_port.nim)
-        if get_mahasiswa_port.nama:
-            filters.append(MahasiswaModel.nama.ilike(f"%{get_mahasiswa_port.nama}%"))
-        if get_mahasiswa_port.kelas:
-            filters.append(MahasiswaModel.kelas == get_mahasiswa_port.kelas)
-        if get_mahasiswa_port.tempat_lahir:
-            filters.append(
-                MahasiswaModel.tempat_lahir.ilike(
-                    f"%{get_mahasiswa_port.tempat_lahir}%"
-                )
-            )
-        if get_mahasiswa_port.tanggal_lahir:
-            filters.append(
-                MahasiswaModel.tanggal_lahir == get_mahasiswa_port.tanggal_lahir
-            )
+        return self.read_page(get_mahasiswa_port).items
 
-        if filters:
-            stmt = stmt.where(and_(*filters))
-
-        if get_mahasiswa_port.order_by:
-            order_column = getattr(MahasiswaModel, get_mahasiswa_port.order_by, None)
-            if order_column:
-                if (
-                    get_mahasiswa_port.order
-                    and get_mahasiswa_port.order.lower() == "desc"
-                ):
-                    stmt = stmt.order_by(order_column.desc())
-                else:
-                    stmt = stmt.order_by(order_column.asc())
-
-        if get_mahasiswa_port.limit:
-            stmt = stmt.limit(get_mahasiswa_port.limit)
-        if get_mahasiswa_port.page and get_mahasiswa_port.limit:
-            stmt = stmt.offset((get_mahasiswa_port.page - 1) * get_mahasiswa_port.limit)
-
-        mahasiswa_models = self.session.execute(stmt).scalars().all()
-        return [
-            MahasiswaDto(
-                id=m.id,
-                nim=m.nim,
-                nama=m.nama,
-                kelas=m.kelas,
-                tempat_lahir=m.tempat_lahir,
-                tanggal_lahir=m.tanggal_lahir,
-                status=m.status,
-            )
-            for m in mahasiswa_models
-        ]
+    @override
+    def stream(self, get_mahasiswa_port: GetMahasiswaPort) -> Iterator[MahasiswaDto]:
+        query = MAHASISWA_QUERY.select(self.session, get_mahasiswa_port)
+        convert = entity_converter(MahasiswaModel, MahasiswaDto, get_mahasiswa_port)
+        return stream_entities(self.session, query.statement, convert, query.params)
 
     @override
-    def update(self, mahasiswa_dto: UpdateMahasiswaDto) -> MahasiswaDto:
-        mahasiswa_model: Optional[MahasiswaModel] = self.session.get(
-            MahasiswaModel, mahasiswa_dto.id
+    def count(self, get_mahasiswa_port: GetMahasiswaPort) -> CountDto:
+        query = MAHASISWA_QUERY.filtered(self.session, get_mahasiswa_port)
+        return count_rows(self.session, MahasiswaModel, query.statement, query.params)
+
+    @override
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[MahasiswaDto]:
+        return read_changes(
+            self.session,
+            MahasiswaModel,
+            get_changes_port,
+            is_deleted=lambda m: m.status == MahasiswaStatus.DROP_OUT,
         )
-        if not mahasiswa_model:
+
+    @override
+    def update(self, mahasiswa_dto: UpdateMahasiswaDto) -> MahasiswaDto:
+        values = mahasiswa_dto.model_dump(exclude={"id"})
+        with translate_unique_violations(
+            self.session, MahasiswaModel, "Mahasiswa", values, FIELD_LABELS
+        ):
+            updated = update_returning(
+                self.session, MahasiswaModel, mahasiswa_dto.id, values
+            )
+        if updated is None:
             raise NotFoundException(
                 resource_name="Mahasiswa", identifier=mahasiswa_dto.id
             )
-
-        mahasiswa_model.nim = mahasiswa_dto.nim
-        mahasiswa_model.nama = mahasiswa_dto.nama
-        mahasiswa_model.kelas = mahasiswa_dto.kelas
-        mahasiswa_model.tempat_lahir = mahasiswa_dto.tempat_lahir
-        mahasiswa_model.tanggal_lahir = mahasiswa_dto.tanggal_lahir
-        mahasiswa_model.status = mahasiswa_dto.status
-
-        self.session.add(mahasiswa_model)
-        self.session.commit()
-        self.session.refresh(mahasiswa_model)
-        return MahasiswaDto(
-            id=mahasiswa_model.id,
-            nim=mahasiswa_model.nim,
-            nama=mahasiswa_model.nama,
-            kelas=mahasiswa_model.kelas,
-            tempat_lahir=mahasiswa_model.tempat_lahir,
-            tanggal_lahir=mahasiswa_model.tanggal_lahir,
-            status=mahasiswa_model.status,
-        )
+        return updated
 
     @override
     def delete(self, mahasiswa_id: int) -> bool:
@@ -139,8 +134,42 @@ class MahasiswaRepository(MahasiswaRepositoryInterface):
         if not mahasiswa_model:
             raise NotFoundException(resource_name="Mahasiswa", identifier=mahasiswa_id)
 
-        from src.application.enums import MahasiswaStatus
         mahasiswa_model.status = MahasiswaStatus.DROP_OUT
         self.session.add(mahasiswa_model)
         self.session.commit()
         return True
+
+    @override
+    def bulk_create(
+        self, mahasiswa_dtos: list[CreateMahasiswaDto]
+    ) -> list[MahasiswaDto]:
+        rows = [dto.model_dump() for dto in mahasiswa_dtos]
+        with translate_unique_violations(
+            self.session, MahasiswaModel, "Mahasiswa", {}, FIELD_LABELS
+        ):
+            return insert_returning(self.session, MahasiswaModel, rows)
+
+    @override
+    def upsert(
+        self, mahasiswa_dtos: list[CreateMahasiswaDto]
+    ) -> UpsertResultDto[MahasiswaDto]:
+        rows = [dto.model_dump() for dto in mahasiswa_dtos]
+        with translate_unique_violations(
+            self.session, MahasiswaModel, "Mahasiswa", {}, FIELD_LABELS
+        ):
+            upserted = upsert_returning(self.session, MahasiswaModel, rows, "nim")
+        return UpsertResultDto[MahasiswaDto](
+            created=upserted.created,
+            updated=upserted.updated,
+            unchanged=upserted.unchanged,
+        )
+
+    @override
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        if field_name not in ("nim",):
+            raise ValueError(f"{field_name} is not a unique Mahasiswa field")
+        return bulk.read_existing_values(
+            self.session, MahasiswaModel, field_name, values
+        )
@@ -1,21 +1,49 @@
 
+from collections.abc import Collection, Iterator
 from typing import Optional
 from typing_extensions import override
 
-from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.mata_kuliah_dto import (
     CreateMataKuliahDto,
     MataKuliahDto,
     UpdateMataKuliahDto,
 )
+from src.application.dtos.upsert_dto import UpsertResultDto
 from src.application.exceptions import NotFoundException
 from src.application.usecases.interfaces.mata_kuliah_repository import (
     MataKuliahRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.mata_kuliah import GetMataKuliahPort
+from src.repositories.database import bulk
+from src.repositories.database.changes import read_changes
+from src.repositories.database.counting import count_rows
+from src.repositories.database.errors import translate_unique_violations
 from src.repositories.database.models.mata_kuliah import MataKuliahModel
+from src.repositories.database.projection import entity_converter
+from src.repositories.database.query import Filter, QuerySpec
+from src.repositories.database.streaming import stream_entities
+from src.repositories.database.writes import (
+    insert_returning,
+    update_returning,
+    upsert_returning,
+)
+
+
+MATA_KULIAH_QUERY = QuerySpec(
+    MataKuliahModel,
+    filters=[
+        Filter("id"),
+        Filter("kode_mk"),
+        Filter("nama_mk", "contains"),
+        Filter("sks"),
+    ],
+    sortable=("kode_mk", "nama_mk", "sks", "is_active", "created_at", "updated_at"),
+)
 
 
 class MataKuliahRepository(MataKuliahRepositoryInterface):
@@ -24,86 +52,67 @@ class MataKuliahRepository(MataKuliahRepositoryInterface):
 
     @override
     def create(self, mata_kuliah_dto: CreateMataKuliahDto) -> MataKuliahDto:
-        mata_kuliah_model = MataKuliahModel(
-            kode_mk=mata_kuliah_dto.kode_mk,
-            nama_mk=mata_kuliah_dto.nama_mk,
-            sks=mata_kuliah_dto.sks,
-            is_active=mata_kuliah_dto.is_active,
-        )
-        self.session.add(mata_kuliah_model)
-        self.session.commit()
-        self.session.refresh(mata_kuliah_model)
-        return mata_kuliah_model.to_entity()
+        values = mata_kuliah_dto.model_dump()
+        with translate_unique_violations(
+            self.session, MataKuliahModel, "Mata Kuliah", values
+        ):
+            [created] = insert_returning(self.session, MataKuliahModel, [values])
+        return created
 
     @override
-    def read(
+    def read_page(
         self, get_mata_kuliah_port: GetMataKuliahPort
-    ) -> list[MataKuliahDto]:
-        stmt = select(MataKuliahModel)
-
-        filters = []
-        if get_mata_kuliah_port.id:
-            filters.append(MataKuliahModel.id == get_mata_kuliah_port.id)
-        if get_mata_kuliah_port.kode_mk:
-            filters.append(
-                MataKuliahModel.kode_mk == get_mata_kuliah_port.kode_mk
-            )
-        if get_mata_kuliah_port.nama_mk:
-            filters.append(
-                MataKuliahModel.nama_mk.ilike(
-                    f"%{get_mata_kuliah_port.nama_mk}%"
-                )
-            )
-        if get_mata_kuliah_port.sks:
-            filters.append(MataKuliahModel.sks == get_mata_kuliah_port.sks)
+    ) -> CursorPageDto[MataKuliahDto]:
+        query = MATA_KULIAH_QUERY.select(self.session, get_mata_kuliah_port)
+        mata_kuliah_models = self.session.scalars(query.statement, query.params).all()
+        convert = entity_converter(MataKuliahModel, MataKuliahDto, get_mata_kuliah_port)
+        return CursorPageDto[MataKuliahDto](
+            items=[convert(mk) for mk in mata_kuliah_models],
+            next_cursor=MATA_KULIAH_QUERY.next_cursor(
+                mata_kuliah_models, get_mata_kuliah_port
+            ),
+        )
 
-        if filters:
-            stmt = stmt.where(and_(*filters))
+    @override
+    def read(self, get_mata_kuliah_port: GetMataKuliahPort) -> list[MataKuliahDto]:
+        return self.read_page(get_mata_kuliah_port).items
 
-        if get_mata_kuliah_port.order_by:
-            order_column = getattr(
-                MataKuliahModel, get_mata_kuliah_port.order_by, None
-            )
-            if order_column:
-                if (
-                    get_mata_kuliah_port.order
-                    and get_mata_kuliah_port.order.lower() == "desc"
-                ):
-                    stmt = stmt.order_by(order_column.desc())
-                else:
-                    stmt = stmt.order_by(order_column.asc())
-
-        if get_mata_kuliah_port.limit:
-            stmt = stmt.limit(get_mata_kuliah_port.limit)
-        if get_mata_kuliah_port.page and get_mata_kuliah_port.limit:
-            stmt = stmt.offset(
-                (get_mata_kuliah_port.page - 1) * get_mata_kuliah_port.limit
-            )
+    @override
+    def stream(
+        self, get_mata_kuliah_port: GetMataKuliahPort
+    ) -> Iterator[MataKuliahDto]:
+        query = MATA_KULIAH_QUERY.select(self.session, get_mata_kuliah_port)
+        convert = entity_converter(MataKuliahModel, MataKuliahDto, get_mata_kuliah_port)
+        return stream_entities(self.session, query.statement, convert, query.params)
 
-        mata_kuliah_models = self.session.execute(stmt).scalars().all()
-        return [mk.to_entity() for mk in mata_kuliah_models]
+    @override
+    def count(self, get_mata_kuliah_port: GetMataKuliahPort) -> CountDto:
+        query = MATA_KULIAH_QUERY.filtered(self.session, get_mata_kuliah_port)
+        return count_rows(self.session, MataKuliahModel, query.statement, query.params)
 
     @override
-    def update(
-        self, mata_kuliah_dto: UpdateMataKuliahDto
-    ) -> MataKuliahDto:
-        mata_kuliah_model: Optional[MataKuliahModel] = self.session.get(
-            MataKuliahModel, mata_kuliah_dto.id
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[MataKuliahDto]:
+        return read_changes(
+            self.session,
+            MataKuliahModel,
+            get_changes_port,
+            is_deleted=lambda mk: not mk.is_active,
         )
-        if not mata_kuliah_model:
+
+    @override
+    def update(self, mata_kuliah_dto: UpdateMataKuliahDto) -> MataKuliahDto:
+        values = mata_kuliah_dto.model_dump(exclude={"id"})
+        with translate_unique_violations(
+            self.session, MataKuliahModel, "Mata Kuliah", values
+        ):
+            updated = update_returning(
+                self.session, MataKuliahModel, mata_kuliah_dto.id, values
+            )
+        if updated is None:
             raise NotFoundException(
                 resource_name="Mata Kuliah", identifier=mata_kuliah_dto.id
             )
-
-        mata_kuliah_model.kode_mk = mata_kuliah_dto.kode_mk
-        mata_kuliah_model.nama_mk = mata_kuliah_dto.nama_mk
-        mata_kuliah_model.sks = mata_kuliah_dto.sks
-        mata_kuliah_model.is_active = mata_kuliah_dto.is_active
-
-        self.session.add(mata_kuliah_model)
-        self.session.commit()
-        self.session.refresh(mata_kuliah_model)
-        return mata_kuliah_model.to_entity()
+        return updated
 
     @override
     def delete(self, mata_kuliah_id: int) -> bool:
@@ -119,3 +128,38 @@ class MataKuliahRepository(MataKuliahRepositoryInterface):
         self.session.add(mata_kuliah_model)
         self.session.commit()
         return True
+
+    @override
+    def bulk_create(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> list[MataKuliahDto]:
+        rows = [dto.model_dump() for dto in mata_kuliah_dtos]
+        with translate_unique_violations(
+            self.session, MataKuliahModel, "Mata Kuliah", {}
+        ):
+            return insert_returning(self.session, MataKuliahModel, rows)
+
+    @override
+    def upsert(
+        self, mata_kuliah_dtos: list[CreateMataKuliahDto]
+    ) -> UpsertResultDto[MataKuliahDto]:
+        rows = [dto.model_dump() for dto in mata_kuliah_dtos]
+        with translate_unique_violations(
+            self.session, MataKuliahModel, "Mata Kuliah", {}
+        ):
+            upserted = upsert_returning(self.session, MataKuliahModel, rows, "kode_mk")
+        return UpsertResultDto[MataKuliahDto](
+            created=upserted.created,
+            updated=upserted.updated,
+            unchanged=upserted.unchanged,
+        )
+
+    @override
+    def read_existing_values(
+        self, field_name: str, values: Collection[str]
+    ) -> set[str]:
+        if field_name not in ("kode_mk",):
+            raise ValueError(f"{field_name} is not a unique MataKuliah field")
+        return bulk.read_existing_values(
+            self.session, MataKuliahModel, field_name, values
+        )
@@ -1,15 +1,21 @@
 from typing_extensions import override
 
-from sqlalchemy import Integer, String, Enum
+from sqlalchemy import Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.application.dtos.dosen_dto import DosenDto
 from src.application.enums import DosenStatus
-from src.repositories.database.core import Base
+from src.repositories.database.core import Base, construct_dto
+from src.repositories.database.models.timestamps import TimestampMixin
+from src.repositories.database.search import register_search_columns
 
 
-class DosenModel(Base):
+class DosenModel(TimestampMixin, Base):
     __tablename__ = "dosen"
+    __table_args__ = (
+        Index("ix_dosen_status", "status"),
+        Index("ix_dosen_nama", "nama"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     nidn: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
@@ -19,10 +25,14 @@ class DosenModel(Base):
 
     @override
     def to_entity(self) -> DosenDto:
-        return DosenDto(
+        return construct_dto(
+            DosenDto,
             id=self.id,
             nidn=self.nidn,
             nama=self.nama,
             email=self.email,
             status=self.status,
         )
+
+
+register_search_columns(DosenModel, "nama", "email")
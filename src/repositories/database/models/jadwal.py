@@ -1,18 +1,64 @@
+from collections.abc import Collection
 from datetime import time
-from typing import Optional
+from typing import Any, Optional
 from typing_extensions import override
 
-from sqlalchemy import ForeignKey, Integer, String, Time, Boolean
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Time,
+    event,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.application.dtos.jadwal_dto import JadwalDto
-from src.repositories.database.core import Base
+from src.application.dtos.jadwal_dto import JadwalDetailDto, JadwalDto
+from src.repositories.database.core import Base, construct_dto
+from src.repositories.database.models.timestamps import TimestampMixin
+from src.repositories.database.search import register_search_columns
 from src.repositories.database.models.dosen import DosenModel
 from src.repositories.database.models.mata_kuliah import MataKuliahModel
 
 
-class JadwalModel(Base):
+class JadwalModel(TimestampMixin, Base):
     __tablename__ = "jadwal"
+    # Reads always filter on is_active (soft delete), so the secondary indexes
+    # are partial and only cover active rows.
+    __table_args__ = (
+        Index(
+            "ix_jadwal_active_dosen_hari",
+            "dosen_id",
+            "hari",
+            "jam_mulai",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_jadwal_active_ruangan_hari",
+            "ruangan",
+            "hari",
+            "jam_mulai",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_jadwal_active_mata_kuliah",
+            "mata_kuliah_id",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_jadwal_active_hari",
+            "hari",
+            "jam_mulai",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     hari: Mapped[str] = mapped_column(String(10), nullable=False)
@@ -29,7 +75,8 @@ class JadwalModel(Base):
 
     @override
     def to_entity(self) -> JadwalDto:
-        return JadwalDto(
+        return construct_dto(
+            JadwalDto,
             id=self.id,
             hari=self.hari,
             jam_mulai=self.jam_mulai,
@@ -39,3 +86,62 @@ class JadwalModel(Base):
             dosen_id=self.dosen_id,
             is_active=self.is_active,
         )
+
+    def to_detail_entity(self, expand: Collection[str]) -> JadwalDetailDto:
+        relations: dict[str, Any] = {}
+        for name in expand:
+            related = getattr(self, name)
+            relations[name] = related.to_entity() if related is not None else None
+        return JadwalDetailDto.model_construct(**dict(self.to_entity()), **relations)
+
+
+register_search_columns(JadwalModel, "hari", "ruangan")
+
+
+# Database-side double-booking guards, one per booked column, named after the
+# condition they reject. The service checks for overlaps before writing; the
+# guards catch a concurrent write landing in between. SQLite serializes
+# writers, so a BEFORE trigger sees every committed row; PostgreSQL needs an
+# exclusion constraint (with btree_gist for the equality parts).
+BOOKING_GUARDS = {
+    "ruangan": "jadwal_ruangan_double_booked",
+    "dosen_id": "jadwal_dosen_id_double_booked",
+}
+
+
+def booking_guard_statements(dialect: str) -> list[str]:
+    statements: list[str] = []
+    if dialect == "postgresql":
+        statements.append("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    for column, guard in BOOKING_GUARDS.items():
+        if dialect == "sqlite":
+            overlap = (
+                f"SELECT RAISE(ABORT, '{guard}') WHERE EXISTS (SELECT 1 FROM jadwal "
+                f"WHERE is_active = 1 AND {column} = new.{column} "
+                "AND hari = new.hari AND jam_mulai < new.jam_selesai "
+                "AND jam_selesai > new.jam_mulai"
+            )
+            statements += [
+                f"CREATE TRIGGER IF NOT EXISTS {guard}_bi BEFORE INSERT ON jadwal "
+                f"WHEN new.is_active BEGIN {overlap}); END",
+                f"CREATE TRIGGER IF NOT EXISTS {guard}_bu BEFORE UPDATE OF "
+                f"hari, jam_mulai, jam_selesai, {column}, is_active ON jadwal "
+                f"WHEN new.is_active BEGIN {overlap} AND id != new.id); END",
+            ]
+        elif dialect == "postgresql":
+            statements.append(
+                f"ALTER TABLE jadwal ADD CONSTRAINT {guard} EXCLUDE USING gist "
+                f"({column} WITH =, hari WITH =, tsrange(DATE '2000-01-01' + "
+                "jam_mulai, DATE '2000-01-01' + jam_selesai) WITH &&) "
+                "WHERE (is_active)"
+            )
+    return statements
+
+
+for _dialect in ("sqlite", "postgresql"):
+    for _statement in booking_guard_statements(_dialect):
+        event.listen(
+            JadwalModel.__table__,
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
@@ -1,16 +1,24 @@
 from datetime import date
 from typing_extensions import override
 
-from sqlalchemy import Date, Integer, String, Enum
+from sqlalchemy import Date, Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.application.dtos.mahasiswa_dto import MahasiswaDto
 from src.application.enums import MahasiswaStatus
-from src.repositories.database.core import Base
+from src.repositories.database.core import Base, construct_dto
+from src.repositories.database.models.timestamps import TimestampMixin
+from src.repositories.database.search import register_search_columns
 
 
-class MahasiswaModel(Base):
+class MahasiswaModel(TimestampMixin, Base):
     __tablename__ = "mahasiswa"
+    __table_args__ = (
+        Index("ix_mahasiswa_kelas", "kelas"),
+        Index("ix_mahasiswa_status", "status"),
+        Index("ix_mahasiswa_nama", "nama"),
+        Index("ix_mahasiswa_tanggal_lahir", "tanggal_lahir"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     nim: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
@@ -22,7 +30,8 @@ class MahasiswaModel(Base):
 
     @override
     def to_entity(self) -> MahasiswaDto:
-        return MahasiswaDto(
+        return construct_dto(
+            MahasiswaDto,
             id=self.id,
             nim=self.nim,
             nama=self.nama,
@@ -31,3 +40,6 @@ class MahasiswaModel(Base):
             tanggal_lahir=self.tanggal_lahir,
             status=self.status,
         )
+
+
+register_search_columns(MahasiswaModel, "nama", "tempat_lahir")
@@ -1,14 +1,20 @@
 from typing_extensions import override
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import Boolean, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.application.dtos.mata_kuliah_dto import MataKuliahDto
-from src.repositories.database.core import Base
+from src.repositories.database.core import Base, construct_dto
+from src.repositories.database.models.timestamps import TimestampMixin
+from src.repositories.database.search import register_search_columns
 
 
-class MataKuliahModel(Base):
+class MataKuliahModel(TimestampMixin, Base):
     __tablename__ = "mata_kuliah"
+    __table_args__ = (
+        Index("ix_mata_kuliah_sks", "sks"),
+        Index("ix_mata_kuliah_nama_mk", "nama_mk"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     kode_mk: Mapped[str] = mapped_column(String(10), unique=True, nullable=False)
@@ -18,10 +24,14 @@ class MataKuliahModel(Base):
 
     @override
     def to_entity(self) -> MataKuliahDto:
-        return MataKuliahDto(
+        return construct_dto(
+            MataKuliahDto,
             id=self.id,
             kode_mk=self.kode_mk,
             nama_mk=self.nama_mk,
             sks=self.sks,
             is_active=self.is_active,
         )
+
+
+register_search_columns(MataKuliahModel, "kode_mk", "nama_mk")
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+def utc_now() -> datetime:
+    # Stored naive, in UTC, like every other DateTime column of the schema.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class TimestampMixin:
+    """
+    ``created_at``/``updated_at`` columns, maintained on the Python side so they
+    are also set by bulk ``insert()`` and single-statement ``update()`` writes.
+    """
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utc_now, nullable=False, index=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now, nullable=False, index=True
+    )
@@ -1,19 +1,28 @@
+from collections.abc import Collection
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from typing_extensions import override
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.application.dtos.tugas_dto import TugasDto
+from src.application.dtos.tugas_dto import TugasDetailDto, TugasDto
 from src.application.enums import StatusTugas
-from src.repositories.database.core import Base
+from src.repositories.database.core import Base, construct_dto
+from src.repositories.database.models.timestamps import TimestampMixin
+from src.repositories.database.search import register_search_columns
 from src.repositories.database.models.mahasiswa import MahasiswaModel
 from src.repositories.database.models.mata_kuliah import MataKuliahModel
 
 
-class TugasModel(Base):
+class TugasModel(TimestampMixin, Base):
     __tablename__ = "tugas"
+    __table_args__ = (
+        Index("ix_tugas_mahasiswa_deadline", "mahasiswa_id", "deadline"),
+        Index("ix_tugas_mata_kuliah_deadline", "mata_kuliah_id", "deadline"),
+        Index("ix_tugas_status_deadline", "status", "deadline"),
+        Index("ix_tugas_deadline", "deadline"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     judul: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -35,7 +44,8 @@ class TugasModel(Base):
 
     @override
     def to_entity(self) -> TugasDto:
-        return TugasDto(
+        return construct_dto(
+            TugasDto,
             id=self.id,
             judul=self.judul,
             deskripsi=self.deskripsi,
@@ -44,3 +54,13 @@ class TugasModel(Base):
             mata_kuliah_id=self.mata_kuliah_id,
             mahasiswa_id=self.mahasiswa_id,
         )
+
+    def to_detail_entity(self, expand: Collection[str]) -> TugasDetailDto:
+        relations: dict[str, Any] = {}
+        for name in expand:
+            related = getattr(self, name)
+            relations[name] = related.to_entity() if related is not None else None
+        return TugasDetailDto.model_construct(**dict(self.to_entity()), **relations)
+
+
+register_search_columns(TugasModel, "judul", "deskripsi")
@@ -0,0 +1,82 @@
+from datetime import date, datetime, time
+from typing import Any, Optional
+
+from sqlalchemy import Column, and_, inspect, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.application.exceptions import InvalidInputException
+from src.ports.cursor import decode_cursor
+from src.repositories.database.core import Base
+
+
+def _coerce_cursor_value(raw: Any, column: Column) -> Any:
+    if raw is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return raw
+    try:
+        if python_type in (date, datetime, time):
+            return python_type.fromisoformat(raw)
+        return python_type(raw)
+    except (TypeError, ValueError):
+        raise InvalidInputException("Invalid pagination cursor.")
+
+
+def cursor_position(
+    model: type[Base], cursor: str, order_by: str, descending: bool
+) -> tuple[Any, int]:
+    """The ``(order_by value, id)`` a cursor points after, typed for the column."""
+    raw_value, last_id = decode_cursor(cursor, order_by, descending)
+    if order_by == "id":
+        return last_id, last_id
+    return _coerce_cursor_value(raw_value, inspect(model).columns[order_by]), last_id
+
+
+def seek_predicate(
+    model: type[Base],
+    order_by: str,
+    descending: bool,
+    value: Optional[ColumnElement[Any]],
+    last_id: ColumnElement[Any],
+) -> ColumnElement[bool]:
+    """
+    Rows after the cursor position ``(value, last_id)`` in ``(order_by, id)``
+    order. ``value`` is None for a cursor on a NULL sort key.
+    """
+    id_column = getattr(model, "id")
+    if order_by == "id":
+        return id_column < last_id if descending else id_column > last_id
+
+    order_column = getattr(model, order_by)
+    # NULLs are ordered as the smallest value (see ``order_clauses``), so rows
+    # with a NULL sort key come first in ascending order and last in descending.
+    if value is None:
+        if descending:
+            return and_(order_column.is_(None), id_column < last_id)
+        return or_(
+            order_column.is_not(None),
+            and_(order_column.is_(None), id_column > last_id),
+        )
+    seek_key = tuple_(value, last_id)
+    if descending:
+        return or_(tuple_(order_column, id_column) < seek_key, order_column.is_(None))
+    return tuple_(order_column, id_column) > seek_key
+
+
+def order_clauses(
+    model: type[Base], order_by: str, descending: bool
+) -> list[ColumnElement[Any]]:
+    """ORDER BY ``(order_by, id)``, the stable order every page is cut from."""
+    id_column = getattr(model, "id")
+    if order_by == "id":
+        return [id_column.desc() if descending else id_column.asc()]
+
+    order_column = getattr(model, order_by)
+    nullable = inspect(model).columns[order_by].nullable
+    if descending:
+        primary = order_column.desc()
+        return [primary.nulls_last() if nullable else primary, id_column.desc()]
+    primary = order_column.asc()
+    return [primary.nulls_first() if nullable else primary, id_column.asc()]
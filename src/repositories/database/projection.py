@@ -0,0 +1,66 @@
+"""
+Column projection for the ``fields`` parameter of the list reads.
+
+A projected query loads only the requested columns, plus the sort column that
+the next page's cursor is built from, and the DTOs it yields mark just the
+requested fields as set, so a response rendered with ``exclude_unset`` carries
+exactly those fields.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Select, inspect
+from sqlalchemy.orm import load_only
+
+from src.repositories.database.core import Base, construct_dto
+
+
+def projected_columns(model: type[Base], port: Any) -> list[str]:
+    """
+    Columns of ``model`` loaded for ``port.fields``: the fields themselves, the
+    sort column and the foreign keys of the relations named by ``port.expand``.
+    """
+    mapper = inspect(model)
+    names = dict.fromkeys(port.fields)
+    if port.order_by and port.order_by in mapper.columns:
+        names[port.order_by] = None
+    for relation in getattr(port, "expand", None) or []:
+        for column in mapper.relationships[relation].local_columns:
+            names[column.key] = None
+    return list(names)
+
+
+def project(stmt: Select, model: type[Base], columns: Sequence[str]) -> Select:
+    """
+    Restricts ``stmt`` to ``columns`` (see ``projected_columns``). Any other
+    column raises instead of lazy-loading row by row when touched.
+    """
+    attributes = [getattr(model, name) for name in columns]
+    return stmt.options(load_only(*attributes, raiseload=True))
+
+
+def entity_converter(
+    model: type[Base], dto_type: type[BaseModel], port: Any
+) -> Callable[[Any], Any]:
+    """
+    ``model.to_entity`` for a full read; for a projected one, a converter that
+    builds ``dto_type`` from the loaded columns and the relations named by
+    ``port.expand`` (when the port has one), leaving every other field unset.
+    """
+    if not port.fields:
+        return model.to_entity
+    unset = dict.fromkeys(dto_type.model_fields)
+    columns = [name for name in projected_columns(model, port) if name in unset]
+    relations = getattr(port, "expand", None) or []
+    fields_set = {*port.fields, *relations}
+
+    def convert(instance: Any) -> Any:
+        values = {**unset, **{name: getattr(instance, name) for name in columns}}
+        for name in relations:
+            related = getattr(instance, name)
+            values[name] = related.to_entity() if related is not None else None
+        return construct_dto(dto_type, _fields_set=set(fields_set), **values)
+
+    return convert
@@ -0,0 +1,256 @@
+"""
+Declarative filtering, sorting and pagination for the Get*Port list queries.
+
+Each repository describes its port once as a QuerySpec: which port attribute
+filters which column and how, which columns ``order_by`` may name, and which
+relations ``expand`` may load. The spec turns a port into a SELECT in which
+every value from the request is a named bind parameter, so the statement only
+depends on the query's *shape*: the active filters (and whether a substring
+filter is answered from the trigram index), the sort, the paging mode and the
+projection. Statements are built once per shape and reused; a reused Select
+also keeps its memoized cache key, so SQLAlchemy finds the compiled SQL in the
+engine's compiled cache without rebuilding or re-keying anything.
+"""
+
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Literal, Optional
+
+from sqlalchemy import Integer, Select, String, and_, bindparam, inspect, select
+from sqlalchemy.orm import InstrumentedAttribute, Session, selectinload
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.application.exceptions import InvalidInputException
+from src.ports.cursor import encode_cursor, is_descending
+from src.repositories.database.core import Base
+from src.repositories.database.pagination import (
+    cursor_position,
+    order_clauses,
+    seek_predicate,
+)
+from src.repositories.database.projection import project, projected_columns
+from src.repositories.database.search import (
+    contains,
+    contains_query,
+    fts_words_query,
+    search,
+    split_search,
+    uses_fts,
+)
+
+# Distinct statement shapes kept per QuerySpec.
+STATEMENT_CACHE_SIZE = 256
+
+FilterOp = Literal["eq", "ge", "le", "contains"]
+
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    Port attribute ``name`` restricting ``column`` (by default the column of the
+    same name) with ``op``; the filter is active when the attribute is truthy.
+    """
+
+    name: str
+    op: FilterOp = "eq"
+    column: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Query:
+    """A statement built by a QuerySpec and the parameters to execute it with."""
+
+    statement: Select
+    params: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class _Shape:
+    # (filter name, uses the trigram index) for each active filter.
+    filters: tuple[tuple[str, bool], ...]
+    # (has words for the trigram index, number of ILIKE words), if searching.
+    search: Optional[tuple[bool, int]]
+    # None for the unordered, unpaginated statement behind count().
+    order_by: Optional[str] = None
+    descending: bool = False
+    # "id", "value" or "null" (a cursor on a NULL sort key), None without one.
+    cursor: Optional[str] = None
+    limit: bool = False
+    offset: bool = False
+    columns: Optional[tuple[str, ...]] = None
+    expand: tuple[str, ...] = ()
+
+
+class QuerySpec:
+    def __init__(
+        self,
+        model: type[Base],
+        filters: Sequence[Filter],
+        sortable: Collection[str],
+        where: Sequence[ColumnElement[bool]] = (),
+        relations: Optional[Mapping[str, InstrumentedAttribute[Any]]] = None,
+    ):
+        """
+        ``sortable`` is the allowlist for ``order_by`` (``id`` is always
+        allowed), ``where`` holds conditions applied to every query and
+        ``relations`` the relationship loaded for each name ``expand`` accepts.
+        """
+        self.model = model
+        self.filters = {f.name: f for f in filters}
+        self.sortable = ("id", *(name for name in sortable if name != "id"))
+        self.where = tuple(where)
+        self.relations = dict(relations or {})
+        self._statement = lru_cache(maxsize=STATEMENT_CACHE_SIZE)(self._build)
+
+    def filtered(self, session: Session, port: Any) -> Query:
+        """The rows matching the port's filters, unordered and unpaginated."""
+        shape, params = self._filter_shape(session, port)
+        return Query(self._statement(shape), params)
+
+    def order_by(self, port: Any) -> str:
+        """The sort column of the port's query, checked against the allowlist."""
+        order_by = port.order_by or "id"
+        if order_by not in self.sortable:
+            raise InvalidInputException(
+                f"Cannot order by {order_by}. "
+                f"Sortable fields: {', '.join(self.sortable)}."
+            )
+        return order_by
+
+    def select(self, session: Session, port: Any) -> Query:
+        """The page of rows the port asks for, in ``(order_by, id)`` order."""
+        filters, params = self._filter_shape(session, port)
+        order_by = self.order_by(port)
+        descending = is_descending(port.order)
+
+        cursor = None
+        if port.cursor:
+            value, last_id = cursor_position(
+                self.model, port.cursor, order_by, descending
+            )
+            cursor = "id" if order_by == "id" else "null" if value is None else "value"
+            params["cursor_id"] = last_id
+            if cursor == "value":
+                params["cursor_value"] = value
+        offset = bool(port.limit and port.page and not port.cursor)
+        if port.limit:
+            params["limit"] = port.limit
+        if offset:
+            params["offset"] = (port.page - 1) * port.limit
+
+        columns = None
+        if port.fields:
+            columns = tuple(projected_columns(self.model, port))
+        shape = _Shape(
+            filters=filters.filters,
+            search=filters.search,
+            order_by=order_by,
+            descending=descending,
+            cursor=cursor,
+            limit=bool(port.limit),
+            offset=offset,
+            columns=columns,
+            expand=tuple(getattr(port, "expand", None) or ()),
+        )
+        return Query(self._statement(shape), params)
+
+    def next_cursor(self, instances: Sequence[Any], port: Any) -> Optional[str]:
+        """
+        The cursor of the page after ``instances``, the rows ``select`` loaded
+        for ``port``, or None on the last page. The position is read from the
+        last row itself, so it also works for sort columns the DTOs don't carry.
+        """
+        if not port.limit or len(instances) < port.limit:
+            return None
+        order_by = self.order_by(port)
+        last = instances[-1]
+        return encode_cursor(
+            order_by,
+            is_descending(port.order),
+            getattr(last, order_by),
+            getattr(last, "id"),
+        )
+
+    def _filter_shape(self, session: Session, port: Any) -> tuple[_Shape, dict]:
+        active: list[tuple[str, bool]] = []
+        params: dict[str, Any] = {}
+        for name, spec in self.filters.items():
+            value = getattr(port, name)
+            if not value:
+                continue
+            if spec.op == "contains":
+                fts = uses_fts(session, value)
+                value = contains_query(spec.column or name, value, fts)
+                active.append((name, fts))
+            else:
+                active.append((name, False))
+            params[name] = value
+
+        search_shape = None
+        if port.q and port.q.split():
+            fts_words, like_words = split_search(session, port.q)
+            if fts_words:
+                params["q_fts"] = fts_words_query(fts_words)
+            for i, word in enumerate(like_words):
+                params[f"q_like_{i}"] = f"%{word}%"
+            search_shape = (bool(fts_words), len(like_words))
+        return _Shape(filters=tuple(active), search=search_shape), params
+
+    def _build(self, shape: _Shape) -> Select:
+        model = self.model
+        clauses = list(self.where)
+        for name, fts in shape.filters:
+            spec = self.filters[name]
+            column_name = spec.column or name
+            if spec.op == "contains":
+                value = bindparam(name, type_=String)
+                clauses.append(contains(model, column_name, value, fts))
+                continue
+            column = getattr(model, column_name)
+            value = bindparam(name, type_=column.type)
+            if spec.op == "ge":
+                clauses.append(column >= value)
+            elif spec.op == "le":
+                clauses.append(column <= value)
+            else:
+                clauses.append(column == value)
+        if shape.search is not None:
+            has_fts, like_count = shape.search
+            clauses.append(
+                search(
+                    model,
+                    bindparam("q_fts", type_=String) if has_fts else None,
+                    [bindparam(f"q_like_{i}", type_=String) for i in range(like_count)],
+                )
+            )
+
+        stmt = select(model)
+        if clauses:
+            stmt = stmt.where(and_(*clauses))
+        if shape.order_by is None:
+            return stmt
+
+        if shape.cursor is not None:
+            cursor_value = None
+            if shape.cursor == "value":
+                column_type = inspect(model).columns[shape.order_by].type
+                cursor_value = bindparam("cursor_value", type_=column_type)
+            last_id = bindparam("cursor_id", type_=Integer)
+            stmt = stmt.where(
+                seek_predicate(
+                    model, shape.order_by, shape.descending, cursor_value, last_id
+                )
+            )
+        stmt = stmt.order_by(*order_clauses(model, shape.order_by, shape.descending))
+        if shape.limit:
+            stmt = stmt.limit(bindparam("limit", type_=Integer))
+        if shape.offset:
+            stmt = stmt.offset(bindparam("offset", type_=Integer))
+        if shape.columns is not None:
+            stmt = project(stmt, model, shape.columns)
+        if shape.expand:
+            stmt = stmt.options(
+                *(selectinload(self.relations[name]) for name in shape.expand)
+            )
+        return stmt
@@ -0,0 +1,208 @@
+"""
+Substring / free-text search backend.
+
+On SQLite every searchable table gets an external-content FTS5 shadow table
+(``<table>_fts``) using the trigram tokenizer, kept in sync with the base table
+by triggers, so substring filters are answered from the trigram index instead
+of a ``LIKE '%x%'`` scan. On PostgreSQL the same columns get ``pg_trgm`` GIN
+indexes (created by the migrations), which make the plain ``ILIKE`` indexable.
+"""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Optional, cast
+
+from sqlalchemy import (
+    DDL,
+    Select,
+    Table,
+    and_,
+    column,
+    event,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.repositories.database.core import Base
+
+# The trigram tokenizer cannot match terms shorter than three characters.
+MIN_TRIGRAM_LENGTH = 3
+
+_search_columns: dict[str, tuple[str, ...]] = {}
+
+
+def fts_table_name(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+
+def fts_insert_trigger(table_name: str, columns: tuple[str, ...]) -> str:
+    fts = fts_table_name(table_name)
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END"
+    )
+
+
+def fts_create_statements(table_name: str, columns: tuple[str, ...]) -> list[str]:
+    fts = fts_table_name(table_name)
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{table_name}', content_rowid='id', tokenize='trigram')",
+        fts_insert_trigger(table_name, columns),
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} "
+        f"ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def register_search_columns(model: type[Base], *columns: str) -> None:
+    """
+    Declares the text columns of ``model`` that substring filters and ``q=``
+    search over, and hooks the FTS5 shadow table into ``create_all``/``drop_all``.
+    """
+    model_table = cast(Table, model.__table__)
+    _search_columns[model_table.name] = columns
+    for statement in fts_create_statements(model_table.name, columns):
+        event.listen(
+            model_table, "after_create", DDL(statement).execute_if(dialect="sqlite")
+        )
+    drop_fts = DDL(f"DROP TABLE IF EXISTS {fts_table_name(model_table.name)}")
+    event.listen(model_table, "before_drop", drop_fts.execute_if(dialect="sqlite"))
+
+
+def search_columns(model) -> tuple[str, ...]:
+    return _search_columns[model.__tablename__]
+
+
+@contextmanager
+def deferred_fts_indexing(session: Session, model) -> Iterator[None]:
+    """
+    Bulk-load mode for ``model``: the FTS5 insert trigger is dropped while the
+    block runs, and the rows added meanwhile are indexed afterwards with one
+    ``INSERT ... SELECT``, which costs a fraction of the per-row trigger.
+    Rows committed by the block are indexed even if it raises.
+    """
+    table_name = model.__tablename__
+    if session.get_bind().dialect.name != "sqlite" or table_name not in _search_columns:
+        yield
+        return
+
+    fts = fts_table_name(table_name)
+    columns = _search_columns[table_name]
+    cols = ", ".join(columns)
+    last_id = session.scalar(select(func.max(model.id))) or 0
+    session.execute(text(f"DROP TRIGGER IF EXISTS {fts}_ai"))
+    session.commit()
+    try:
+        yield
+    finally:
+        session.rollback()
+        session.execute(text(fts_insert_trigger(table_name, columns)))
+        session.execute(
+            text(
+                f"INSERT INTO {fts}(rowid, {cols}) "
+                f"SELECT id, {cols} FROM {table_name} WHERE id > :last_id"
+            ),
+            {"last_id": last_id},
+        )
+        session.commit()
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def uses_fts(session: Session, term: str) -> bool:
+    """Whether a substring filter on ``term`` is answered from the trigram index."""
+    return (
+        session.get_bind().dialect.name == "sqlite"
+        and len(term) >= MIN_TRIGRAM_LENGTH
+    )
+
+
+def fts_match(model, query: ColumnElement[str]) -> ColumnElement[bool]:
+    """Rows of ``model`` whose FTS5 shadow row matches the MATCH ``query``."""
+    fts = fts_table_name(model.__tablename__)
+    matching_ids: Select = (
+        select(column("rowid"))
+        .select_from(table(fts))
+        .where(literal_column(fts).op("MATCH")(query))
+    )
+    return model.id.in_(matching_ids)
+
+
+def contains_query(column_name: str, term: str, fts: bool) -> str:
+    """
+    The bound value of a ``contains`` filter on ``term``: an FTS5 query on the
+    column, or the ILIKE pattern.
+    """
+    if fts:
+        return f"{column_name} : {_fts_phrase(term)}"
+    return f"%{term}%"
+
+
+def contains(
+    model, column_name: str, value: ColumnElement[str], fts: bool
+) -> ColumnElement[bool]:
+    """
+    Case-insensitive substring filter on a single searchable column, matching
+    ``value`` as built by ``contains_query``.
+    """
+    if fts:
+        return fts_match(model, value)
+    return getattr(model, column_name).ilike(value)
+
+
+def split_search(session: Session, q: str) -> tuple[list[str], list[str]]:
+    """
+    The words of ``q`` answered from the trigram index and those matched with
+    ILIKE (too short for trigrams, or no FTS on this database).
+    """
+    words = q.split()
+    if session.get_bind().dialect.name != "sqlite":
+        return [], words
+    long_words = [w for w in words if len(w) >= MIN_TRIGRAM_LENGTH]
+    short_words = [w for w in words if len(w) < MIN_TRIGRAM_LENGTH]
+    return long_words, short_words
+
+
+def fts_words_query(words: Sequence[str]) -> str:
+    return " ".join(_fts_phrase(w) for w in words)
+
+
+def search(
+    model,
+    fts_value: Optional[ColumnElement[str]],
+    like_values: Sequence[ColumnElement[str]],
+) -> ColumnElement[bool]:
+    """
+    Free-text filter: every whitespace-separated word of ``q`` must occur as a
+    substring of at least one of the model's searchable columns. ``fts_value``
+    holds the ``fts_words_query`` of the long words (see ``split_search``) and
+    ``like_values`` a ``%word%`` pattern per short word.
+    """
+    clauses: list[ColumnElement] = []
+    if fts_value is not None:
+        clauses.append(fts_match(model, fts_value))
+    for value in like_values:
+        clauses.append(
+            or_(*(getattr(model, c).ilike(value) for c in search_columns(model)))
+        )
+    return and_(*clauses)
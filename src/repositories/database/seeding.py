@@ -0,0 +1,439 @@
+"""
+Bulk generation of realistic sample data for ``manage.py seed``.
+
+Rows are generated in chunks by a process pool and inserted by the calling
+process, one multi-row INSERT and commit per chunk, with the SQLite FTS
+index filled once per table afterwards rather than by its per-row trigger.
+Faker is only used to fill per-worker pools of names, cities and texts that
+the rows are then sampled from, since calling it per row would dominate the
+run.
+
+Unique keys (NIM, NIDN, kode_mk) are numbered sequentially after the highest
+key of the same format already in the table, found with one query per table,
+and e-mails embed the NIDN, so no row needs an existence check. Foreign keys
+are sampled from the ids already present in the parent tables, which are
+seeded first.
+
+Jadwal are laid out on a weekly grid of two-hour periods such that no two
+generated rows book the same ruangan or dosen in the same period, so seeded
+schedules pass the double-booking check. Generated rows that would overlap a
+jadwal already stored in the table are inserted inactive instead.
+"""
+
+import math
+import random
+import re
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Optional, cast
+
+from faker import Faker  # type: ignore[import-not-found]
+from sqlalchemy import Table, insert, select
+from sqlalchemy.orm import Session
+
+from src.application.dtos.jadwal_dto import CreateJadwalDto
+from src.application.enums import DosenStatus, MahasiswaStatus, StatusTugas
+from src.repositories.database.core import Base
+from src.repositories.database.jadwal import JadwalRepository
+from src.repositories.database.models.dosen import DosenModel
+from src.repositories.database.models.jadwal import JadwalModel
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+from src.repositories.database.models.mata_kuliah import MataKuliahModel
+from src.repositories.database.models.timestamps import utc_now
+from src.repositories.database.models.tugas import TugasModel
+from src.repositories.database.search import deferred_fts_indexing
+from src.repositories.database.versions import mark_changed
+
+# Rows per generated chunk, i.e. per INSERT and per transaction.
+SEED_BATCH_SIZE = 20_000
+# Distinct Faker values drawn per worker and kind of value.
+FAKER_POOL_SIZE = 2_000
+
+SEED_TABLES = ("mahasiswa", "dosen", "mata_kuliah", "jadwal", "tugas")
+
+MODELS: dict[str, type[Base]] = {
+    "mahasiswa": MahasiswaModel,
+    "dosen": DosenModel,
+    "mata_kuliah": MataKuliahModel,
+    "jadwal": JadwalModel,
+    "tugas": TugasModel,
+}
+
+# Parent tables whose ids the generated rows of a table reference.
+FOREIGN_KEYS: dict[str, tuple[str, ...]] = {
+    "jadwal": ("mata_kuliah", "dosen"),
+    "tugas": ("mata_kuliah", "mahasiswa"),
+}
+
+HARI = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu")
+# Jadwal start on the hour of a two-hour period and last at most two hours, so
+# jadwal in different periods never overlap.
+PERIOD_STARTS = tuple(time(hour) for hour in range(7, 21, 2))
+JADWAL_MINUTES = (60, 90, 120)
+WEEK_SLOTS = len(HARI) * len(PERIOD_STARTS)
+PRODI = ("TI", "SIB", "MI", "TK")
+GEDUNG = ("A", "B", "C", "D")
+FLOORS = 4
+ROOMS_PER_FLOOR = 20
+GELAR = ("S.T., M.T.", "S.Kom., M.Kom.", "M.Sc.", "Dr.", "S.Si., M.Si.")
+MATA_KULIAH = (
+    "Algoritma dan Pemrograman",
+    "Basis Data",
+    "Jaringan Komputer",
+    "Sistem Operasi",
+    "Rekayasa Perangkat Lunak",
+    "Kecerdasan Buatan",
+    "Pemrograman Web",
+    "Statistika",
+    "Matematika Diskrit",
+    "Keamanan Informasi",
+)
+TINGKAT = ("Dasar", "Lanjut", "Terapan", "I", "II")
+JENIS_TUGAS = ("Laporan", "Kuis", "Proyek", "Praktikum", "Makalah", "Presentasi")
+
+
+def table_sizes(scale: int) -> dict[str, int]:
+    """Rows generated per table for ``scale`` mahasiswa."""
+    return {
+        "mahasiswa": scale,
+        "dosen": max(1, scale // 25),
+        "mata_kuliah": max(1, scale // 10),
+        "jadwal": max(1, scale // 5),
+        "tugas": 2 * scale,
+    }
+
+
+@dataclass(frozen=True)
+class KeyFormat:
+    """Unique keys of the form ``prefix`` + ``width`` zero-padded digits."""
+
+    column: str
+    prefix: str
+    width: int
+
+    def format(self, number: int) -> str:
+        if number >= 10**self.width:
+            raise ValueError(f"Ran out of {self.column} values after {number}.")
+        return f"{self.prefix}{number:0{self.width}d}"
+
+
+def _key_formats() -> dict[str, KeyFormat]:
+    return {
+        "mahasiswa": KeyFormat("nim", f"{date.today().year % 100:02d}", 8),
+        "dosen": KeyFormat("nidn", "0", 9),
+        "mata_kuliah": KeyFormat("kode_mk", "MK", 7),
+    }
+
+
+def next_key_number(session: Session, model: type[Base], key: KeyFormat) -> int:
+    """One past the highest key of ``key``'s format already in the table."""
+    column = getattr(model, key.column)
+    below = column <= f"{key.prefix}{'9' * key.width}"
+    while True:
+        value = session.scalar(
+            select(column)
+            .where(column >= key.format(0), below)
+            .order_by(column.desc())
+            .limit(1)
+        )
+        if value is None:
+            return 0
+        digits = value[len(key.prefix) :]
+        if len(digits) == key.width and digits.isdigit():
+            return int(digits) + 1
+        # A key of another format sorting in the same range: look below it.
+        below = column < value
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Chunk:
+    table: str
+    index: int
+    # Number of the first unique key of the chunk.
+    first_key: int
+    count: int
+
+
+_pools: dict[str, list[Any]] = {}
+_foreign_keys: dict[str, Sequence[int]] = {}
+_keys: dict[str, KeyFormat] = {}
+_seed = 0
+
+
+def _init_worker(
+    seed: int, foreign_keys: Mapping[str, Sequence[int]], keys: Mapping[str, KeyFormat]
+) -> None:
+    global _seed
+    _seed = seed
+    _foreign_keys.clear()
+    _foreign_keys.update(foreign_keys)
+    _keys.clear()
+    _keys.update(keys)
+
+    fake = Faker("id_ID")
+    fake.seed_instance(seed)
+    _pools.update(
+        first_names=[fake.first_name() for _ in range(FAKER_POOL_SIZE)],
+        last_names=[fake.last_name() for _ in range(FAKER_POOL_SIZE)],
+        cities=list(dict.fromkeys(fake.city() for _ in range(FAKER_POOL_SIZE))),
+        birth_dates=[
+            fake.date_of_birth(minimum_age=18, maximum_age=25)
+            for _ in range(FAKER_POOL_SIZE)
+        ],
+        sentences=[fake.sentence(nb_words=12) for _ in range(FAKER_POOL_SIZE)],
+    )
+
+
+def _name(rng: random.Random) -> str:
+    return f"{rng.choice(_pools['first_names'])} {rng.choice(_pools['last_names'])}"
+
+
+def _mahasiswa(rng: random.Random, chunk: Chunk) -> Iterable[dict[str, Any]]:
+    nim = _keys["mahasiswa"]
+    for number in range(chunk.first_key, chunk.first_key + chunk.count):
+        yield {
+            "nim": nim.format(number),
+            "nama": _name(rng),
+            "kelas": f"{rng.choice(PRODI)}-{rng.randint(1, 4)}"
+            f"{rng.choice('ABCDEFGHI')}",
+            "tempat_lahir": rng.choice(_pools["cities"]),
+            "tanggal_lahir": rng.choice(_pools["birth_dates"]),
+            "status": rng.choices(list(MahasiswaStatus), weights=(85, 3, 9, 3))[0],
+        }
+
+
+def _dosen(rng: random.Random, chunk: Chunk) -> Iterable[dict[str, Any]]:
+    nidn = _keys["dosen"]
+    for number in range(chunk.first_key, chunk.first_key + chunk.count):
+        first_name = rng.choice(_pools["first_names"])
+        key = nidn.format(number)
+        local_part = re.sub(r"[^a-z]", "", first_name.lower()) or "dosen"
+        yield {
+            "nidn": key,
+            "nama": f"{first_name} {rng.choice(_pools['last_names'])}, "
+            f"{rng.choice(GELAR)}",
+            "email": f"{local_part}.{key}@kampus.ac.id",
+            "status": rng.choices(list(DosenStatus), weights=(90, 5, 5))[0],
+        }
+
+
+def _mata_kuliah(rng: random.Random, chunk: Chunk) -> Iterable[dict[str, Any]]:
+    kode_mk = _keys["mata_kuliah"]
+    for number in range(chunk.first_key, chunk.first_key + chunk.count):
+        yield {
+            "kode_mk": kode_mk.format(number),
+            "nama_mk": f"{rng.choice(MATA_KULIAH)} {rng.choice(TINGKAT)}",
+            "sks": rng.randint(1, 4),
+            "is_active": rng.random() < 0.95,
+        }
+
+
+def _ruangan(number: int) -> str:
+    floor, room = divmod(number // len(GEDUNG), ROOMS_PER_FLOOR)
+    return f"{GEDUNG[number % len(GEDUNG)]}{floor + 1}{room + 1:02d}"
+
+
+def _jadwal(rng: random.Random, chunk: Chunk) -> Iterable[dict[str, Any]]:
+    # Row n is taught by dosen n % D in round n // D. A dosen's rounds map to
+    # distinct week slots, and the dosen sharing a slot get distinct ruangan,
+    # so no two rows of the run double-book either; seed_table makes sure
+    # there are at most WEEK_SLOTS rounds.
+    dosen_ids = _foreign_keys["dosen"]
+    slots = [(hari, start) for hari in HARI for start in PERIOD_STARTS]
+    random.Random(_seed).shuffle(slots)
+    rooms = max(len(dosen_ids), len(GEDUNG) * FLOORS * ROOMS_PER_FLOOR)
+    for number in range(chunk.first_key, chunk.first_key + chunk.count):
+        round_, dosen = divmod(number, len(dosen_ids))
+        slot = (round_ + dosen * len(PERIOD_STARTS)) % WEEK_SLOTS
+        hari, start = slots[slot]
+        end = datetime.combine(date.min, start) + timedelta(
+            minutes=rng.choice(JADWAL_MINUTES)
+        )
+        yield {
+            "hari": hari,
+            "jam_mulai": start,
+            "jam_selesai": end.time(),
+            "ruangan": _ruangan((dosen + slot * 37) % rooms),
+            "is_active": rng.random() < 0.95,
+            "mata_kuliah_id": rng.choice(_foreign_keys["mata_kuliah"]),
+            "dosen_id": dosen_ids[dosen],
+        }
+
+
+def _tugas(rng: random.Random, chunk: Chunk) -> Iterable[dict[str, Any]]:
+    today = datetime.combine(date.today(), time(23, 59))
+    for _ in range(chunk.count):
+        yield {
+            "judul": f"{rng.choice(JENIS_TUGAS)} {rng.choice(MATA_KULIAH)}",
+            "deskripsi": rng.choice(_pools["sentences"]),
+            "deadline": today + timedelta(days=rng.randint(-120, 120)),
+            "status": rng.choice(list(StatusTugas)),
+            "mata_kuliah_id": rng.choice(_foreign_keys["mata_kuliah"]),
+            "mahasiswa_id": rng.choice(_foreign_keys["mahasiswa"]),
+        }
+
+
+GENERATORS: dict[str, Callable[[random.Random, Chunk], Iterable[dict[str, Any]]]] = {
+    "mahasiswa": _mahasiswa,
+    "dosen": _dosen,
+    "mata_kuliah": _mata_kuliah,
+    "jadwal": _jadwal,
+    "tugas": _tugas,
+}
+
+
+def _generate_chunk(chunk: Chunk) -> list[dict[str, Any]]:
+    # Seeded per chunk, so the data does not depend on the number of workers.
+    rng = random.Random(f"{_seed}:{chunk.table}:{chunk.index}:{chunk.first_key}")
+    # Set here rather than by the column defaults, once per chunk.
+    now = utc_now()
+    return [
+        {**row, "created_at": now, "updated_at": now}
+        for row in GENERATORS[chunk.table](rng, chunk)
+    ]
+
+
+# ----------------------------------------------------------------------
+# Loading
+# ----------------------------------------------------------------------
+def _bounded_map(
+    executor: Executor, chunks: Sequence[Chunk], ahead: int
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    ``executor.map(_generate_chunk, chunks)`` with at most ``ahead`` chunks
+    generated but not yet consumed, so memory stays bounded when inserting is
+    slower than generating.
+    """
+    pending: deque[Future[list[dict[str, Any]]]] = deque()
+    for chunk in chunks:
+        if len(pending) >= ahead:
+            yield pending.popleft().result()
+        pending.append(executor.submit(_generate_chunk, chunk))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _deactivate_stored_overlaps(
+    session: Session, rows: Sequence[dict[str, Any]]
+) -> None:
+    """Marks inactive the generated jadwal that overlap an active stored one."""
+    active = [row for row in rows if row["is_active"]]
+    proposed = [
+        CreateJadwalDto.model_construct(
+            **{name: row[name] for name in CreateJadwalDto.model_fields}
+        )
+        for row in active
+    ]
+    repository = JadwalRepository(session)
+    for field_name in ("ruangan", "dosen_id"):
+        for index, _ in repository.find_overlaps(proposed, field_name):
+            active[index]["is_active"] = False
+
+
+def _chunks(table: str, count: int, first_key: int) -> list[Chunk]:
+    return [
+        Chunk(table, index, first_key + start, min(SEED_BATCH_SIZE, count - start))
+        for index, start in enumerate(range(0, count, SEED_BATCH_SIZE))
+    ]
+
+
+def seed_table(
+    session: Session,
+    table: str,
+    count: int,
+    workers: int = 1,
+    seed: int = 0,
+    progress: Optional[Callable[[str, int, int], None]] = None,
+) -> int:
+    """
+    Generates and inserts ``count`` rows into ``table``; returns the number of
+    rows inserted. ``progress(table, inserted, count)`` is called per chunk.
+    """
+    model = MODELS[table]
+    keys = _key_formats()
+    first_key = 0
+    if table in keys:
+        first_key = next_key_number(session, model, keys[table])
+
+    foreign_keys: dict[str, Sequence[int]] = {}
+    for parent in FOREIGN_KEYS.get(table, ()):
+        ids = array("q", session.scalars(select(getattr(MODELS[parent], "id"))))
+        if not ids:
+            raise ValueError(f"Seeding {table} requires existing {parent} rows.")
+        foreign_keys[parent] = ids
+
+    check_stored_overlaps = False
+    if table == "jadwal":
+        needed = math.ceil(count / WEEK_SLOTS)
+        if len(foreign_keys["dosen"]) < needed:
+            raise ValueError(
+                f"Seeding {count} jadwal without double-booking requires at "
+                f"least {needed} dosen."
+            )
+        check_stored_overlaps = (
+            session.scalar(
+                select(JadwalModel.id).where(JadwalModel.is_active.is_(True)).limit(1)
+            )
+            is not None
+        )
+
+    chunks = _chunks(table, count, first_key)
+    inserted = 0
+    executor = None
+    if workers > 1 and len(chunks) > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(seed, foreign_keys, keys),
+        )
+        batches = _bounded_map(executor, chunks, ahead=2 * workers)
+    else:
+        _init_worker(seed, foreign_keys, keys)
+        batches = map(_generate_chunk, chunks)
+    try:
+        with deferred_fts_indexing(session, model):
+            for rows in batches:
+                if check_stored_overlaps:
+                    _deactivate_stored_overlaps(session, rows)
+                # A Core insert skips the ORM's per-row bookkeeping, which
+                # also means the table's change version is marked by hand.
+                session.execute(insert(cast(Table, model.__table__)), rows)
+                mark_changed(session, [table])
+                session.commit()
+                inserted += len(rows)
+                if progress is not None:
+                    progress(table, inserted, count)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return inserted
+
+
+def seed_tables(
+    session: Session,
+    scale: int,
+    tables: Sequence[str] = SEED_TABLES,
+    workers: int = 1,
+    seed: int = 0,
+    progress: Optional[Callable[[str, int, int], None]] = None,
+) -> dict[str, int]:
+    """
+    Seeds ``tables`` at ``scale`` (see ``table_sizes``), parents before the
+    tables that reference them; returns the rows inserted per table.
+    """
+    unknown = set(tables) - set(SEED_TABLES)
+    if unknown:
+        raise ValueError(f"Unknown tables: {', '.join(sorted(unknown))}.")
+    sizes = table_sizes(scale)
+    return {
+        table: seed_table(session, table, sizes[table], workers, seed, progress)
+        for table in SEED_TABLES
+        if table in tables
+    }
@@ -0,0 +1,32 @@
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, Optional
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+# Rows fetched per round trip (and held in memory) while streaming a result.
+STREAM_BATCH_SIZE = 500
+
+
+def stream_entities(
+    session: Session,
+    stmt: Select,
+    convert: Optional[Callable[[Any], Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+) -> Iterator[Any]:
+    """
+    Lazily yields ``to_entity()`` (or ``convert(row)``) of every row selected
+    by ``stmt`` executed with ``params``.
+
+    The statement runs with ``yield_per`` so rows are fetched from a
+    server-side cursor in batches of STREAM_BATCH_SIZE rather than buffered
+    up front; nothing is executed until the iterator is first advanced.
+    """
+    result = session.scalars(
+        stmt, params, execution_options={"yield_per": STREAM_BATCH_SIZE}
+    )
+    try:
+        for instance in result:
+            yield convert(instance) if convert else instance.to_entity()
+    finally:
+        result.close()
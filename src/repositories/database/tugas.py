@@ -1,20 +1,64 @@
+from collections.abc import Callable, Iterator
 from typing import Optional
 from typing_extensions import override
 
-from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
+from src.application.dtos.changes_dto import ChangesDto
+from src.application.dtos.count_dto import CountDto, CursorPageDto
 from src.application.dtos.tugas_dto import (
     CreateTugasDto,
+    TugasDetailDto,
     TugasDto,
     UpdateTugasDto,
 )
+from src.application.enums import StatusTugas
 from src.application.exceptions import NotFoundException
 from src.application.usecases.interfaces.tugas_repository import (
     TugasRepositoryInterface,
 )
+from src.ports.changes import GetChangesPort
 from src.ports.tugas import GetTugasPort
+from src.repositories.database.changes import read_changes
+from src.repositories.database.counting import count_rows
 from src.repositories.database.models.tugas import TugasModel
+from src.repositories.database.projection import entity_converter
+from src.repositories.database.query import Filter, QuerySpec
+from src.repositories.database.streaming import stream_entities
+from src.repositories.database.writes import insert_returning, update_returning
+
+# Relationships loaded for each name accepted by ``expand``. selectinload keeps
+# the paginated main query untouched and costs one extra query per relation,
+# however many rows the page holds.
+EXPANDABLE_RELATIONS = {
+    "mahasiswa": TugasModel.mahasiswa,
+    "mata_kuliah": TugasModel.mata_kuliah,
+}
+
+
+# deskripsi is unbounded text and deliberately not sortable.
+TUGAS_QUERY = QuerySpec(
+    TugasModel,
+    filters=[
+        Filter("id"),
+        Filter("judul", "contains"),
+        Filter("status"),
+        Filter("mata_kuliah_id"),
+        Filter("mahasiswa_id"),
+        Filter("deadline_from", "ge", column="deadline"),
+        Filter("deadline_to", "le", column="deadline"),
+    ],
+    sortable=(
+        "judul",
+        "deadline",
+        "status",
+        "mata_kuliah_id",
+        "mahasiswa_id",
+        "created_at",
+        "updated_at",
+    ),
+    relations=EXPANDABLE_RELATIONS,
+)
 
 
 class TugasRepository(TugasRepositoryInterface):
@@ -36,62 +80,58 @@ class TugasRepository(TugasRepositoryInterface):
         self.session.refresh(tugas_model)
         return tugas_model.to_entity()
 
+    def _converter(
+        self, get_tugas_port: GetTugasPort
+    ) -> Callable[[TugasModel], TugasDto]:
+        expand = get_tugas_port.expand
+        if get_tugas_port.fields:
+            dto_type = TugasDetailDto if expand else TugasDto
+            return entity_converter(TugasModel, dto_type, get_tugas_port)
+        if expand:
+            return lambda model: model.to_detail_entity(expand)
+        return TugasModel.to_entity
+
+    @override
+    def read_page(self, get_tugas_port: GetTugasPort) -> CursorPageDto[TugasDto]:
+        query = TUGAS_QUERY.select(self.session, get_tugas_port)
+        tugas_models = self.session.scalars(query.statement, query.params).all()
+        convert = self._converter(get_tugas_port)
+        return CursorPageDto[TugasDto](
+            items=[convert(t) for t in tugas_models],
+            next_cursor=TUGAS_QUERY.next_cursor(tugas_models, get_tugas_port),
+        )
+
     @override
     def read(self, get_tugas_port: GetTugasPort) -> list[TugasDto]:
-        stmt = select(TugasModel)
-
-        filters = []
-        if get_tugas_port.id:
-            filters.append(TugasModel.id == get_tugas_port.id)
-        if get_tugas_port.judul:
-            filters.append(TugasModel.judul.ilike(f"%{get_tugas_port.judul}%"))
-        if get_tugas_port.status:
-            filters.append(TugasModel.status == get_tugas_port.status)
-        if get_tugas_port.mata_kuliah_id:
-            filters.append(TugasModel.mata_kuliah_id == get_tugas_port.mata_kuliah_id)
-        if get_tugas_port.mahasiswa_id:
-            filters.append(TugasModel.mahasiswa_id == get_tugas_port.mahasiswa_id)
-        if get_tugas_port.deadline_from:
-            filters.append(TugasModel.deadline >= get_tugas_port.deadline_from)
-        if get_tugas_port.deadline_to:
-            filters.append(TugasModel.deadline <= get_tugas_port.deadline_to)
-
-        if filters:
-            stmt = stmt.where(and_(*filters))
-
-        if get_tugas_port.order_by:
-            order_column = getattr(TugasModel, get_tugas_port.order_by, None)
-            if order_column:
-                if get_tugas_port.order and get_tugas_port.order.lower() == "desc":
-                    stmt = stmt.order_by(order_column.desc())
-                else:
-                    stmt = stmt.order_by(order_column.asc())
-
-        if get_tugas_port.limit:
-            stmt = stmt.limit(get_tugas_port.limit)
-        if get_tugas_port.page and get_tugas_port.limit:
-            stmt = stmt.offset((get_tugas_port.page - 1) * get_tugas_port.limit)
-
-        tugas_models = self.session.execute(stmt).scalars().all()
-        return [t.to_entity() for t in tugas_models]
+        return self.read_page(get_tugas_port).items
 
     @override
-    def update(self, tugas_dto: UpdateTugasDto) -> TugasDto:
-        tugas_model: Optional[TugasModel] = self.session.get(TugasModel, tugas_dto.id)
-        if not tugas_model:
-            raise NotFoundException(resource_name="Tugas", identifier=tugas_dto.id)
+    def stream(self, get_tugas_port: GetTugasPort) -> Iterator[TugasDto]:
+        query = TUGAS_QUERY.select(self.session, get_tugas_port)
+        convert = self._converter(get_tugas_port)
+        return stream_entities(self.session, query.statement, convert, query.params)
 
-        tugas_model.judul = tugas_dto.judul
-        tugas_model.deskripsi = tugas_dto.deskripsi
-        tugas_model.deadline = tugas_dto.deadline
-        tugas_model.status = tugas_dto.status
-        tugas_model.mata_kuliah_id = tugas_dto.mata_kuliah_id
-        tugas_model.mahasiswa_id = tugas_dto.mahasiswa_id
+    @override
+    def count(self, get_tugas_port: GetTugasPort) -> CountDto:
+        query = TUGAS_QUERY.filtered(self.session, get_tugas_port)
+        return count_rows(self.session, TugasModel, query.statement, query.params)
 
-        self.session.add(tugas_model)
-        self.session.commit()
-        self.session.refresh(tugas_model)
-        return tugas_model.to_entity()
+    @override
+    def changes(self, get_changes_port: GetChangesPort) -> ChangesDto[TugasDto]:
+        return read_changes(
+            self.session,
+            TugasModel,
+            get_changes_port,
+            is_deleted=lambda t: t.status == StatusTugas.CANCELLED,
+        )
+
+    @override
+    def update(self, tugas_dto: UpdateTugasDto) -> TugasDto:
+        values = tugas_dto.model_dump(exclude={"id"})
+        updated = update_returning(self.session, TugasModel, tugas_dto.id, values)
+        if updated is None:
+            raise NotFoundException(resource_name="Tugas", identifier=tugas_dto.id)
+        return updated
 
     @override
     def delete(self, tugas_id: int) -> bool:
@@ -104,3 +144,9 @@ class TugasRepository(TugasRepositoryInterface):
         self.session.add(tugas_model)
         self.session.commit()
         return True
+
+    @override
+    def bulk_create(self, tugas_dtos: list[CreateTugasDto]) -> list[TugasDto]:
+        return insert_returning(
+            self.session, TugasModel, [dto.model_dump() for dto in tugas_dtos]
+        )
@@ -0,0 +1,171 @@
+"""
+Per-table change versions.
+
+Every commit that inserted, updated or deleted rows of a table increments that
+table's counter in ``table_versions`` within the same transaction, and the new
+value is mirrored in process memory once the commit has succeeded. Caches and
+ETags can then decide freshness with an integer comparison instead of
+re-reading the data.
+
+Tracking happens through Session events, so it covers unit-of-work flushes as
+well as ORM ``insert()/update()/delete()`` statements run through a session.
+Writes that bypass the Session must call ``mark_changed`` themselves.
+"""
+
+import threading
+from collections.abc import Collection, Iterable, Mapping
+from itertools import chain
+from typing import Any, cast
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Table,
+    event,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session, UOWTransaction
+
+from src.repositories.database.core import Base
+
+table_versions = Table(
+    "table_versions",
+    Base.metadata,
+    Column("table_name", String(64), primary_key=True),
+    Column("version", Integer, nullable=False, default=0),
+)
+
+
+@event.listens_for(table_versions, "after_create")
+def _seed_versions(target: Table, connection: Connection, **kw: Any) -> None:
+    # One row per table up front, so a bump is always a plain UPDATE.
+    connection.execute(
+        insert(table_versions),
+        [
+            {"table_name": name, "version": 0}
+            for name in Base.metadata.tables
+            if name != table_versions.name
+        ],
+    )
+
+
+_CHANGED_TABLES = "changed_tables"
+_BUMPED_VERSIONS = "bumped_versions"
+
+_known_versions: dict[str, int] = {}
+_known_versions_lock = threading.Lock()
+
+
+def known_version(table_name: str) -> int:
+    """Latest version of ``table_name`` this process has committed or read."""
+    return _known_versions.get(table_name, 0)
+
+
+def remember_versions(versions: Mapping[str, int]) -> None:
+    with _known_versions_lock:
+        for table_name, version in versions.items():
+            if version > _known_versions.get(table_name, 0):
+                _known_versions[table_name] = version
+
+
+def forget_versions() -> None:
+    with _known_versions_lock:
+        _known_versions.clear()
+
+
+def mark_changed(session: Session, table_names: Iterable[str]) -> None:
+    """Records that the session's current transaction wrote to ``table_names``."""
+    session.info.setdefault(_CHANGED_TABLES, set()).update(table_names)
+
+
+def read_versions(session: Session, table_names: Collection[str]) -> dict[str, int]:
+    """Current versions of ``table_names`` from the database (0 if never bumped)."""
+    rows = session.execute(
+        select(table_versions.c.table_name, table_versions.c.version).where(
+            table_versions.c.table_name.in_(sorted(table_names))
+        )
+    ).tuples().all()
+    versions = dict.fromkeys(table_names, 0)
+    versions.update(dict(rows))
+    # Picks up commits made by other processes for the in-memory mirror.
+    remember_versions(versions)
+    return versions
+
+
+def bump_versions(session: Session, table_names: Collection[str]) -> dict[str, int]:
+    """Increments the versions of ``table_names`` and returns the new values."""
+    names = sorted(table_names)
+    bumped: dict[str, Any] = dict(
+        session.execute(
+            update(table_versions)
+            .where(table_versions.c.table_name.in_(names))
+            .values(version=table_versions.c.version + 1)
+            .returning(table_versions.c.table_name, table_versions.c.version)
+        ).tuples().all()
+    )
+    missing = [name for name in names if name not in bumped]
+    if missing:
+        session.execute(
+            insert(table_versions),
+            [{"table_name": name, "version": 1} for name in missing],
+        )
+        bumped.update(dict.fromkeys(missing, 1))
+    return bumped
+
+
+def _table_name(mapper: Mapper[Any]) -> str:
+    return cast(Table, mapper.local_table).name
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, flush_context: UOWTransaction) -> None:
+    changed = {
+        _table_name(inspect(instance).mapper)
+        for instance in chain(session.new, session.deleted)
+    }
+    changed.update(
+        _table_name(inspect(instance).mapper)
+        for instance in session.dirty
+        if session.is_modified(instance)
+    )
+    if changed:
+        mark_changed(session, changed)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state: ORMExecuteState) -> None:
+    # Core statements (including the table_versions bump itself) have no mapper.
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        mark_changed(orm_execute_state.session, [_table_name(mapper)])
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session: Session) -> None:
+    # Pending changes are flushed by commit only after this hook runs.
+    session.flush()
+    changed = session.info.pop(_CHANGED_TABLES, None)
+    if changed:
+        session.info[_BUMPED_VERSIONS] = bump_versions(session, changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_after_commit(session: Session) -> None:
+    bumped = session.info.pop(_BUMPED_VERSIONS, None)
+    if bumped:
+        remember_versions(bumped)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_TABLES, None)
+    session.info.pop(_BUMPED_VERSIONS, None)
@@ -0,0 +1,135 @@
+"""Single-statement write helpers built on ``INSERT/UPDATE ... RETURNING``."""
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, NamedTuple, Optional, cast
+
+from sqlalchemy import ColumnElement, Table, insert, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+# Registers the commit hooks that bump table_versions for every write.
+from src.repositories.database import versions
+from src.repositories.database.core import Base
+from src.repositories.database.models.timestamps import utc_now
+
+# Rows per INSERT ... ON CONFLICT statement; keeps the bind parameters of a
+# multi-row VALUES list well below the limits of every backend.
+UPSERT_BATCH_SIZE = 500
+
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE ... WHERE.
+_UPSERT_INSERTS: dict[str, Callable[[Table], Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def insert_returning(
+    session: Session, model: type[Base], rows: Sequence[dict[str, Any]]
+) -> list[Any]:
+    """
+    Inserts ``rows`` with one multi-row INSERT ... RETURNING in a single
+    transaction and returns the created entities in input order.
+    """
+    if not rows:
+        return []
+    stmt = insert(model).returning(model, sort_by_parameter_order=True)
+    created = session.scalars(stmt, list(rows)).all()
+    # Convert before commit: commit expires the instances, and reading them
+    # afterwards would issue one refresh SELECT per row.
+    entities = [instance.to_entity() for instance in created]
+    session.commit()
+    return entities
+
+
+def update_returning(
+    session: Session,
+    model: type[Base],
+    identifier: int,
+    values: Mapping[str, Any],
+    *where: ColumnElement[bool],
+) -> Optional[Any]:
+    """
+    Applies ``values`` to the row with id ``identifier`` with one
+    ``UPDATE ... WHERE id = :id RETURNING *`` and returns the updated entity,
+    or None when no row has that id. Extra ``where`` clauses narrow the rows
+    that may be updated, e.g. to skip soft-deleted ones.
+    """
+    stmt = (
+        update(model)
+        .where(getattr(model, "id") == identifier, *where)
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    updated = session.scalars(stmt).one_or_none()
+    entity = updated.to_entity() if updated is not None else None
+    session.commit()
+    return entity
+
+
+class Upserted(NamedTuple):
+    created: list[Any]
+    updated: list[Any]
+    unchanged: list[Any]
+
+
+def upsert_returning(
+    session: Session, model: type[Base], rows: Sequence[dict[str, Any]], key: str
+) -> Upserted:
+    """
+    Inserts ``rows`` or, when a row with the same unique ``key`` exists,
+    updates it with ``INSERT ... ON CONFLICT (key) DO UPDATE ... WHERE`` some
+    column differs, in a single transaction. Rows that already hold the sent
+    values are neither written nor returned, so they cost no write and do not
+    bump the table version; their keys are reported as unchanged.
+    """
+    if not rows:
+        return Upserted([], [], [])
+    table = cast(Table, model.__table__)
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name not in _UPSERT_INSERTS:
+        raise ValueError(f"Upserts are not supported on {dialect_name}")
+    # Every row is stamped with the same time: a returned row whose created_at
+    # equals its updated_at was inserted by this statement, any other one was
+    # updated by it.
+    now = utc_now()
+    columns = [name for name in rows[0] if name != key]
+    written: dict[Any, tuple[Any, bool]] = {}
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start : start + UPSERT_BATCH_SIZE]
+        stmt = _UPSERT_INSERTS[dialect_name](table).values(
+            [{**row, "created_at": now, "updated_at": now} for row in batch]
+        )
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[key]],
+            set_={
+                **{name: excluded[name] for name in columns},
+                "updated_at": excluded.updated_at,
+            },
+            where=or_(
+                *(table.c[name].is_distinct_from(excluded[name]) for name in columns)
+            ),
+        ).returning(*table.c)
+        # Executed as a Core statement on the table, which the ORM does not
+        # record as a write: the version is bumped only if a row was written.
+        written_rows = session.execute(stmt).mappings().all()
+        for written_row in written_rows:
+            written[written_row[key]] = (
+                model(**written_row).to_entity(),
+                written_row["created_at"] == written_row["updated_at"],
+            )
+        if written_rows:
+            versions.mark_changed(session, [table.name])
+    session.commit()
+
+    created: list[Any] = []
+    updated: list[Any] = []
+    unchanged: list[Any] = []
+    for row in rows:
+        if row[key] not in written:
+            unchanged.append(row[key])
+            continue
+        entity, inserted = written[row[key]]
+        (created if inserted else updated).append(entity)
+    return Upserted(created, updated, unchanged)
@@ -0,0 +1,37 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database.models.jadwal import JadwalModel
+from tests.api.jadwal.test_create_jadwal_api import setup_dependencies
+
+
+def test_bulk_create_jadwal_with_invalid_item(client: TestClient, db_session: Session):
+    """
+    Test that an item failing validation is reported by index and the valid
+    items are created.
+    """
+    dosen, mata_kuliah = setup_dependencies(db_session)
+
+    def make_payload(hari: str, jam_mulai: str, jam_selesai: str) -> dict:
+        return {
+            "hari": hari,
+            "jam_mulai": jam_mulai,
+            "jam_selesai": jam_selesai,
+            "ruangan": "A101",
+            "mata_kuliah_id": mata_kuliah.id,
+            "dosen_id": dosen.id,
+        }
+
+    payload = [
+        make_payload("Senin", "08:00:00", "10:00:00"),
+        make_payload("Selasa", "12:00:00", "10:00:00"),
+        make_payload("Rabu", "08:00:00", "10:00:00"),
+    ]
+    response = client.post("/jadwal/bulk", json=payload)
+    assert response.status_code == 207
+    data = response.json()
+    assert [item["hari"] for item in data["created"]] == ["Senin", "Rabu"]
+    assert data["errors"] == [
+        {"index": 1, "message": "Jam mulai must be before jam selesai"}
+    ]
+    assert db_session.query(JadwalModel).count() == 2
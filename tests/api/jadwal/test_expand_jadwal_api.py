@@ -0,0 +1,137 @@
+from contextlib import contextmanager
+from datetime import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.repositories.database.models.jadwal import JadwalModel
+from tests.api.jadwal.test_create_jadwal_api import setup_dependencies
+
+
+@contextmanager
+def count_statements(db_session: Session):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+
+def create_jadwal(db_session: Session, count: int) -> None:
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    db_session.add_all(
+        JadwalModel(
+            hari="Senin",
+            jam_mulai=time(8 + i),
+            jam_selesai=time(9 + i),
+            ruangan=f"A10{i}",
+            mata_kuliah_id=mata_kuliah.id,
+            dosen_id=dosen.id,
+        )
+        for i in range(count)
+    )
+    db_session.commit()
+    # Start from an empty identity map so relations have to be loaded.
+    db_session.expunge_all()
+
+
+def test_read_jadwal_expand_embeds_relations(client: TestClient, db_session: Session):
+    create_jadwal(db_session, 2)
+
+    response = client.get("/jadwal/?expand=dosen,mata_kuliah")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 2
+    assert data[0]["dosen"]["nidn"] == "1234567890"
+    assert data[0]["mata_kuliah"]["kode_mk"] == "IF101"
+
+
+def test_read_jadwal_without_expand_omits_relations(
+    client: TestClient, db_session: Session
+):
+    create_jadwal(db_session, 1)
+
+    response = client.get("/jadwal/")
+
+    assert response.status_code == 200
+    [item] = response.json()
+    assert "dosen" not in item
+    assert "mata_kuliah" not in item
+
+
+def test_read_jadwal_expand_only_requested_relation(
+    client: TestClient, db_session: Session
+):
+    create_jadwal(db_session, 1)
+
+    response = client.get("/jadwal/?expand=dosen")
+
+    [item] = response.json()
+    assert item["dosen"]["email"] == "john.doe@example.com"
+    assert "mata_kuliah" not in item
+
+
+def test_read_jadwal_expand_query_count_independent_of_rows(
+    client: TestClient, db_session: Session
+):
+    create_jadwal(db_session, 5)
+
+    with count_statements(db_session) as statements:
+        response = client.get("/jadwal/?expand=dosen,mata_kuliah&limit=1")
+    assert len(response.json()) == 1
+    one_row = len(statements)
+
+    with count_statements(db_session) as statements:
+        response = client.get("/jadwal/?expand=dosen,mata_kuliah&limit=5")
+    assert len(response.json()) == 5
+    assert len(statements) == one_row
+    # The ETag's version lookup, the page itself and one selectin query per
+    # expanded relation.
+    assert len(statements) == 4
+
+
+def test_read_jadwal_expand_unknown_relation(client: TestClient, db_session: Session):
+    response = client.get("/jadwal/?expand=mahasiswa")
+
+    assert response.status_code == 400
+    assert "mahasiswa" in response.json()["detail"]
+
+
+def test_read_tugas_expand_embeds_relations(client: TestClient, db_session: Session):
+    _, mata_kuliah = setup_dependencies(db_session)
+    mahasiswa = client.post(
+        "/mahasiswa/",
+        json={
+            "nim": "2024000001",
+            "nama": "Budi",
+            "kelas": "A",
+            "tempat_lahir": "Bandung",
+            "tanggal_lahir": "2003-01-01",
+        },
+    ).json()
+    tugas = {
+        "judul": "Tugas 1",
+        "deskripsi": "Latihan",
+        "deadline": "2030-01-01T00:00:00",
+        "mata_kuliah_id": mata_kuliah.id,
+        "mahasiswa_id": mahasiswa["id"],
+    }
+    assert client.post("/tugas/", json=tugas).status_code == 201
+    tanpa_mahasiswa = {**tugas, "mahasiswa_id": None}
+    assert client.post("/tugas/", json=tanpa_mahasiswa).status_code == 201
+
+    response = client.get("/tugas/?expand=mahasiswa,mata_kuliah&order_by=id")
+
+    assert response.status_code == 200
+    first, second = response.json()
+    assert first["mahasiswa"]["nim"] == "2024000001"
+    assert first["mata_kuliah"]["kode_mk"] == "IF101"
+    assert second["mahasiswa"] is None
@@ -243,3 +243,22 @@ def test_get_jadwal_empty_database(client: TestClient, db_session: Session):
     response = client.get("/jadwal/")
     assert response.status_code == 200
     assert len(response.json()) == 0
+
+
+def test_get_jadwal_with_cursor_pagination(client: TestClient, db_session: Session):
+    """
+    Test cursor pagination with duplicate sort keys (ruangan) across pages.
+    """
+    setup_jadwal_data(db_session)
+    seen = []
+    cursor = ""
+    while True:
+        response = client.get(f"/jadwal/?limit=1&order_by=ruangan&cursor={cursor}")
+        assert response.status_code == 200
+        seen.extend(response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        cursor = response.headers["X-Next-Cursor"]
+
+    assert [j["ruangan"] for j in seen] == ["A101", "A101", "B201", "C301"]
+    assert len({j["id"] for j in seen}) == 4
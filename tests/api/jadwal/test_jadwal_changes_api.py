@@ -0,0 +1,76 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database.core import config
+from tests.api.jadwal.test_create_jadwal_api import setup_dependencies
+
+
+@pytest.fixture(autouse=True)
+def no_safety_lag(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(config, "CHANGES_SAFETY_LAG_SECONDS", 0)
+
+
+def create_jadwal(client: TestClient, db_session: Session, count: int) -> list[dict]:
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    return [
+        client.post(
+            "/jadwal/",
+            json={
+                "hari": "Senin",
+                "jam_mulai": f"{8 + i:02d}:00:00",
+                "jam_selesai": f"{9 + i:02d}:00:00",
+                "ruangan": f"A10{i}",
+                "mata_kuliah_id": mata_kuliah.id,
+                "dosen_id": dosen.id,
+            },
+        ).json()
+        for i in range(count)
+    ]
+
+
+def test_initial_sync_returns_everything(client: TestClient, db_session: Session):
+    created = create_jadwal(client, db_session, 3)
+
+    response = client.get("/jadwal/changes")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [j["id"] for j in data["changed"]] == [j["id"] for j in created]
+    assert data["deleted"] == []
+    assert data["has_more"] is False
+    assert data["next_token"]
+
+
+def test_sync_returns_only_rows_changed_since_token(
+    client: TestClient, db_session: Session
+):
+    first, second, third = create_jadwal(client, db_session, 3)
+    token = client.get("/jadwal/changes").json()["next_token"]
+
+    assert client.get(f"/jadwal/changes?since={token}").json()["changed"] == []
+
+    client.put(f"/jadwal/{first['id']}", json={**first, "ruangan": "B202"})
+    client.delete(f"/jadwal/{second['id']}")
+
+    data = client.get(f"/jadwal/changes?since={token}").json()
+    assert [j["ruangan"] for j in data["changed"]] == ["B202"]
+    assert data["deleted"] == [second["id"]]
+    assert data["next_token"] != token
+
+
+def test_sync_pages_through_changes(client: TestClient, db_session: Session):
+    created = create_jadwal(client, db_session, 3)
+
+    page = client.get("/jadwal/changes?limit=2").json()
+    assert page["has_more"] is True
+    rest = client.get(f"/jadwal/changes?limit=2&since={page['next_token']}").json()
+
+    ids = [j["id"] for j in page["changed"] + rest["changed"]]
+    assert ids == [j["id"] for j in created]
+    assert rest["has_more"] is False
+
+
+def test_sync_rejects_invalid_token(client: TestClient, db_session: Session):
+    response = client.get("/jadwal/changes?since=not-a-token")
+    assert response.status_code == 400
@@ -0,0 +1,174 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database.jadwal import JadwalRepository
+from tests.api.jadwal.test_create_jadwal_api import setup_dependencies
+
+
+def slot(mata_kuliah_id: int, dosen_id: int, **changes) -> dict:
+    payload = {
+        "hari": "Senin",
+        "jam_mulai": "08:00:00",
+        "jam_selesai": "10:00:00",
+        "ruangan": "A101",
+        "mata_kuliah_id": mata_kuliah_id,
+        "dosen_id": dosen_id,
+    }
+    payload.update(changes)
+    return payload
+
+
+def test_create_jadwal_double_booking_returns_409(
+    client: TestClient, db_session: Session
+):
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    client.post("/jadwal/", json=slot(mata_kuliah.id, dosen.id))
+
+    same_room = client.post(
+        "/jadwal/",
+        json=slot(
+            mata_kuliah.id, dosen.id + 1, jam_mulai="09:00:00", jam_selesai="11:00:00"
+        ),
+    )
+    back_to_back = client.post(
+        "/jadwal/",
+        json=slot(
+            mata_kuliah.id, dosen.id, jam_mulai="10:00:00", jam_selesai="12:00:00"
+        ),
+    )
+
+    assert same_room.status_code == 409
+    assert "Ruangan A101 is already booked" in same_room.json()["detail"]
+    assert back_to_back.status_code == 201
+
+
+def test_update_jadwal_does_not_conflict_with_itself(
+    client: TestClient, db_session: Session
+):
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    created = client.post("/jadwal/", json=slot(mata_kuliah.id, dosen.id)).json()
+
+    response = client.put(
+        f"/jadwal/{created['id']}",
+        json=slot(mata_kuliah.id, dosen.id, jam_selesai="10:30:00"),
+    )
+
+    assert response.status_code == 200
+
+
+def test_check_conflicts_reports_stored_and_batch_overlaps(
+    client: TestClient, db_session: Session
+):
+    """
+    A proposed timetable is checked against the stored jadwal and against
+    itself in one call, without writing anything.
+    """
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    stored = client.post("/jadwal/", json=slot(mata_kuliah.id, dosen.id)).json()
+    proposed = [
+        slot(mata_kuliah.id, 99, ruangan="B201"),
+        slot(mata_kuliah.id, 98, ruangan="A101", hari="Selasa"),
+        slot(mata_kuliah.id, 97, ruangan="A101", hari="Selasa", jam_mulai="09:00:00"),
+        slot(mata_kuliah.id, dosen.id, ruangan="C301", jam_mulai="09:30:00"),
+        slot(mata_kuliah.id, 96, ruangan="D401", jam_mulai="11:00:00"),
+    ]
+
+    response = client.post("/jadwal/conflicts", json=proposed)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [
+        (c["index"], c["field"], c["jadwal_id"], c["other_index"])
+        for c in data["conflicts"]
+    ] == [
+        (2, "ruangan", None, 1),
+        (3, "dosen_id", stored["id"], None),
+    ]
+    assert [error["index"] for error in data["errors"]] == [4]
+    assert len(client.get("/jadwal/").json()) == 1
+
+
+def test_bulk_create_jadwal_rejects_overlapping_slots(
+    client: TestClient, db_session: Session
+):
+    dosen, mata_kuliah = setup_dependencies(db_session)
+
+    response = client.post(
+        "/jadwal/bulk",
+        json=[
+            slot(mata_kuliah.id, dosen.id),
+            slot(mata_kuliah.id, dosen.id, ruangan="B201", jam_mulai="09:00:00"),
+            slot(
+                mata_kuliah.id, dosen.id, jam_mulai="10:00:00", jam_selesai="11:00:00"
+            ),
+        ],
+    )
+
+    assert response.status_code == 207
+    data = response.json()
+    assert len(data["created"]) == 2
+    assert [error["index"] for error in data["errors"]] == [1]
+    assert "Dosen" in data["errors"][0]["message"]
+
+
+def test_hari_is_compared_case_insensitively(client: TestClient, db_session: Session):
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    client.post("/jadwal/", json=slot(mata_kuliah.id, dosen.id))
+
+    clash = client.post("/jadwal/", json=slot(mata_kuliah.id, dosen.id, hari=" senin"))
+    other_day = client.post(
+        "/jadwal/", json=slot(mata_kuliah.id, dosen.id, hari="SELASA")
+    )
+
+    assert clash.status_code == 409
+    assert other_day.status_code == 201
+    assert other_day.json()["hari"] == "Selasa"
+
+
+@pytest.fixture
+def racing_slot(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> dict:
+    """
+    A stored jadwal plus an overlap check that misses it, as when another
+    request books the slot between the service's check and its write.
+    """
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    client.post("/jadwal/", json=slot(mata_kuliah.id, dosen.id))
+    monkeypatch.setattr(JadwalRepository, "find_overlaps", lambda *args: [])
+    return slot(mata_kuliah.id, dosen.id)
+
+
+def test_booking_guard_rejects_a_racing_create(client: TestClient, racing_slot: dict):
+    response = client.post("/jadwal/", json={**racing_slot, "dosen_id": 999})
+
+    assert response.status_code == 409
+    assert "Ruangan was just booked" in response.json()["detail"]
+
+
+def test_booking_guard_rejects_a_racing_bulk_create(
+    client: TestClient, racing_slot: dict
+):
+    response = client.post("/jadwal/bulk", json=[{**racing_slot, "ruangan": "C303"}])
+
+    assert response.status_code == 409
+    assert "Dosen was just booked" in response.json()["detail"]
+
+
+def test_booking_guard_rejects_a_racing_update(client: TestClient, racing_slot: dict):
+    later = client.post(
+        "/jadwal/",
+        json={
+            **racing_slot,
+            "ruangan": "B202",
+            "jam_mulai": "10:00:00",
+            "jam_selesai": "12:00:00",
+        },
+    ).json()
+
+    response = client.put(
+        f"/jadwal/{later['id']}", json={**later, "jam_mulai": "09:00:00"}
+    )
+
+    assert response.status_code == 409
@@ -88,6 +88,31 @@ def test_update_jadwal_not_found(client: TestClient, db_session: Session):
     assert "not found" in response.json()["detail"].lower()
 
 
+def test_update_jadwal_after_delete_not_found(
+    client: TestClient, db_session: Session
+):
+    """
+    Test updating a soft-deleted Jadwal returns 404 and leaves the row untouched.
+    """
+    jadwal, dosen1, _, mk1, _ = setup_jadwal_for_update(db_session)
+    assert client.delete(f"/jadwal/{jadwal.id}").status_code == 204
+
+    payload = {
+        "hari": "Rabu",
+        "jam_mulai": "13:00:00",
+        "jam_selesai": "15:00:00",
+        "ruangan": "E103",
+        "mata_kuliah_id": mk1.id,
+        "dosen_id": dosen1.id,
+    }
+    response = client.put(f"/jadwal/{jadwal.id}", json=payload)
+    assert response.status_code == 404
+
+    db_session.refresh(jadwal)
+    assert jadwal.hari == "Senin"
+    assert jadwal.is_active is False
+
+
 def test_update_jadwal_invalid_time_range(client: TestClient, db_session: Session):
     """
     Test updating Jadwal with invalid time range returns 422 Unprocessable Entity.
@@ -0,0 +1,71 @@
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+
+
+def make_payload(nim: str) -> dict:
+    return {
+        "nim": nim,
+        "nama": f"Mahasiswa {nim}",
+        "kelas": "TI-3A",
+        "tempat_lahir": "Yogyakarta",
+        "tanggal_lahir": "2002-05-15",
+    }
+
+
+def test_bulk_create_mahasiswa_success(client: TestClient, db_session: Session):
+    """
+    Test creating several Mahasiswa records in one request.
+    """
+    payload = [make_payload(f"20240000{i:02d}") for i in range(1, 6)]
+    response = client.post("/mahasiswa/bulk", json=payload)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["errors"] == []
+    assert [item["nim"] for item in data["created"]] == [p["nim"] for p in payload]
+    assert all("id" in item for item in data["created"])
+    assert db_session.query(MahasiswaModel).count() == 5
+
+
+def test_bulk_create_mahasiswa_partial_duplicates(
+    client: TestClient, db_session: Session
+):
+    """
+    Test that duplicate NIMs are reported per item with 207 Multi-Status while
+    the other items are still created.
+    """
+    db_session.add(
+        MahasiswaModel(
+            nim="2024000002",
+            nama="Jane Jenui",
+            kelas="TI-3B",
+            tempat_lahir="Semarang",
+            tanggal_lahir=date(2001, 8, 20),
+        )
+    )
+    db_session.commit()
+
+    payload = [
+        make_payload("2024000001"),
+        make_payload("2024000002"),
+        make_payload("2024000001"),
+    ]
+    response = client.post("/mahasiswa/bulk", json=payload)
+    assert response.status_code == 207
+    data = response.json()
+    assert [item["nim"] for item in data["created"]] == ["2024000001"]
+    assert [error["index"] for error in data["errors"]] == [1, 2]
+    assert "already exists" in data["errors"][0]["message"]
+    assert db_session.query(MahasiswaModel).count() == 2
+
+
+def test_bulk_create_mahasiswa_empty_list(client: TestClient):
+    """
+    Test that an empty batch is accepted and creates nothing.
+    """
+    response = client.post("/mahasiswa/bulk", json=[])
+    assert response.status_code == 201
+    assert response.json() == {"created": [], "errors": []}
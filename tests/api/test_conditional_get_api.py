@@ -0,0 +1,100 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.infrastructure.conditional import etag_matches
+from tests.api.jadwal.test_create_jadwal_api import setup_dependencies
+from tests.api.jadwal.test_expand_jadwal_api import count_statements
+
+MAHASISWA = {
+    "nim": "2024000001",
+    "nama": "Budi",
+    "kelas": "TI-3E",
+    "tempat_lahir": "Bandung",
+    "tanggal_lahir": "2003-01-01",
+}
+
+
+def test_etag_matches_weak_comparison():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('"xyz", W/"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches('W/"xyz"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+
+
+def test_list_returns_etag_and_304_when_unchanged(
+    client: TestClient, db_session: Session
+):
+    client.post("/mahasiswa/", json=MAHASISWA)
+
+    first = client.get("/mahasiswa/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    second = client.get("/mahasiswa/", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_list_etag_changes_after_write(client: TestClient, db_session: Session):
+    created = client.post("/mahasiswa/", json=MAHASISWA).json()
+    etag = client.get("/mahasiswa/").headers["ETag"]
+
+    client.put(f"/mahasiswa/{created['id']}", json={**MAHASISWA, "nama": "Budi S."})
+
+    response = client.get("/mahasiswa/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()[0]["nama"] == "Budi S."
+
+
+def test_unchanged_poll_only_reads_table_versions(
+    client: TestClient, db_session: Session
+):
+    client.post("/mahasiswa/", json=MAHASISWA)
+    etag = client.get("/mahasiswa/?limit=1").headers["ETag"]
+
+    with count_statements(db_session) as statements:
+        response = client.get("/mahasiswa/?limit=1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert "FROM table_versions" in statements[0]
+
+
+def test_etag_depends_on_query(client: TestClient, db_session: Session):
+    client.post("/mahasiswa/", json=MAHASISWA)
+
+    all_rows = client.get("/mahasiswa/").headers["ETag"]
+    filtered = client.get("/mahasiswa/?kelas=TI-3E").headers["ETag"]
+
+    assert all_rows != filtered
+
+
+def test_expanded_list_etag_follows_related_table(
+    client: TestClient, db_session: Session
+):
+    dosen, mata_kuliah = setup_dependencies(db_session)
+    client.post(
+        "/jadwal/",
+        json={
+            "hari": "Senin",
+            "jam_mulai": "08:00:00",
+            "jam_selesai": "10:00:00",
+            "ruangan": "A101",
+            "mata_kuliah_id": mata_kuliah.id,
+            "dosen_id": dosen.id,
+        },
+    )
+    plain = client.get("/jadwal/").headers["ETag"]
+    expanded = client.get("/jadwal/?expand=dosen").headers["ETag"]
+
+    renamed = {"nidn": dosen.nidn, "nama": "Dr. Jane Doe", "email": dosen.email}
+    assert client.put(f"/dosen/{dosen.id}", json=renamed).status_code == 200
+
+    assert client.get("/jadwal/", headers={"If-None-Match": plain}).status_code == 304
+    response = client.get("/jadwal/?expand=dosen", headers={"If-None-Match": expanded})
+    assert response.status_code == 200
+    assert response.json()[0]["dosen"]["nama"] == "Dr. Jane Doe"
@@ -0,0 +1,90 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database.core import config
+from tests.api.jadwal.test_expand_jadwal_api import count_statements, create_jadwal
+from tests.api.test_export_mahasiswa_api import seed_mahasiswa
+
+
+@pytest.fixture
+def exact_limit(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(config, "COUNT_EXACT_LIMIT", 3)
+
+
+def test_count_applies_list_filters(client: TestClient, db_session: Session):
+    seed_mahasiswa(db_session, 5)
+
+    response = client.get("/mahasiswa/count", params={"kelas": "TI-3A"})
+
+    assert response.status_code == 200
+    assert response.json() == {"count": 3, "exact": True}
+
+
+def test_count_ignores_pagination(client: TestClient, db_session: Session):
+    create_jadwal(db_session, 4)
+
+    response = client.get("/jadwal/count", params={"limit": 1, "page": 2})
+
+    assert response.json() == {"count": 4, "exact": True}
+
+
+def test_list_include_total_wraps_page(client: TestClient, db_session: Session):
+    seed_mahasiswa(db_session, 5)
+
+    response = client.get(
+        "/mahasiswa/", params={"limit": 2, "include_total": "true", "fields": "nim"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [{"id": 1, "nim": "2024000001"}, {"id": 2, "nim": "2024000002"}],
+        "total": 5,
+        "total_exact": True,
+    }
+
+
+def test_count_is_exact_up_to_the_limit(
+    client: TestClient, db_session: Session, exact_limit
+):
+    seed_mahasiswa(db_session, 3)
+
+    assert client.get("/mahasiswa/count").json() == {"count": 3, "exact": True}
+
+
+def test_count_above_the_limit_is_cached_until_the_table_changes(
+    client: TestClient, db_session: Session, exact_limit
+):
+    seed_mahasiswa(db_session, 5)
+
+    assert client.get("/mahasiswa/count").json() == {"count": 5, "exact": False}
+    with count_statements(db_session) as statements:
+        assert client.get("/mahasiswa/count").json()["count"] == 5
+    # Only the bounded count ran; the full count came from the cache.
+    assert len([s for s in statements if "count(*)" in s]) == 1
+
+    created = client.post(
+        "/mahasiswa/",
+        json={
+            "nim": "2024999999",
+            "nama": "Baru",
+            "kelas": "TI-3A",
+            "tempat_lahir": "Bandung",
+            "tanggal_lahir": "2003-01-01",
+        },
+    )
+    assert created.status_code == 201
+    assert client.get("/mahasiswa/count").json() == {"count": 6, "exact": False}
+
+
+def test_count_returns_304_for_unchanged_table(
+    client: TestClient, db_session: Session
+):
+    seed_mahasiswa(db_session, 2)
+    first = client.get("/mahasiswa/count")
+
+    second = client.get(
+        "/mahasiswa/count", headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert second.status_code == 304
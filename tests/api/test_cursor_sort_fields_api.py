@@ -0,0 +1,56 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.repositories.database.dosen import DOSEN_QUERY
+from src.repositories.database.jadwal import JADWAL_QUERY
+from src.repositories.database.mahasiswa import MAHASISWA_QUERY
+from src.repositories.database.mata_kuliah import MATA_KULIAH_QUERY
+from src.repositories.database.query import QuerySpec
+from src.repositories.database.seeding import seed_tables
+from src.repositories.database.tugas import TUGAS_QUERY
+
+RESOURCES = {
+    "/mahasiswa/": MAHASISWA_QUERY,
+    "/dosen/": DOSEN_QUERY,
+    "/mata-kuliah/": MATA_KULIAH_QUERY,
+    "/jadwal/": JADWAL_QUERY,
+    "/tugas/": TUGAS_QUERY,
+}
+
+
+@pytest.mark.parametrize(
+    "path, order_by, order",
+    [
+        (path, order_by, order)
+        for path, spec in RESOURCES.items()
+        for order_by in spec.sortable
+        for order in ("asc", "desc")
+    ],
+)
+def test_cursor_pagination_follows_every_sortable_field(
+    client: TestClient, db_session: Session, path: str, order_by: str, order: str
+):
+    """
+    Following X-Next-Cursor visits every row exactly once, including for sort
+    columns (such as the timestamps) that the response items don't carry.
+    """
+    seed_tables(db_session, scale=75)
+    spec: QuerySpec = RESOURCES[path]
+    where = select(spec.model.id).where(*spec.where)
+    expected = set(db_session.scalars(where))
+
+    seen: list[int] = []
+    params = {"order_by": order_by, "order": order, "limit": 4}
+    while True:
+        response = client.get(path, params=params)
+        assert response.status_code == 200, response.json()
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert len(seen) == len(set(seen))
+    assert set(seen) == expected
@@ -0,0 +1,36 @@
+import json
+from datetime import time
+
+from src.application.dtos.jadwal_dto import JadwalDetailDto, JadwalDto
+from src.infrastructure.responses import DtoJSONResponse
+
+JADWAL = JadwalDto(
+    id=1,
+    hari="Senin",
+    jam_mulai=time(8, 0),
+    jam_selesai=time(10, 0),
+    ruangan="A101",
+    mata_kuliah_id=1,
+    dosen_id=1,
+    is_active=True,
+)
+
+
+def test_dto_json_response_serializes_runtime_type():
+    detail = JadwalDetailDto(**JADWAL.model_dump(), dosen=None)
+
+    response = DtoJSONResponse([JADWAL, detail], exclude_unset=True)
+
+    plain, expanded = json.loads(response.body)
+    assert plain["jam_mulai"] == "08:00:00"
+    assert "dosen" not in plain and "mata_kuliah" not in plain
+    assert expanded["dosen"] is None
+    assert "mata_kuliah" not in expanded
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_dto_json_response_renders_plain_content():
+    response = DtoJSONResponse({"detail": "Tidak ditemukan"}, status_code=404)
+
+    assert response.status_code == 404
+    assert json.loads(response.body) == {"detail": "Tidak ditemukan"}
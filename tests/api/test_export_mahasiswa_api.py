@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+
+
+def seed_mahasiswa(db_session: Session, count: int) -> None:
+    db_session.add_all(
+        MahasiswaModel(
+            nim=f"2024{i:06d}",
+            nama=f"Mahasiswa {i}",
+            kelas="TI-3A" if i % 2 else "TI-3B",
+            tempat_lahir="Yogyakarta",
+            tanggal_lahir=date(2002, 5, 15),
+        )
+        for i in range(1, count + 1)
+    )
+    db_session.commit()
+
+
+def test_export_mahasiswa_ndjson(client: TestClient, db_session: Session):
+    """
+    Test exporting Mahasiswa as newline-delimited JSON, one record per line.
+    """
+    seed_mahasiswa(db_session, 1200)
+
+    response = client.get("/mahasiswa/export", params={"format": "ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "mahasiswa.ndjson" in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 1200
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+    assert rows[0]["nim"] == "2024000001"
+    assert rows[0]["tanggal_lahir"] == "2002-05-15"
+
+
+def test_export_mahasiswa_csv_with_filters(client: TestClient, db_session: Session):
+    """
+    Test exporting Mahasiswa as CSV, honouring the same filters as the list
+    endpoint.
+    """
+    seed_mahasiswa(db_session, 10)
+
+    response = client.get(
+        "/mahasiswa/export",
+        params={"format": "csv", "kelas": "TI-3A", "order_by": "nim", "order": "desc"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["nim"] for row in rows] == [
+        "2024000009",
+        "2024000007",
+        "2024000005",
+        "2024000003",
+        "2024000001",
+    ]
+    assert rows[0]["kelas"] == "TI-3A"
+    assert rows[0]["status"] == "active"
+
+
+def test_export_mahasiswa_csv_empty(client: TestClient, db_session: Session):
+    """
+    Test that an empty export still returns the CSV header.
+    """
+    response = client.get("/mahasiswa/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.text.strip() == (
+        "id,nim,nama,kelas,tempat_lahir,tanggal_lahir,status"
+    )
+
+
+def test_export_mahasiswa_invalid_format(client: TestClient, db_session: Session):
+    """
+    Test that an unsupported export format is rejected.
+    """
+    response = client.get("/mahasiswa/export", params={"format": "xml"})
+    assert response.status_code == 422
+
+
+def test_export_mahasiswa_invalid_cursor(client: TestClient, db_session: Session):
+    """
+    Test that query errors surface as 400 before the stream starts.
+    """
+    seed_mahasiswa(db_session, 3)
+    response = client.get("/mahasiswa/export", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
@@ -0,0 +1,128 @@
+import csv
+import io
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.application.dtos.tugas_dto import TugasListItemDto
+from src.repositories.database.models.tugas import TugasModel
+from tests.api.jadwal.test_expand_jadwal_api import count_statements, create_jadwal
+from tests.api.test_export_mahasiswa_api import seed_mahasiswa
+
+
+def seed_tugas(db_session: Session, count: int) -> None:
+    db_session.add_all(
+        TugasModel(
+            judul=f"Tugas {i}",
+            deskripsi="x" * 1000,
+            deadline=datetime(2025, 1, i),
+        )
+        for i in range(1, count + 1)
+    )
+    db_session.commit()
+
+
+def test_read_mahasiswa_fields_returns_only_requested_fields(
+    client: TestClient, db_session: Session
+):
+    seed_mahasiswa(db_session, 2)
+
+    response = client.get("/mahasiswa/", params={"fields": "nama,nim"})
+
+    assert response.status_code == 200
+    assert response.json()[0] == {
+        "id": 1,
+        "nama": "Mahasiswa 1",
+        "nim": "2024000001",
+    }
+
+
+def test_read_fields_selects_only_requested_columns(
+    client: TestClient, db_session: Session
+):
+    seed_mahasiswa(db_session, 1)
+
+    with count_statements(db_session) as statements:
+        client.get("/mahasiswa/", params={"fields": "nama"})
+
+    [select] = [s for s in statements if "FROM mahasiswa" in s]
+    assert "mahasiswa.nama" in select
+    assert "mahasiswa.nim" not in select
+
+
+def test_read_unknown_field_is_rejected(client: TestClient):
+    response = client.get("/dosen/", params={"fields": "nama,password"})
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+def test_read_tugas_defers_deskripsi_by_default(
+    client: TestClient, db_session: Session
+):
+    seed_tugas(db_session, 2)
+
+    with count_statements(db_session) as statements:
+        response = client.get("/tugas/")
+
+    assert response.status_code == 200
+    assert "deskripsi" not in response.json()[0]
+    assert response.json()[0]["judul"] == "Tugas 1"
+    [select] = [s for s in statements if "FROM tugas" in s]
+    assert "deskripsi" not in select
+
+
+def test_tugas_list_schema_does_not_require_deskripsi(
+    client: TestClient, db_session: Session
+):
+    seed_tugas(db_session, 1)
+    schemas = client.get("/openapi.json").json()["components"]["schemas"]
+
+    assert "deskripsi" not in schemas["TugasListItemDto-Output"]["required"]
+    TugasListItemDto.model_validate(client.get("/tugas/").json()[0])
+
+
+def test_read_tugas_deskripsi_on_request(client: TestClient, db_session: Session):
+    seed_tugas(db_session, 1)
+
+    response = client.get("/tugas/", params={"fields": "judul,deskripsi"})
+
+    assert response.json() == [{"id": 1, "judul": "Tugas 1", "deskripsi": "x" * 1000}]
+
+
+def test_read_fields_cursor_pages_by_unrequested_sort_column(
+    client: TestClient, db_session: Session
+):
+    seed_tugas(db_session, 3)
+    params = {"fields": "judul", "order_by": "deadline", "order": "desc", "limit": 2}
+
+    first = client.get("/tugas/", params=params)
+    second = client.get(
+        "/tugas/", params={**params, "cursor": first.headers["X-Next-Cursor"]}
+    )
+
+    assert [t["judul"] for t in first.json()] == ["Tugas 3", "Tugas 2"]
+    assert second.json() == [{"id": 1, "judul": "Tugas 1"}]
+
+
+def test_read_jadwal_fields_with_expand(client: TestClient, db_session: Session):
+    create_jadwal(db_session, 1)
+
+    response = client.get("/jadwal/", params={"fields": "ruangan", "expand": "dosen"})
+
+    assert response.status_code == 200
+    [item] = response.json()
+    assert set(item) == {"id", "ruangan", "dosen"}
+    assert item["dosen"]["nidn"] == "1234567890"
+
+
+def test_export_csv_fields_are_the_columns(client: TestClient, db_session: Session):
+    seed_mahasiswa(db_session, 2)
+
+    response = client.get(
+        "/mahasiswa/export", params={"format": "csv", "fields": "nim"}
+    )
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows == [{"id": "1", "nim": "2024000001"}, {"id": "2", "nim": "2024000002"}]
@@ -217,3 +217,80 @@ def test_get_mahasiswa_combined_filters(client: TestClient, setup_mahasiswa_data
     results = response.json()
     assert len(results) == 1
     assert results[0]["nim"] == "2023000001"
+
+
+def test_get_mahasiswa_with_cursor_pagination(
+    client: TestClient, setup_mahasiswa_data
+):
+    """
+    Test walking every page with the keyset cursor returned in X-Next-Cursor.
+    """
+    response = client.get("/mahasiswa/?limit=3&order_by=tempat_lahir")
+    assert response.status_code == 200
+    first_page = response.json()
+    assert [m["tempat_lahir"] for m in first_page] == [
+        "Bandung",
+        "Jakarta",
+        "Jakarta",
+    ]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/mahasiswa/?limit=3&order_by=tempat_lahir&cursor={cursor}"
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert [m["tempat_lahir"] for m in second_page] == ["Surabaya"]
+    assert "X-Next-Cursor" not in response.headers
+    assert {m["id"] for m in first_page}.isdisjoint(m["id"] for m in second_page)
+
+
+def test_get_mahasiswa_with_cursor_pagination_desc(
+    client: TestClient, setup_mahasiswa_data
+):
+    """
+    Test cursor pagination in descending order on a date column.
+    """
+    response = client.get("/mahasiswa/?limit=2&order_by=tanggal_lahir&order=desc")
+    assert [m["nim"] for m in response.json()] == ["2024000004", "2023000002"]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/mahasiswa/?limit=2&order_by=tanggal_lahir&order=desc&cursor={cursor}"
+    )
+    assert response.status_code == 200
+    assert [m["nim"] for m in response.json()] == ["2023000001", "2023000003"]
+
+
+def test_get_mahasiswa_with_mismatched_cursor(
+    client: TestClient, setup_mahasiswa_data
+):
+    """
+    Test that a cursor issued for another ordering is rejected.
+    """
+    response = client.get("/mahasiswa/?limit=2&order_by=nama")
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(f"/mahasiswa/?limit=2&order_by=nim&cursor={cursor}")
+    assert response.status_code == 400
+
+
+def test_get_mahasiswa_with_invalid_cursor(client: TestClient, setup_mahasiswa_data):
+    """
+    Test that a malformed cursor returns 400 Bad Request.
+    """
+    response = client.get("/mahasiswa/?limit=2&cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_get_mahasiswa_by_free_text_query(client: TestClient, setup_mahasiswa_data):
+    """
+    Test the q= free-text search across nama and tempat_lahir.
+    """
+    response = client.get("/mahasiswa/?q=jakarta")
+    assert response.status_code == 200
+    assert {m["nim"] for m in response.json()} == {"2023000001", "2024000004"}
+
+    response = client.get("/mahasiswa/?q=david jakarta")
+    assert response.status_code == 200
+    assert [m["nim"] for m in response.json()] == ["2024000004"]
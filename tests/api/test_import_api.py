@@ -0,0 +1,109 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.application.usecases import imports
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+from src.repositories.database.models.tugas import TugasModel
+
+MAHASISWA_HEADER = "nim,nama,kelas,tempat_lahir,tanggal_lahir\n"
+
+
+def mahasiswa_csv(*rows: str) -> bytes:
+    return (MAHASISWA_HEADER + "".join(row + "\n" for row in rows)).encode()
+
+
+def post_csv(client: TestClient, path: str, body: bytes, **params):
+    return client.post(
+        path, content=body, params=params, headers={"Content-Type": "text/csv"}
+    )
+
+
+def row_count(db_session: Session, model) -> int:
+    return db_session.scalar(select(func.count()).select_from(model))
+
+
+def test_import_mahasiswa_creates_rows_in_chunks(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(imports, "IMPORT_CHUNK_SIZE", 2)
+    body = mahasiswa_csv(
+        *(f"202400000{i},Mahasiswa {i},TI-3A,Bandung,2003-01-0{i}" for i in range(1, 6))
+    )
+
+    response = post_csv(client, "/mahasiswa/import", body)
+
+    assert response.status_code == 201
+    assert response.json() == {
+        "created": 5,
+        "rejected": 0,
+        "last_line": 6,
+        "errors": [],
+    }
+    assert row_count(db_session, MahasiswaModel) == 5
+
+
+def test_import_mahasiswa_reports_rejected_rows_by_line(
+    client: TestClient, db_session: Session
+):
+    body = mahasiswa_csv(
+        "2024000001,Budi,TI-3A,Bandung,2003-01-01",
+        "2024000002,Citra,TI-3A,Bandung,not-a-date",
+        "2024000001,Budi Lagi,TI-3A,Bandung,2003-01-01",
+        ",Tanpa NIM,TI-3A,Bandung,2003-01-01",
+    )
+
+    response = post_csv(client, "/mahasiswa/import", body)
+
+    assert response.status_code == 207
+    data = response.json()
+    assert data["created"] == 1
+    assert [error["line"] for error in data["errors"]] == [3, 4, 5]
+    assert "NIM '2024000001' already exists" in data["errors"][1]["message"]
+    assert data["errors"][2]["message"].startswith("nim:")
+
+
+def test_import_resumes_after_line(client: TestClient, db_session: Session):
+    body = mahasiswa_csv(
+        "2024000001,Budi,TI-3A,Bandung,2003-01-01",
+        "2024000002,Citra,TI-3A,Bandung,2003-01-02",
+    )
+
+    response = post_csv(client, "/mahasiswa/import", body, after_line=2)
+
+    assert response.json()["created"] == 1
+    nims = db_session.scalars(select(MahasiswaModel.nim)).all()
+    assert nims == ["2024000002"]
+
+
+def test_import_tugas_treats_empty_cells_as_missing(
+    client: TestClient, db_session: Session
+):
+    body = (
+        b"judul,deskripsi,deadline,status,mahasiswa_id\n"
+        b"Laporan,Bab 1,2025-03-01T23:59:00,,\n"
+        b"Kuis,,2025-03-02T08:00:00,done,\n"
+    )
+
+    response = post_csv(client, "/tugas/import", body)
+
+    assert response.status_code == 207
+    data = response.json()
+    assert data["created"] == 1
+    assert data["errors"][0]["line"] == 3
+    assert data["errors"][0]["message"].startswith("deskripsi:")
+    assert row_count(db_session, TugasModel) == 1
+
+
+def test_import_unreadable_file_stops_with_resume_line(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(imports, "IMPORT_CHUNK_SIZE", 1)
+    body = mahasiswa_csv("2024000001,Budi,TI-3A,Bandung,2003-01-01") + b"\xff\xfe\n"
+
+    response = post_csv(client, "/mahasiswa/import", body)
+
+    assert response.status_code == 400
+    assert "after_line=2" in response.json()["detail"]
+    assert row_count(db_session, MahasiswaModel) == 1
@@ -0,0 +1,74 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database import changes
+from src.repositories.database.core import config
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+from src.repositories.database.models.timestamps import utc_now
+
+MAHASISWA = {
+    "nim": "2024000001",
+    "nama": "Budi",
+    "kelas": "TI-3E",
+    "tempat_lahir": "Bandung",
+    "tanggal_lahir": "2003-01-01",
+}
+
+
+def test_drop_out_mahasiswa_is_a_tombstone(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(config, "CHANGES_SAFETY_LAG_SECONDS", 0)
+    budi = client.post("/mahasiswa/", json=MAHASISWA).json()
+    ani = client.post(
+        "/mahasiswa/", json={**MAHASISWA, "nim": "2024000002", "nama": "Ani"}
+    ).json()
+    token = client.get("/mahasiswa/changes").json()["next_token"]
+
+    dropped = {**MAHASISWA, "status": "drop_out"}
+    assert client.put(f"/mahasiswa/{budi['id']}", json=dropped).status_code == 200
+
+    data = client.get(f"/mahasiswa/changes?since={token}").json()
+    assert data["changed"] == []
+    assert data["deleted"] == [budi["id"]]
+    assert ani["id"] not in data["deleted"]
+
+
+def test_sync_does_not_skip_a_late_commit(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    A transaction that stamps updated_at before another one but commits after
+    it must still reach a client that synced in between.
+    """
+    monkeypatch.setattr(config, "CHANGES_SAFETY_LAG_SECONDS", 5)
+    clock = utc_now()
+    monkeypatch.setattr(changes, "utc_now", lambda: clock)
+
+    def mahasiswa(nim: str, updated_at) -> MahasiswaModel:
+        return MahasiswaModel(
+            **{**MAHASISWA, "nim": nim, "tanggal_lahir": date(2003, 1, 1)},
+            created_at=updated_at,
+            updated_at=updated_at,
+        )
+
+    # Stamped at clock - 1s, but not committed yet.
+    late = mahasiswa("2024000001", clock - timedelta(seconds=1))
+    db_session.add(mahasiswa("2024000002", clock))
+    db_session.commit()
+
+    # The committed row is still within the lag, so the token stays behind it.
+    clock += timedelta(seconds=1)
+    first = client.get("/mahasiswa/changes").json()
+    assert first["changed"] == []
+
+    db_session.add(late)
+    db_session.commit()
+
+    clock += timedelta(seconds=5)
+    data = client.get("/mahasiswa/changes", params={"since": first["next_token"]})
+    nims = [m["nim"] for m in data.json()["changed"]]
+    assert nims == ["2024000001", "2024000002"]
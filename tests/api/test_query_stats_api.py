@@ -0,0 +1,71 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.infrastructure.instrumentation import QueryStatsMiddleware
+from src.repositories.database.instrumentation import install_query_instrumentation
+from tests.api.test_export_mahasiswa_api import seed_mahasiswa
+
+
+def test_list_reports_statements_in_server_timing(
+    client: TestClient, db_session: Session
+):
+    install_query_instrumentation(db_session.get_bind())
+    seed_mahasiswa(db_session, 3)
+
+    response = client.get("/mahasiswa/")
+
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    # The ETag version lookup and the page itself.
+    assert 'desc="2 statements"' in timing
+
+
+def test_streamed_export_is_logged_in_full(
+    client: TestClient, db_session: Session, caplog
+):
+    install_query_instrumentation(db_session.get_bind())
+    seed_mahasiswa(db_session, 3)
+
+    with caplog.at_level(logging.INFO, logger="src.infrastructure.instrumentation"):
+        response = client.get("/mahasiswa/export?format=ndjson")
+
+    assert response.status_code == 200
+    (record,) = [
+        r for r in caplog.records if r.name == "src.infrastructure.instrumentation"
+    ]
+    assert record.path == "/mahasiswa/export"
+    assert record.status_code == 200
+    assert record.db_statements >= 1
+    assert record.db_time_ms >= 0
+
+
+def test_repeated_statement_is_reported(db_session: Session, caplog):
+    install_query_instrumentation(db_session.get_bind())
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, repeat_threshold=2)
+
+    @app.get("/loop")
+    def loop(times: int):
+        for i in range(times):
+            db_session.execute(text("SELECT :i"), {"i": i})
+        return {}
+
+    client = TestClient(app)
+    with caplog.at_level(logging.INFO, logger="src.infrastructure.instrumentation"):
+        client.get("/loop", params={"times": 2})
+        client.get("/loop", params={"times": 3})
+
+    warnings = [
+        r
+        for r in caplog.records
+        if r.name == "src.infrastructure.instrumentation"
+        and r.levelno == logging.WARNING
+    ]
+    assert len(warnings) == 1
+    assert warnings[0].repeat_count == 3
+    assert "SELECT ?" in warnings[0].getMessage()
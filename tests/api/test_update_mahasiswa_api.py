@@ -87,3 +87,35 @@ def test_update_mahasiswa_invalid_input(client: TestClient, db_session: Session)
     response = client.put(f"/mahasiswa/{mahasiswa.id}", json=payload)
 
     assert response.status_code == 422
+
+
+def test_update_mahasiswa_duplicate_nim(client: TestClient, db_session: Session):
+    """
+    Test changing a Mahasiswa's NIM to one already in use returns 409 Conflict.
+    """
+    db_session.add_all(
+        [
+            MahasiswaModel(
+                nim=nim,
+                nama="Original Name",
+                kelas="TI-1A",
+                tempat_lahir="Jakarta",
+                tanggal_lahir=date(2003, 1, 1),
+            )
+            for nim in ("2024000014", "2024000015")
+        ]
+    )
+    db_session.commit()
+    second = db_session.query(MahasiswaModel).filter_by(nim="2024000015").one()
+
+    payload = {
+        "nim": "2024000014",
+        "nama": "Original Name",
+        "kelas": "TI-1A",
+        "tempat_lahir": "Jakarta",
+        "tanggal_lahir": "2003-01-01",
+    }
+    response = client.put(f"/mahasiswa/{second.id}", json=payload)
+
+    assert response.status_code == 409
+    assert "NIM '2024000014' already exists" in response.json()["detail"]
@@ -0,0 +1,100 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.repositories.database.versions import read_versions
+
+
+def mahasiswa_payload(nim: str, **changes) -> dict:
+    payload = {
+        "nim": nim,
+        "nama": "Budi Santoso",
+        "kelas": "TI-3A",
+        "tempat_lahir": "Bandung",
+        "tanggal_lahir": "2003-01-01",
+        "status": "active",
+    }
+    payload.update(changes)
+    return payload
+
+
+def test_upsert_mahasiswa_creates_then_updates(client: TestClient):
+    """
+    The first PUT by NIM creates the mahasiswa (201), a later one with changed
+    values updates the same row (200).
+    """
+    created = client.put(
+        "/mahasiswa/by-nim/2024000001", json=mahasiswa_payload("2024000001")
+    )
+    updated = client.put(
+        "/mahasiswa/by-nim/2024000001",
+        json=mahasiswa_payload("2024000001", kelas="TI-3B"),
+    )
+
+    assert created.status_code == 201
+    assert updated.status_code == 200
+    assert updated.json()["id"] == created.json()["id"]
+    assert updated.json()["kelas"] == "TI-3B"
+
+
+def test_upsert_unchanged_mahasiswa_keeps_table_version(
+    client: TestClient, db_session: Session
+):
+    payload = mahasiswa_payload("2024000001")
+    client.put("/mahasiswa/by-nim/2024000001", json=payload)
+    version = read_versions(db_session, ["mahasiswa"])["mahasiswa"]
+
+    response = client.put("/mahasiswa/by-nim/2024000001", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["nama"] == "Budi Santoso"
+    assert read_versions(db_session, ["mahasiswa"])["mahasiswa"] == version
+
+
+def test_upsert_mahasiswa_rejects_mismatched_nim(client: TestClient):
+    response = client.put(
+        "/mahasiswa/by-nim/2024000001", json=mahasiswa_payload("2024000002")
+    )
+
+    assert response.status_code == 422
+
+
+def test_bulk_upsert_dosen_reports_each_outcome(client: TestClient):
+    """
+    A bulk upsert sorts rows into created, updated and unchanged, and rejects
+    repeated keys within the batch by index (207).
+    """
+    client.put(
+        "/dosen/by-nidn",
+        json=[
+            {"nidn": "0000000001", "nama": "Dr. A", "email": "a@univ.ac.id"},
+            {"nidn": "0000000002", "nama": "Dr. B", "email": "b@univ.ac.id"},
+        ],
+    )
+
+    response = client.put(
+        "/dosen/by-nidn",
+        json=[
+            {"nidn": "0000000001", "nama": "Dr. A", "email": "a@univ.ac.id"},
+            {"nidn": "0000000002", "nama": "Prof. B", "email": "b@univ.ac.id"},
+            {"nidn": "0000000003", "nama": "Dr. C", "email": "c@univ.ac.id"},
+            {"nidn": "0000000003", "nama": "Dr. D", "email": "d@univ.ac.id"},
+        ],
+    )
+
+    assert response.status_code == 207
+    data = response.json()
+    assert [dosen["nidn"] for dosen in data["created"]] == ["0000000003"]
+    assert [dosen["nama"] for dosen in data["updated"]] == ["Prof. B"]
+    assert data["unchanged"] == ["0000000001"]
+    assert [error["index"] for error in data["errors"]] == [3]
+
+
+def test_upsert_mata_kuliah_refreshes_cached_reads(client: TestClient):
+    payload = {"kode_mk": "IF101", "nama_mk": "Pemrograman", "sks": 3}
+    client.put("/mata-kuliah/by-kode/IF101", json=payload)
+    assert client.get("/mata-kuliah/").json()[0]["sks"] == 3
+
+    response = client.put("/mata-kuliah/by-kode/IF101", json={**payload, "sks": 4})
+
+    assert response.status_code == 200
+    assert client.get("/mata-kuliah/").json()[0]["sks"] == 4
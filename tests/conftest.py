@@ -8,10 +8,15 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Keep the application engine off the checked-in mahasiswa.db (CI writes the
+# same value into .env).
+os.environ.setdefault("DB_URL", "sqlite:///./test.db")
 
 from src.application.usecases.mahasiswa import MahasiswaService
 from src.infrastructure.app import app
+from src.repositories.cache import count_cache, dosen_cache, mata_kuliah_cache
 from src.repositories.database.core import Base
+from src.repositories.database.versions import forget_versions
 from src.repositories.database.mahasiswa import MahasiswaRepository
 
 # ----------------------------------------------------------------------
@@ -31,6 +36,11 @@ def db_session_fixture() -> Generator[Session, None, None]:
     Creates a new database session for each test,
     clears the tables, creates them again, and yields the session.
     """
+    # Cached reference data would outlive the per-test tables.
+    mata_kuliah_cache.clear()
+    dosen_cache.clear()
+    count_cache.clear()
+    forget_versions()
     Base.metadata.drop_all(bind=engine)  # Drop existing tables
     Base.metadata.create_all(bind=engine)  # Create new tables
     connection = engine.connect()
@@ -0,0 +1,50 @@
+from collections.abc import Callable
+from datetime import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.application.dtos.jadwal_dto import UpdateJadwalDto
+from src.repositories.database.models.dosen import DosenModel
+from src.repositories.database.models.jadwal import JadwalModel
+from src.repositories.database.models.mata_kuliah import MataKuliahModel
+
+
+@pytest.fixture
+def jadwal(db_session: Session) -> JadwalModel:
+    dosen = DosenModel(nidn="1234567890", nama="Dr. A", email="a@example.com")
+    mata_kuliah = MataKuliahModel(kode_mk="IF101", nama_mk="Pemrograman", sks=3)
+    db_session.add_all([dosen, mata_kuliah])
+    db_session.flush()
+    jadwal = JadwalModel(
+        hari="Senin",
+        jam_mulai=time(8, 0),
+        jam_selesai=time(10, 0),
+        ruangan="A101",
+        mata_kuliah_id=mata_kuliah.id,
+        dosen_id=dosen.id,
+    )
+    db_session.add(jadwal)
+    db_session.commit()
+    return jadwal
+
+
+@pytest.fixture
+def make_update(jadwal: JadwalModel) -> Callable[..., UpdateJadwalDto]:
+    """An UpdateJadwalDto of ``jadwal``'s current values with ``changes`` applied."""
+
+    def make(**changes) -> UpdateJadwalDto:
+        values = dict(
+            id=jadwal.id,
+            hari=jadwal.hari,
+            jam_mulai=jadwal.jam_mulai,
+            jam_selesai=jadwal.jam_selesai,
+            ruangan=jadwal.ruangan,
+            mata_kuliah_id=jadwal.mata_kuliah_id,
+            dosen_id=jadwal.dosen_id,
+            is_active=jadwal.is_active,
+        )
+        values.update(changes)
+        return UpdateJadwalDto(**values)
+
+    return make
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.application.dtos.mahasiswa_dto import CreateMahasiswaDto
+from src.application.usecases.mahasiswa import MahasiswaService
+from src.dependencies import AsyncService, build_mahasiswa_service
+from src.ports.mahasiswa import GetMahasiswaPort
+from src.repositories.database.core import AsyncSessionRunner, Base
+
+
+def test_async_service_runs_on_event_loop_thread():
+    """
+    In async mode the service and repository run through AsyncSession.run_sync:
+    every call stays on the event loop thread instead of the threadpool.
+    """
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        loop_thread = threading.get_ident()
+        worker_threads = set()
+
+        def build(session: Session) -> MahasiswaService:
+            worker_threads.add(threading.get_ident())
+            return build_mahasiswa_service(session)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            service: AsyncService[MahasiswaService] = AsyncService(
+                AsyncSessionRunner(session), build
+            )
+            created = await service.call(
+                MahasiswaService.create,
+                CreateMahasiswaDto(
+                    nim="2023000001",
+                    nama="Alice Wonderland",
+                    kelas="TI-3E",
+                    tempat_lahir="Jakarta",
+                    tanggal_lahir=date(2000, 1, 15),
+                ),
+            )
+            found = await service.call(
+                MahasiswaService.read, GetMahasiswaPort(nama="Wonder")
+            )
+
+        await engine.dispose()
+        return created, found, worker_threads, loop_thread
+
+    created, found, worker_threads, loop_thread = asyncio.run(scenario())
+    assert [m.id for m in found] == [created.id]
+    assert worker_threads == {loop_thread}
+
+
+def test_async_service_streams_in_batches():
+    """
+    Streaming pulls the repository's server-side cursor one batch at a time
+    through the runner, so the whole result set is never materialized at once.
+    """
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            runner = AsyncSessionRunner(session)
+            service: AsyncService[MahasiswaService] = AsyncService(
+                runner, build_mahasiswa_service
+            )
+            await service.call(
+                MahasiswaService.bulk_create,
+                [
+                    CreateMahasiswaDto(
+                        nim=f"2023{i:06d}",
+                        nama=f"Mahasiswa {i}",
+                        kelas="TI-3E",
+                        tempat_lahir="Jakarta",
+                        tanggal_lahir=date(2000, 1, 15),
+                    )
+                    for i in range(25)
+                ],
+            )
+            batches = [
+                batch
+                async for batch in runner.stream(
+                    lambda s: build_mahasiswa_service(s).stream(GetMahasiswaPort()),
+                    batch_size=10,
+                )
+            ]
+
+        await engine.dispose()
+        return batches
+
+    batches = asyncio.run(scenario())
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [m.nim for m in batches[0]][:2] == ["2023000000", "2023000001"]
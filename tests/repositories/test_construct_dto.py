@@ -0,0 +1,62 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.application.dtos.mahasiswa_dto import MahasiswaDto
+from src.application.enums import MahasiswaStatus
+from src.repositories.database.core import construct_dto
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+from src.repositories.database.seeding import MODELS, seed_tables
+
+VALUES = dict(
+    id=1,
+    nim="2024000001",
+    nama="Budi",
+    kelas="TI-3E",
+    tempat_lahir="Bandung",
+    tanggal_lahir=date(2003, 1, 1),
+    status=MahasiswaStatus.ACTIVE,
+)
+
+
+def test_construct_dto_matches_validated_dto():
+    constructed = construct_dto(MahasiswaDto, **VALUES)
+    validated = MahasiswaDto(**VALUES)
+
+    assert constructed == validated
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.model_dump_json() == validated.model_dump_json()
+    assert constructed.model_copy(update={"nama": "Ani"}).nama == "Ani"
+
+
+def test_to_entity_builds_the_same_dto_as_validation():
+    model = MahasiswaModel(**VALUES)
+
+    entity = model.to_entity()
+
+    assert entity == MahasiswaDto(**VALUES)
+    assert entity.status is MahasiswaStatus.ACTIVE
+
+
+@pytest.mark.parametrize("table", MODELS)
+def test_every_entity_matches_model_validate(db_session: Session, table: str):
+    """
+    construct_dto fills pydantic's instance state by hand; every DTO the models
+    build with it must be indistinguishable from a validated one.
+    """
+    seed_tables(db_session, scale=25)
+    instances = db_session.scalars(select(MODELS[table])).all()
+    assert instances
+
+    for instance in instances:
+        entity = instance.to_entity()
+        validated = type(entity).model_validate(instance, from_attributes=True)
+
+        assert entity == validated
+        assert vars(entity) == vars(validated)
+        assert entity.model_fields_set == validated.model_fields_set
+        assert entity.__pydantic_extra__ == validated.__pydantic_extra__
+        assert entity.__pydantic_private__ == validated.__pydantic_private__
+        assert entity.model_dump_json() == validated.model_dump_json()
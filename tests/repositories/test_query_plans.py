@@ -0,0 +1,190 @@
+import os
+from datetime import datetime, time
+from typing import Any, Callable, Generator
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from src.application.dtos.jadwal_dto import CreateJadwalDto
+from src.application.enums import StatusTugas
+from src.ports.jadwal import GetJadwalPort
+from src.ports.mahasiswa import GetMahasiswaPort
+from src.ports.tugas import GetTugasPort
+from src.repositories.database.core import Base
+from src.repositories.database.jadwal import JadwalRepository
+from src.repositories.database.mahasiswa import MahasiswaRepository
+from src.repositories.database.tugas import TugasRepository
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+@pytest.fixture
+def plan_engine() -> Generator[Engine, None, None]:
+    """In-memory SQLite engine with the full schema (tables and indexes)."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine: Engine, run_read: Callable[[Session], Any]) -> str:
+    """
+    Runs ``run_read`` against ``engine``, captures the last query it issues and
+    returns the EXPLAIN QUERY PLAN output for it.
+    """
+    captured: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as session:
+            run_read(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[-1]
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+def assert_uses_index(plan: str, table: str, index_name: str) -> None:
+    assert index_name in plan
+    # A bare "SCAN <table>" line is a full table scan without any index.
+    assert f"SCAN {table}" not in plan.splitlines()
+
+
+@pytest.mark.parametrize(
+    "port, expected_index",
+    [
+        (GetMahasiswaPort(kelas="TI-3E"), "ix_mahasiswa_kelas"),
+        (GetMahasiswaPort(kelas="TI-3E", order_by="nama"), "ix_mahasiswa_kelas"),
+        (GetMahasiswaPort(order_by="nama", limit=20), "ix_mahasiswa_nama"),
+        (
+            GetMahasiswaPort(tanggal_lahir=datetime(2000, 1, 1).date()),
+            "ix_mahasiswa_tanggal_lahir",
+        ),
+        (GetMahasiswaPort(nim="2023000001"), "sqlite_autoindex_mahasiswa_1"),
+    ],
+)
+def test_mahasiswa_filters_use_index(plan_engine: Engine, port, expected_index):
+    plan = query_plan(plan_engine, lambda s: MahasiswaRepository(s).read(port))
+    assert_uses_index(plan, "mahasiswa", expected_index)
+
+
+@pytest.mark.parametrize(
+    "port, expected_index",
+    [
+        (GetJadwalPort(dosen_id=1), "ix_jadwal_active_dosen_hari"),
+        (GetJadwalPort(mata_kuliah_id=1), "ix_jadwal_active_mata_kuliah"),
+        (
+            GetJadwalPort(dosen_id=1, jam_mulai=time(8, 0)),
+            "ix_jadwal_active_dosen_hari",
+        ),
+    ],
+)
+def test_jadwal_filters_use_partial_index(plan_engine: Engine, port, expected_index):
+    plan = query_plan(plan_engine, lambda s: JadwalRepository(s).read(port))
+    assert_uses_index(plan, "jadwal", expected_index)
+
+
+@pytest.mark.parametrize(
+    "field_name, expected_index",
+    [
+        ("ruangan", "ix_jadwal_active_ruangan_hari"),
+        ("dosen_id", "ix_jadwal_active_dosen_hari"),
+    ],
+)
+def test_jadwal_overlaps_use_partial_index(
+    plan_engine: Engine, field_name, expected_index
+):
+    slots = [
+        CreateJadwalDto(
+            hari="Senin",
+            jam_mulai=time(8 + i, 0),
+            jam_selesai=time(10 + i, 0),
+            ruangan=f"A10{i}",
+            mata_kuliah_id=1,
+            dosen_id=i,
+        )
+        for i in range(3)
+    ]
+    plan = query_plan(
+        plan_engine, lambda s: JadwalRepository(s).find_overlaps(slots, field_name)
+    )
+    assert_uses_index(plan, "jadwal", expected_index)
+
+
+@pytest.mark.parametrize(
+    "port, expected_index",
+    [
+        (GetTugasPort(mahasiswa_id=1), "ix_tugas_mahasiswa_deadline"),
+        (
+            GetTugasPort(
+                mahasiswa_id=1,
+                deadline_from=datetime(2025, 1, 1),
+                deadline_to=datetime(2025, 6, 30),
+            ),
+            "ix_tugas_mahasiswa_deadline",
+        ),
+        (
+            GetTugasPort(mahasiswa_id=1, order_by="deadline"),
+            "ix_tugas_mahasiswa_deadline",
+        ),
+        (GetTugasPort(mata_kuliah_id=1), "ix_tugas_mata_kuliah_deadline"),
+        (GetTugasPort(status=StatusTugas.PENDING), "ix_tugas_status_deadline"),
+        (
+            GetTugasPort(
+                deadline_from=datetime(2025, 1, 1), deadline_to=datetime(2025, 2, 1)
+            ),
+            "ix_tugas_deadline",
+        ),
+    ],
+)
+def test_tugas_filters_use_index(plan_engine: Engine, port, expected_index):
+    plan = query_plan(plan_engine, lambda s: TugasRepository(s).read(port))
+    assert_uses_index(plan, "tugas", expected_index)
+
+
+def test_migrations_create_model_indexes(plan_engine: Engine):
+    """
+    The Alembic revisions must produce the same secondary indexes, server
+    defaults and triggers as the models.
+    """
+    migrated = create_engine("sqlite://", poolclass=StaticPool)
+    alembic_cfg = AlembicConfig(os.path.join(PROJECT_ROOT, "alembic.ini"))
+    alembic_cfg.set_main_option(
+        "script_location", os.path.join(PROJECT_ROOT, "alembic")
+    )
+    with migrated.begin() as connection:
+        alembic_cfg.attributes["connection"] = connection
+        command.upgrade(alembic_cfg, "head")
+
+    expected, actual = inspect(plan_engine), inspect(migrated)
+    for table in Base.metadata.tables:
+        assert {ix["name"] for ix in actual.get_indexes(table)} == {
+            ix["name"] for ix in expected.get_indexes(table)
+        }
+        assert {c["name"]: c["default"] for c in actual.get_columns(table)} == {
+            c["name"]: c["default"] for c in expected.get_columns(table)
+        }
+    triggers = "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+    with plan_engine.connect() as expected_db, migrated.connect() as actual_db:
+        assert set(actual_db.exec_driver_sql(triggers).scalars()) == set(
+            expected_db.exec_driver_sql(triggers).scalars()
+        )
+    migrated.dispose()
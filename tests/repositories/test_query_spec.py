@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.application.exceptions import InvalidInputException
+from src.ports.mahasiswa import GetMahasiswaPort
+from src.ports.tugas import GetTugasPort
+from src.repositories.database.mahasiswa import MAHASISWA_QUERY
+from src.repositories.database.tugas import TUGAS_QUERY
+
+
+def test_same_shape_reuses_statement(db_session: Session):
+    first_port = GetMahasiswaPort(kelas="TI-3A", limit=5)
+    second_port = GetMahasiswaPort(kelas="TI-3B", limit=9)
+
+    first = MAHASISWA_QUERY.select(db_session, first_port)
+    second = MAHASISWA_QUERY.select(db_session, second_port)
+
+    assert first.statement is second.statement
+    assert first.params == {"kelas": "TI-3A", "limit": 5}
+    assert second.params == {"kelas": "TI-3B", "limit": 9}
+
+
+def test_different_shapes_get_their_own_statement(db_session: Session):
+    by_kelas = MAHASISWA_QUERY.select(db_session, GetMahasiswaPort(kelas="TI-3A"))
+    by_nim = MAHASISWA_QUERY.select(db_session, GetMahasiswaPort(nim="2024000001"))
+    sorted_by_nim = MAHASISWA_QUERY.select(
+        db_session, GetMahasiswaPort(kelas="TI-3A", order_by="nim")
+    )
+
+    assert by_kelas.statement is not by_nim.statement
+    assert by_kelas.statement is not sorted_by_nim.statement
+
+
+def test_substring_filter_shape_follows_term_length(db_session: Session):
+    # Terms shorter than a trigram cannot use the FTS index.
+    short = TUGAS_QUERY.filtered(db_session, GetTugasPort(judul="ab"))
+    long = TUGAS_QUERY.filtered(db_session, GetTugasPort(judul="abc"))
+    other_long = TUGAS_QUERY.filtered(db_session, GetTugasPort(judul="xyz"))
+
+    assert short.statement is not long.statement
+    assert long.statement is other_long.statement
+    assert short.params == {"judul": "%ab%"}
+
+
+def test_column_filters_bind_values(db_session: Session):
+    query = TUGAS_QUERY.filtered(
+        db_session, GetTugasPort(deadline_from=datetime(2025, 1, 1))
+    )
+
+    assert query.params == {"deadline_from": datetime(2025, 1, 1)}
+    assert "tugas.deadline >= :deadline_from" in str(query.statement)
+
+
+def test_order_by_outside_allowlist_is_rejected(db_session: Session):
+    with pytest.raises(InvalidInputException):
+        TUGAS_QUERY.select(db_session, GetTugasPort(order_by="deskripsi"))
+
+
+def test_order_by_outside_allowlist_returns_400(client: TestClient):
+    response = client.get("/mahasiswa/", params={"order_by": "password"})
+
+    assert response.status_code == 400
+    assert "Sortable fields" in response.json()["detail"]
@@ -0,0 +1,110 @@
+import threading
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.ports.dosen import GetDosenPort
+from src.repositories.cache import ReadCache, cache_key, dosen_cache
+from tests.api.jadwal.test_expand_jadwal_api import count_statements
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_ignores_unset_filters():
+    assert cache_key(GetDosenPort(nama="Budi")) == cache_key(
+        GetDosenPort(nama="Budi", email=None)
+    )
+    assert cache_key(GetDosenPort(nama="Budi")) != cache_key(GetDosenPort(nama="Ani"))
+
+
+def test_read_cache_hits_until_ttl_expires():
+    clock = FakeClock()
+    cache: ReadCache[int] = ReadCache(max_entries=10, ttl=30, clock=clock)
+    loads = []
+
+    def load() -> int:
+        loads.append(1)
+        return len(loads)
+
+    assert cache.get_or_load("k", load) == 1
+    assert cache.get_or_load("k", load) == 1
+    clock.now = 31
+    assert cache.get_or_load("k", load) == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_read_cache_evicts_least_recently_used():
+    cache: ReadCache[str] = ReadCache(max_entries=2, ttl=60)
+    cache.get_or_load("a", lambda: "a")
+    cache.get_or_load("b", lambda: "b")
+    cache.get_or_load("a", lambda: "stale")  # "a" is now the most recent
+    cache.get_or_load("c", lambda: "c")
+
+    assert cache.get_or_load("a", lambda: "reloaded") == "a"
+    assert cache.get_or_load("b", lambda: "reloaded") == "reloaded"
+
+
+def test_read_cache_drops_load_that_raced_an_invalidation():
+    cache: ReadCache[str] = ReadCache(max_entries=10, ttl=60)
+    loading = threading.Event()
+    invalidated = threading.Event()
+
+    def slow_load() -> str:
+        loading.set()
+        invalidated.wait(timeout=5)
+        return "before write"
+
+    reader = threading.Thread(target=cache.get_or_load, args=("k", slow_load))
+    reader.start()
+    loading.wait(timeout=5)
+    cache.invalidate()
+    invalidated.set()
+    reader.join()
+
+    assert cache.get_or_load("k", lambda: "after write") == "after write"
+
+
+def test_repeated_dosen_reads_skip_the_database(
+    client: TestClient, db_session: Session
+):
+    payload = {"nidn": "0123456789", "nama": "Dr. Budi", "email": "budi@kampus.ac.id"}
+    assert client.post("/dosen/", json=payload).status_code == 201
+
+    assert len(client.get("/dosen/").json()) == 1
+    with count_statements(db_session) as statements:
+        assert len(client.get("/dosen/").json()) == 1
+    # Only the ETag's version lookup reaches the database.
+    assert len(statements) == 1
+    assert "FROM table_versions" in statements[0]
+    assert dosen_cache.stats()["hits"] == 1
+
+
+def test_dosen_write_invalidates_cached_reads(client: TestClient, db_session: Session):
+    first = {"nidn": "0123456789", "nama": "Dr. Budi", "email": "budi@kampus.ac.id"}
+    second = {"nidn": "9876543210", "nama": "Dr. Ani", "email": "ani@kampus.ac.id"}
+    assert client.post("/dosen/", json=first).status_code == 201
+    assert len(client.get("/dosen/").json()) == 1
+
+    created = client.post("/dosen/", json=second).json()
+    assert len(client.get("/dosen/").json()) == 2
+
+    renamed = {**second, "nama": "Prof. Ani"}
+    assert client.put(f"/dosen/{created['id']}", json=renamed).status_code == 200
+    assert client.get("/dosen/").json()[1]["nama"] == "Prof. Ani"
+
+
+def test_read_cache_reloads_when_version_moves():
+    version = 1
+    cache: ReadCache[int] = ReadCache(max_entries=10, ttl=60, version=lambda: version)
+
+    assert cache.get_or_load("k", lambda: 1) == 1
+    assert cache.get_or_load("k", lambda: 2) == 1
+    version = 2
+    assert cache.get_or_load("k", lambda: 3) == 3
@@ -0,0 +1,99 @@
+from datetime import date
+from typing import Generator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.application.dtos.mahasiswa_dto import UpdateMahasiswaDto
+from src.application.enums import MahasiswaStatus
+from src.ports.mahasiswa import GetMahasiswaPort
+from src.repositories.database.core import Base
+from src.repositories.database.mahasiswa import MahasiswaRepository
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+from tests.repositories.test_query_plans import query_plan
+
+
+@pytest.fixture
+def search_engine() -> Generator[Engine, None, None]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                MahasiswaModel(
+                    nim="2023000001",
+                    nama="Alice Wonderland",
+                    kelas="TI-3E",
+                    tempat_lahir="Jakarta",
+                    tanggal_lahir=date(2000, 1, 15),
+                ),
+                MahasiswaModel(
+                    nim="2023000002",
+                    nama="Bob The Builder",
+                    kelas="SIB-5F",
+                    tempat_lahir="Bandung",
+                    tanggal_lahir=date(2001, 5, 20),
+                ),
+            ]
+        )
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def test_substring_filter_uses_trigram_index(search_engine: Engine):
+    plan = query_plan(
+        search_engine,
+        lambda s: MahasiswaRepository(s).read(GetMahasiswaPort(nama="onder")),
+    )
+    assert "VIRTUAL TABLE INDEX" in plan
+    assert "SCAN mahasiswa" not in plan.splitlines()
+
+
+def test_substring_filter_is_case_insensitive(search_engine: Engine):
+    with Session(search_engine) as session:
+        result = MahasiswaRepository(session).read(GetMahasiswaPort(nama="WONDER"))
+    assert [m.nim for m in result] == ["2023000001"]
+
+
+def test_short_terms_fall_back_to_ilike(search_engine: Engine):
+    with Session(search_engine) as session:
+        result = MahasiswaRepository(session).read(GetMahasiswaPort(nama="bo"))
+    assert [m.nim for m in result] == ["2023000002"]
+
+
+def test_free_text_search_matches_all_words_across_columns(search_engine: Engine):
+    with Session(search_engine) as session:
+        repository = MahasiswaRepository(session)
+        assert [m.nim for m in repository.read(GetMahasiswaPort(q="bob bandung"))] == [
+            "2023000002"
+        ]
+        assert repository.read(GetMahasiswaPort(q="bob jakarta")) == []
+
+
+def test_search_index_follows_updates(search_engine: Engine):
+    with Session(search_engine) as session:
+        repository = MahasiswaRepository(session)
+        alice = repository.read(GetMahasiswaPort(nim="2023000001"))[0]
+        repository.update(
+            UpdateMahasiswaDto(
+                id=alice.id,
+                nim=alice.nim,
+                nama="Alicia Keys",
+                kelas=alice.kelas,
+                tempat_lahir=alice.tempat_lahir,
+                tanggal_lahir=alice.tanggal_lahir,
+                status=MahasiswaStatus.ACTIVE,
+            )
+        )
+        assert repository.read(GetMahasiswaPort(nama="Wonderland")) == []
+        assert [m.id for m in repository.read(GetMahasiswaPort(nama="Keys"))] == [
+            alice.id
+        ]
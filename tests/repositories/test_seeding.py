@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.application.dtos.jadwal_dto import CreateJadwalDto
+from src.ports.mahasiswa import GetMahasiswaPort
+from src.repositories.database import seeding
+from src.repositories.database.jadwal import JadwalRepository
+from src.repositories.database.mahasiswa import MahasiswaRepository
+from src.repositories.database.models.dosen import DosenModel
+from src.repositories.database.models.jadwal import JadwalModel
+from src.repositories.database.models.mahasiswa import MahasiswaModel
+from src.repositories.database.models.tugas import TugasModel
+from src.repositories.database.seeding import seed_tables, table_sizes
+
+
+def row_count(db_session: Session, model) -> int:
+    return db_session.scalar(select(func.count()).select_from(model))
+
+
+def test_seed_fills_every_table_at_scale(db_session: Session):
+    inserted = seed_tables(db_session, scale=50)
+
+    assert inserted == table_sizes(50)
+    assert row_count(db_session, MahasiswaModel) == 50
+    assert row_count(db_session, TugasModel) == 100
+    dosen_ids = set(db_session.scalars(select(DosenModel.id)))
+    jadwal_dosen_ids = set(db_session.scalars(select(JadwalModel.dosen_id)))
+    assert jadwal_dosen_ids <= dosen_ids
+
+
+def stored_overlaps(db_session: Session) -> list[tuple[int, int, str]]:
+    repository = JadwalRepository(db_session)
+    active = db_session.scalars(select(JadwalModel).where(JadwalModel.is_active))
+    overlaps = []
+    for jadwal in active:
+        proposed = CreateJadwalDto.model_validate(jadwal, from_attributes=True)
+        for field_name in ("ruangan", "dosen_id"):
+            found = repository.find_overlaps([proposed], field_name, jadwal.id)
+            overlaps += [(jadwal.id, other.id, field_name) for _, other in found]
+    return overlaps
+
+
+def test_seeded_jadwal_are_not_double_booked(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(seeding, "SEED_BATCH_SIZE", 15)
+    seed_tables(db_session, scale=250)
+    # Seeding into a non-empty table keeps the active schedule conflict free.
+    seed_tables(db_session, scale=250, tables=["jadwal"], seed=1)
+
+    assert row_count(db_session, JadwalModel) == 100
+    assert stored_overlaps(db_session) == []
+
+
+def test_seeded_ruangan_stay_inside_the_building_grid(db_session: Session):
+    seed_tables(db_session, scale=2000)
+
+    grid = {
+        f"{gedung}{floor}{room:02d}"
+        for gedung in seeding.GEDUNG
+        for floor in range(1, seeding.FLOORS + 1)
+        for room in range(1, seeding.ROOMS_PER_FLOOR + 1)
+    }
+    ruangan = set(db_session.scalars(select(JadwalModel.ruangan)))
+    assert ruangan <= grid
+
+
+def test_seed_jadwal_without_enough_dosen_fails(db_session: Session):
+    seed_tables(db_session, scale=25, tables=["dosen", "mata_kuliah"])
+
+    with pytest.raises(ValueError, match="requires at least 3 dosen"):
+        seeding.seed_table(db_session, "jadwal", 100)
+
+
+def test_seed_in_parallel_continues_key_numbering(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(seeding, "SEED_BATCH_SIZE", 40)
+    seed_tables(db_session, scale=100, tables=["mahasiswa", "dosen"])
+
+    seed_tables(db_session, scale=100, tables=["mahasiswa", "dosen"], workers=2)
+
+    nims = list(db_session.scalars(select(MahasiswaModel.nim)))
+    emails = list(db_session.scalars(select(DosenModel.email)))
+    assert len(nims) == len(set(nims)) == 200
+    assert len(emails) == len(set(emails)) == 8
+
+
+def test_seeded_rows_are_searchable(db_session: Session):
+    seed_tables(db_session, scale=20, tables=["mahasiswa"])
+    nama = db_session.scalar(select(MahasiswaModel.nama).order_by(MahasiswaModel.id))
+
+    found = MahasiswaRepository(db_session).read(GetMahasiswaPort(nama=nama))
+
+    assert nama in [m.nama for m in found]
+
+
+def test_seed_children_without_parents_fails(db_session: Session):
+    with pytest.raises(ValueError, match="requires existing"):
+        seed_tables(db_session, scale=10, tables=["jadwal"])
@@ -0,0 +1,69 @@
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from src.application.dtos.jadwal_dto import UpdateJadwalDto
+from src.application.dtos.mata_kuliah_dto import CreateMataKuliahDto
+from src.repositories.database.jadwal import JadwalRepository
+from src.repositories.database.mata_kuliah import MataKuliahRepository
+from src.repositories.database.models.dosen import DosenModel
+from src.repositories.database.models.jadwal import JadwalModel
+from src.repositories.database.versions import known_version, read_versions
+
+TABLES = ("dosen", "jadwal", "mata_kuliah")
+
+
+def test_unit_of_work_commit_bumps_each_written_table(db_session: Session):
+    before = read_versions(db_session, TABLES)
+
+    db_session.add(DosenModel(nidn="1234567890", nama="Dr. A", email="a@b.ac.id"))
+    db_session.commit()
+
+    after = read_versions(db_session, TABLES)
+    assert after["dosen"] == before["dosen"] + 1
+    assert after["jadwal"] == before["jadwal"]
+    assert known_version("dosen") == after["dosen"]
+
+
+def test_update_statement_bumps_version(
+    db_session: Session,
+    jadwal: JadwalModel,
+    make_update: Callable[..., UpdateJadwalDto],
+):
+    before = read_versions(db_session, TABLES)
+
+    JadwalRepository(db_session).update(make_update(ruangan="B202"))
+
+    after = read_versions(db_session, TABLES)
+    assert after["jadwal"] == before["jadwal"] + 1
+    assert after["dosen"] == before["dosen"]
+
+
+def test_bulk_insert_bumps_version_once(db_session: Session):
+    before = read_versions(db_session, TABLES)["mata_kuliah"]
+
+    MataKuliahRepository(db_session).bulk_create(
+        [
+            CreateMataKuliahDto(kode_mk=f"IF10{i}", nama_mk=f"Kuliah {i}", sks=3)
+            for i in range(3)
+        ]
+    )
+
+    assert read_versions(db_session, TABLES)["mata_kuliah"] == before + 1
+
+
+def test_rolled_back_and_read_only_transactions_keep_version(db_session: Session):
+    before = read_versions(db_session, TABLES)
+    # Rolls back to a savepoint instead of ending the test's outer transaction.
+    session = Session(
+        bind=db_session.connection(), join_transaction_mode="create_savepoint"
+    )
+
+    session.add(DosenModel(nidn="1234567890", nama="Dr. A", email="a@b.ac.id"))
+    session.flush()
+    session.rollback()
+    session.query(DosenModel).all()
+    session.commit()
+    session.close()
+
+    assert read_versions(db_session, TABLES) == before
@@ -0,0 +1,92 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.application.dtos.dosen_dto import CreateDosenDto, UpdateDosenDto
+from src.application.dtos.mahasiswa_dto import CreateMahasiswaDto
+from src.application.enums import DosenStatus
+from src.application.exceptions import DuplicateEntryException
+from src.repositories.database.dosen import DosenRepository
+from src.repositories.database.mahasiswa import MahasiswaRepository
+
+
+def make_mahasiswa(nim: str) -> CreateMahasiswaDto:
+    return CreateMahasiswaDto(
+        nim=nim,
+        nama="Alice Wonderland",
+        kelas="TI-3E",
+        tempat_lahir="Jakarta",
+        tanggal_lahir=date(2000, 1, 15),
+    )
+
+
+def test_create_is_a_single_statement(db_session: Session):
+    """
+    Creating a row issues one INSERT ... RETURNING and no duplicate-check read.
+    """
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        created = MahasiswaRepository(db_session).create(make_mahasiswa("2023000001"))
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    assert created.nim == "2023000001"
+    # The write itself, then the table_versions bump made on commit.
+    assert len(statements) == 2
+    assert statements[0].startswith("INSERT INTO mahasiswa")
+    assert "RETURNING" in statements[0]
+    assert statements[1].startswith("UPDATE table_versions")
+
+
+def test_duplicate_nim_is_translated(db_session: Session):
+    """
+    A unique-constraint violation becomes a DuplicateEntryException naming
+    the field, and the session stays usable afterwards.
+    """
+    repository = MahasiswaRepository(db_session)
+    repository.create(make_mahasiswa("2023000001"))
+
+    with pytest.raises(DuplicateEntryException) as exc_info:
+        repository.create(make_mahasiswa("2023000001"))
+
+    assert exc_info.value.message == (
+        "Mahasiswa with NIM '2023000001' already exists."
+    )
+    assert repository.create(make_mahasiswa("2023000002")).nim == "2023000002"
+
+
+def test_duplicate_email_on_update_is_translated(db_session: Session):
+    """
+    The violated column is identified when a table has several unique
+    constraints.
+    """
+    repository = DosenRepository(db_session)
+    repository.create(
+        CreateDosenDto(nidn="0000000001", nama="Dr. A", email="a@university.ac.id")
+    )
+    second = repository.create(
+        CreateDosenDto(nidn="0000000002", nama="Dr. B", email="b@university.ac.id")
+    )
+
+    with pytest.raises(DuplicateEntryException) as exc_info:
+        repository.update(
+            UpdateDosenDto(
+                id=second.id,
+                nidn="0000000002",
+                nama="Dr. B",
+                email="a@university.ac.id",
+                status=DosenStatus.ACTIVE,
+            )
+        )
+
+    assert exc_info.value.message == (
+        "Dosen with email 'a@university.ac.id' already exists."
+    )
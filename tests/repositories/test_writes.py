@@ -0,0 +1,108 @@
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.application.dtos.jadwal_dto import UpdateJadwalDto
+from src.application.dtos.mata_kuliah_dto import CreateMataKuliahDto
+from src.application.exceptions import NotFoundException
+from src.repositories.database.jadwal import JadwalRepository
+from src.repositories.database.mata_kuliah import MataKuliahRepository
+from src.repositories.database.models.jadwal import JadwalModel
+from src.repositories.database.versions import read_versions
+
+
+def test_update_is_a_single_statement(
+    db_session: Session,
+    jadwal: JadwalModel,
+    make_update: Callable[..., UpdateJadwalDto],
+):
+    """
+    An update issues one UPDATE ... RETURNING and builds the DTO from the
+    returned row, without a preceding SELECT or a refresh afterwards.
+    """
+    update_dto = make_update(ruangan="B202")
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        updated = JadwalRepository(db_session).update(update_dto)
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    assert updated.ruangan == "B202"
+    assert updated.hari == "Senin"
+    # The write itself, then the table_versions bump made on commit.
+    assert len(statements) == 2
+    assert statements[0].startswith("UPDATE jadwal SET")
+    assert "RETURNING" in statements[0]
+    assert statements[1].startswith("UPDATE table_versions")
+    # Instances already loaded in the session see the new values too.
+    assert jadwal.ruangan == "B202"
+
+
+def test_update_missing_row_raises_not_found(
+    db_session: Session,
+    jadwal: JadwalModel,
+    make_update: Callable[..., UpdateJadwalDto],
+):
+    """
+    Zero affected rows is reported as NotFoundException.
+    """
+    with pytest.raises(NotFoundException) as exc_info:
+        JadwalRepository(db_session).update(make_update(id=jadwal.id + 100))
+
+    assert str(jadwal.id + 100) in exc_info.value.message
+
+
+def test_upsert_skips_rows_that_already_hold_the_values(db_session: Session):
+    """
+    One INSERT ... ON CONFLICT DO UPDATE sorts rows into created, updated and
+    unchanged; a call that changes nothing writes nothing and keeps the table
+    version.
+    """
+    repository = MataKuliahRepository(db_session)
+    repository.upsert(
+        [
+            CreateMataKuliahDto(kode_mk="IF101", nama_mk="Pemrograman", sks=3),
+            CreateMataKuliahDto(kode_mk="IF102", nama_mk="Basis Data", sks=3),
+        ]
+    )
+    version = read_versions(db_session, ["mata_kuliah"])["mata_kuliah"]
+
+    result = repository.upsert(
+        [
+            CreateMataKuliahDto(kode_mk="IF101", nama_mk="Pemrograman", sks=3),
+            CreateMataKuliahDto(kode_mk="IF102", nama_mk="Basis Data", sks=4),
+            CreateMataKuliahDto(kode_mk="IF103", nama_mk="Jaringan", sks=2),
+        ]
+    )
+
+    assert [mk.kode_mk for mk in result.created] == ["IF103"]
+    assert [(mk.kode_mk, mk.sks) for mk in result.updated] == [("IF102", 4)]
+    assert result.unchanged == ["IF101"]
+    assert read_versions(db_session, ["mata_kuliah"])["mata_kuliah"] == version + 1
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        result = repository.upsert(
+            [CreateMataKuliahDto(kode_mk="IF101", nama_mk="Pemrograman", sks=3)]
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    assert result.unchanged == ["IF101"]
+    assert len(statements) == 1
+    assert "ON CONFLICT" in statements[0]
+    assert read_versions(db_session, ["mata_kuliah"])["mata_kuliah"] == version + 1
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.dtos.dosen_dto import CreateDosenDto, DosenDto
+from src.application.enums import DosenStatus
+from src.application.usecases.dosen import DosenService
+from src.application.usecases.interfaces.dosen_repository import (
+    DosenRepositoryInterface,
+)
+
+
+@pytest.fixture
+def mock_dosen_repo() -> MagicMock:
+    """Fixture for a mocked DosenRepositoryInterface."""
+    return MagicMock(spec=DosenRepositoryInterface)
+
+
+@pytest.fixture
+def dosen_service(mock_dosen_repo: MagicMock) -> DosenService:
+    """Fixture for DosenService with a mocked repository."""
+    return DosenService(dosen_repo=mock_dosen_repo)
+
+
+def make_create_dto(
+    nidn: str, email: str, nama: str = "Dr. John Doe"
+) -> CreateDosenDto:
+    return CreateDosenDto(nidn=nidn, nama=nama, email=email, status=DosenStatus.ACTIVE)
+
+
+def test_bulk_create_dosen_reports_per_item_errors(
+    dosen_service: DosenService, mock_dosen_repo: MagicMock
+):
+    """
+    Test that invalid items and duplicate NIDN/email values are reported by
+    index, in input order, while the valid items are inserted in one call.
+    """
+    create_dtos = [
+        make_create_dto("0000000001", "a@university.ac.id"),
+        make_create_dto("0000000002", "b@university.ac.id", nama=""),
+        make_create_dto("0000000003", "taken@university.ac.id"),
+        make_create_dto("0000000004", "d@university.ac.id"),
+        make_create_dto("0000000004", "e@university.ac.id"),
+    ]
+    mock_dosen_repo.read_existing_values.side_effect = [
+        set(),  # nidn
+        {"taken@university.ac.id"},  # email
+    ]
+    mock_dosen_repo.bulk_create.return_value = [
+        DosenDto(id=1, **create_dtos[0].model_dump()),
+        DosenDto(id=2, **create_dtos[3].model_dump()),
+    ]
+
+    result = dosen_service.bulk_create(create_dtos)
+
+    mock_dosen_repo.bulk_create.assert_called_once_with(
+        [create_dtos[0], create_dtos[3]]
+    )
+    mock_dosen_repo.read.assert_not_called()
+    assert [error.index for error in result.errors] == [1, 2, 4]
+    assert result.errors[0].message == "Nama cannot be empty"
+    assert "email" in result.errors[1].message
+    assert "nidn" in result.errors[2].message
+    assert len(result.created) == 2
@@ -9,7 +9,6 @@ from src.application.usecases.interfaces.dosen_repository import (
     DosenRepositoryInterface,
 )
 from src.application.usecases.dosen import DosenService
-from src.ports.dosen import GetDosenPort
 
 
 @pytest.fixture
@@ -45,17 +44,13 @@ def test_create_dosen_success(
         status=DosenStatus.ACTIVE,
     )
 
-    # Mock: NIDN doesn't exist yet
-    mock_dosen_repo.read.side_effect = [[], []]  # First for NIDN, second for email
     # Mock: Create returns the new dosen
     mock_dosen_repo.create.return_value = expected_result
 
     result = dosen_service.create(create_dto)
 
-    # Verify repository was called to check for existing NIDN
-    assert mock_dosen_repo.read.call_count == 2
-    mock_dosen_repo.read.assert_any_call(GetDosenPort(nidn=create_dto.nidn))
-    mock_dosen_repo.read.assert_any_call(GetDosenPort(email=create_dto.email))
+    # Verify no separate reads are issued to check for duplicates
+    mock_dosen_repo.read.assert_not_called()
     # Verify repository was called to create
     mock_dosen_repo.create.assert_called_once_with(create_dto)
     # Verify result
@@ -75,18 +70,10 @@ def test_create_dosen_duplicate_nidn(
         status=DosenStatus.ACTIVE,
     )
 
-    existing_dosen = [
-        DosenDto(
-            id=1,
-            nidn="0123456789",
-            nama="Dr. Existing Dosen",
-            email="existing@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
-    # Mock: NIDN already exists
-    mock_dosen_repo.read.return_value = existing_dosen
+    # Mock: the unique constraint on nidn rejects the insert
+    mock_dosen_repo.create.side_effect = DuplicateEntryException(
+        resource_name="Dosen", field_name="nidn", field_value=create_dto.nidn
+    )
 
     with pytest.raises(DuplicateEntryException) as exc_info:
         dosen_service.create(create_dto)
@@ -94,12 +81,8 @@ def test_create_dosen_duplicate_nidn(
     assert "nidn" in str(exc_info.value).lower()
     assert "already exists" in str(exc_info.value).lower()
 
-    # Verify repository was called to check for existing NIDN
-    mock_dosen_repo.read.assert_called_once_with(
-        GetDosenPort(nidn=create_dto.nidn)
-    )
-    # Verify create was never called
-    mock_dosen_repo.create.assert_not_called()
+    mock_dosen_repo.create.assert_called_once_with(create_dto)
+    mock_dosen_repo.read.assert_not_called()
 
 
 def test_create_dosen_duplicate_email(
@@ -115,18 +98,10 @@ def test_create_dosen_duplicate_email(
         status=DosenStatus.ACTIVE,
     )
 
-    existing_dosen_with_email = [
-        DosenDto(
-            id=2,
-            nidn="9876543210",
-            nama="Dr. Another Dosen",
-            email="duplicate@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
-    # Mock: NIDN doesn't exist, but email already exists
-    mock_dosen_repo.read.side_effect = [[], existing_dosen_with_email]
+    # Mock: the unique constraint on email rejects the insert
+    mock_dosen_repo.create.side_effect = DuplicateEntryException(
+        resource_name="Dosen", field_name="email", field_value=create_dto.email
+    )
 
     with pytest.raises(DuplicateEntryException) as exc_info:
         dosen_service.create(create_dto)
@@ -134,10 +109,8 @@ def test_create_dosen_duplicate_email(
     assert "email" in str(exc_info.value).lower()
     assert "already exists" in str(exc_info.value).lower()
 
-    # Verify repository was called twice (NIDN check, email check)
-    assert mock_dosen_repo.read.call_count == 2
-    # Verify create was never called
-    mock_dosen_repo.create.assert_not_called()
+    mock_dosen_repo.create.assert_called_once_with(create_dto)
+    mock_dosen_repo.read.assert_not_called()
 
 
 def test_create_dosen_invalid_nidn_empty(
@@ -9,7 +9,6 @@ from src.application.usecases.interfaces.dosen_repository import (
     DosenRepositoryInterface,
 )
 from src.application.usecases.dosen import DosenService
-from src.ports.dosen import GetDosenPort
 
 
 @pytest.fixture
@@ -30,16 +29,6 @@ def test_update_dosen_success(
     """
     Test updating a Dosen successfully.
     """
-    existing_dosen = [
-        DosenDto(
-            id=1,
-            nidn="0123456789",
-            nama="Dr. John Doe",
-            email="john.doe@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
     update_dto = UpdateDosenDto(
         id=1,
         nidn="0123456789",
@@ -56,15 +45,13 @@ def test_update_dosen_success(
         status=DosenStatus.ACTIVE,
     )
 
-    # Mock: Dosen exists
-    mock_dosen_repo.read.return_value = existing_dosen
     # Mock: Update returns the updated dosen
     mock_dosen_repo.update.return_value = expected_result
 
     result = dosen_service.update(update_dto)
 
-    # Verify repository was called to check if dosen exists
-    mock_dosen_repo.read.assert_called_once_with(GetDosenPort(id=update_dto.id))
+    # Verify the update needs no separate existence read
+    mock_dosen_repo.read.assert_not_called()
     # Verify repository was called to update
     mock_dosen_repo.update.assert_called_once_with(update_dto)
     # Verify result
@@ -86,8 +73,10 @@ def test_update_dosen_not_found(
         status=DosenStatus.ACTIVE,
     )
 
-    # Mock: Dosen doesn't exist
-    mock_dosen_repo.read.return_value = []
+    # Mock: the UPDATE matches no row
+    mock_dosen_repo.update.side_effect = NotFoundException(
+        resource_name="Dosen", identifier=update_dto.id
+    )
 
     with pytest.raises(NotFoundException) as exc_info:
         dosen_service.update(update_dto)
@@ -95,38 +84,18 @@ def test_update_dosen_not_found(
     assert "dosen" in str(exc_info.value).lower()
     assert "999" in str(exc_info.value)
 
-    # Verify repository was called to check if dosen exists
-    mock_dosen_repo.read.assert_called_once_with(GetDosenPort(id=update_dto.id))
-    # Verify update was never called
-    mock_dosen_repo.update.assert_not_called()
+    # Verify the update itself detected the missing row
+    mock_dosen_repo.read.assert_not_called()
+    mock_dosen_repo.update.assert_called_once_with(update_dto)
 
 
 def test_update_dosen_change_nidn_to_existing(
     dosen_service: DosenService, mock_dosen_repo: MagicMock
 ):
     """
-    Test updating a Dosen's NIDN to one that already exists raises DuplicateEntryException.
+    Test updating a Dosen's NIDN to one that already exists raises
+    DuplicateEntryException.
     """
-    existing_dosen = [
-        DosenDto(
-            id=1,
-            nidn="0123456789",
-            nama="Dr. John Doe",
-            email="john.doe@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
-    another_dosen_with_new_nidn = [
-        DosenDto(
-            id=2,
-            nidn="9876543210",
-            nama="Dr. Another Dosen",
-            email="another@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
     update_dto = UpdateDosenDto(
         id=1,
         nidn="9876543210",  # Trying to change to an existing NIDN
@@ -135,8 +104,10 @@ def test_update_dosen_change_nidn_to_existing(
         status=DosenStatus.ACTIVE,
     )
 
-    # Mock: First call returns existing dosen, second call returns dosen with duplicate NIDN
-    mock_dosen_repo.read.side_effect = [existing_dosen, another_dosen_with_new_nidn]
+    # Mock: the unique constraint on nidn rejects the update
+    mock_dosen_repo.update.side_effect = DuplicateEntryException(
+        resource_name="Dosen", field_name="nidn", field_value=update_dto.nidn
+    )
 
     with pytest.raises(DuplicateEntryException) as exc_info:
         dosen_service.update(update_dto)
@@ -144,51 +115,29 @@ def test_update_dosen_change_nidn_to_existing(
     assert "nidn" in str(exc_info.value).lower()
     assert "already exists" in str(exc_info.value).lower()
 
-    # Verify repository was called twice
-    assert mock_dosen_repo.read.call_count == 2
-    # Verify update was never called
-    mock_dosen_repo.update.assert_not_called()
+    mock_dosen_repo.read.assert_not_called()
+    mock_dosen_repo.update.assert_called_once_with(update_dto)
 
 
 def test_update_dosen_change_email_to_existing(
     dosen_service: DosenService, mock_dosen_repo: MagicMock
 ):
     """
-    Test updating a Dosen's email to one that already exists raises DuplicateEntryException.
+    Test updating a Dosen's email to one that already exists raises
+    DuplicateEntryException.
     """
-    existing_dosen = [
-        DosenDto(
-            id=1,
-            nidn="0123456789",
-            nama="Dr. John Doe",
-            email="john.doe@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
-    another_dosen_with_new_email = [
-        DosenDto(
-            id=2,
-            nidn="9876543210",
-            nama="Dr. Another Dosen",
-            email="duplicate@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
     update_dto = UpdateDosenDto(
         id=1,
-        nidn="0123456789",  # Same NIDN, so NIDN check is skipped
+        nidn="0123456789",
         nama="Dr. John Doe",
         email="duplicate@university.ac.id",  # Trying to change to an existing email
         status=DosenStatus.ACTIVE,
     )
 
-    # Mock: First call returns existing dosen, second call returns dosen with duplicate email
-    mock_dosen_repo.read.side_effect = [
-        existing_dosen,  # Check if dosen exists
-        another_dosen_with_new_email,  # Email check fails
-    ]
+    # Mock: the unique constraint on email rejects the update
+    mock_dosen_repo.update.side_effect = DuplicateEntryException(
+        resource_name="Dosen", field_name="email", field_value=update_dto.email
+    )
 
     with pytest.raises(DuplicateEntryException) as exc_info:
         dosen_service.update(update_dto)
@@ -196,26 +145,16 @@ def test_update_dosen_change_email_to_existing(
     assert "email" in str(exc_info.value).lower()
     assert "already exists" in str(exc_info.value).lower()
 
-    # Verify repository was called twice
-    assert mock_dosen_repo.read.call_count == 2
-    # Verify update was never called
-    mock_dosen_repo.update.assert_not_called()
+    mock_dosen_repo.read.assert_not_called()
+    mock_dosen_repo.update.assert_called_once_with(update_dto)
+
+
 def test_update_dosen_change_status(
     dosen_service: DosenService, mock_dosen_repo: MagicMock
 ):
     """
     Test updating a Dosen's status.
     """
-    existing_dosen = [
-        DosenDto(
-            id=1,
-            nidn="0123456789",
-            nama="Dr. John Doe",
-            email="john.doe@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
     update_dto = UpdateDosenDto(
         id=1,
         nidn="0123456789",
@@ -232,8 +171,6 @@ def test_update_dosen_change_status(
         status=DosenStatus.LEAVE,
     )
 
-    # Mock: Dosen exists
-    mock_dosen_repo.read.return_value = existing_dosen
     # Mock: Update returns the updated dosen
     mock_dosen_repo.update.return_value = expected_result
 
@@ -249,16 +186,6 @@ def test_update_dosen_no_changes(
     """
     Test updating a Dosen with no changes to NIDN or email.
     """
-    existing_dosen = [
-        DosenDto(
-            id=1,
-            nidn="0123456789",
-            nama="Dr. John Doe",
-            email="john.doe@university.ac.id",
-            status=DosenStatus.ACTIVE,
-        )
-    ]
-
     update_dto = UpdateDosenDto(
         id=1,
         nidn="0123456789",  # Same NIDN
@@ -275,14 +202,12 @@ def test_update_dosen_no_changes(
         status=DosenStatus.ACTIVE,
     )
 
-    # Mock: Dosen exists
-    mock_dosen_repo.read.return_value = existing_dosen
     # Mock: Update returns the updated dosen
     mock_dosen_repo.update.return_value = expected_result
 
     result = dosen_service.update(update_dto)
 
-    # When NIDN and email don't change, only one read call is made
-    mock_dosen_repo.read.assert_called_once_with(GetDosenPort(id=update_dto.id))
+    # The update is a single repository call
+    mock_dosen_repo.read.assert_not_called()
     mock_dosen_repo.update.assert_called_once_with(update_dto)
     assert result.nama == "Dr. John Doe Updated"
@@ -4,7 +4,10 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.application.dtos.jadwal_dto import CreateJadwalDto, JadwalDto
-from src.application.exceptions import InvalidInputException
+from src.application.exceptions import (
+    InvalidInputException,
+    ScheduleConflictException,
+)
 from src.application.usecases.interfaces.jadwal_repository import (
     JadwalRepositoryInterface,
 )
@@ -14,7 +17,9 @@ from src.application.usecases.jadwal import JadwalService
 @pytest.fixture
 def mock_jadwal_repo() -> MagicMock:
     """Fixture for a mocked JadwalRepositoryInterface."""
-    return MagicMock(spec=JadwalRepositoryInterface)
+    repo = MagicMock(spec=JadwalRepositoryInterface)
+    repo.find_overlaps.return_value = []
+    return repo
 
 
 @pytest.fixture
@@ -232,3 +237,41 @@ def test_create_jadwal_with_edge_case_times(
     # Assert
     assert result == expected_result
     mock_jadwal_repo.create.assert_called_once_with(create_dto)
+
+
+def test_create_jadwal_double_booking_ruangan(
+    jadwal_service: JadwalService, mock_jadwal_repo: MagicMock
+):
+    """
+    Test that a jadwal overlapping a stored jadwal in the same ruangan is
+    rejected without being created.
+    """
+    create_dto = CreateJadwalDto(
+        hari="Senin",
+        jam_mulai=time(9, 0),
+        jam_selesai=time(11, 0),
+        ruangan="R101",
+        mata_kuliah_id=1,
+        dosen_id=2,
+    )
+    booked = JadwalDto(
+        id=7,
+        hari="Senin",
+        jam_mulai=time(8, 0),
+        jam_selesai=time(10, 0),
+        ruangan="R101",
+        mata_kuliah_id=1,
+        dosen_id=1,
+        is_active=True,
+    )
+    mock_jadwal_repo.find_overlaps.side_effect = lambda dtos, field_name, _: (
+        [(0, booked)] if field_name == "ruangan" else []
+    )
+
+    with pytest.raises(ScheduleConflictException) as exc_info:
+        jadwal_service.create(create_dto)
+
+    assert exc_info.value.message == (
+        "Ruangan R101 is already booked on Senin 08:00-10:00 by jadwal 7."
+    )
+    mock_jadwal_repo.create.assert_not_called()
@@ -9,7 +9,6 @@ from src.application.usecases.interfaces.jadwal_repository import (
     JadwalRepositoryInterface,
 )
 from src.application.usecases.jadwal import JadwalService
-from src.ports.jadwal import GetJadwalPort
 
 
 @pytest.fixture
@@ -30,19 +29,6 @@ def test_update_jadwal_success(
     """
     Test updating an existing jadwal successfully.
     """
-    existing_jadwal = [
-        JadwalDto(
-            id=1,
-            hari="Senin",
-            jam_mulai=time(8, 0),
-            jam_selesai=time(10, 0),
-            ruangan="R101",
-            mata_kuliah_id=1,
-            dosen_id=1,
-            is_active=True,
-        )
-    ]
-
     update_dto = UpdateJadwalDto(
         id=1,
         hari="Selasa",
@@ -65,8 +51,6 @@ def test_update_jadwal_success(
         is_active=True,
     )
 
-    # Mock: jadwal exists
-    mock_jadwal_repo.read.return_value = existing_jadwal
     mock_jadwal_repo.update.return_value = updated_jadwal
 
     # Act
@@ -74,7 +58,7 @@ def test_update_jadwal_success(
 
     # Assert
     assert result == updated_jadwal
-    mock_jadwal_repo.read.assert_called_once_with(GetJadwalPort(id=1))
+    mock_jadwal_repo.read.assert_not_called()
     mock_jadwal_repo.update.assert_called_once_with(update_dto)
 
 
@@ -95,8 +79,10 @@ def test_update_jadwal_not_found_raises_exception(
         is_active=True,
     )
 
-    # Mock: jadwal does not exist
-    mock_jadwal_repo.read.return_value = []
+    # Mock: the UPDATE matches no row
+    mock_jadwal_repo.update.side_effect = NotFoundException(
+        resource_name="Jadwal", identifier=999
+    )
 
     # Act & Assert
     with pytest.raises(NotFoundException) as exc_info:
@@ -104,8 +90,8 @@ def test_update_jadwal_not_found_raises_exception(
 
     assert "Jadwal" in str(exc_info.value)
     assert "999" in str(exc_info.value)
-    mock_jadwal_repo.read.assert_called_once_with(GetJadwalPort(id=999))
-    mock_jadwal_repo.update.assert_not_called()
+    mock_jadwal_repo.read.assert_not_called()
+    mock_jadwal_repo.update.assert_called_once_with(update_dto)
 
 
 def test_update_jadwal_invalid_time_range_raises_exception(
@@ -114,19 +100,6 @@ def test_update_jadwal_invalid_time_range_raises_exception(
     """
     Test that updating jadwal with invalid time range raises InvalidInputException.
     """
-    existing_jadwal = [
-        JadwalDto(
-            id=1,
-            hari="Senin",
-            jam_mulai=time(8, 0),
-            jam_selesai=time(10, 0),
-            ruangan="R101",
-            mata_kuliah_id=1,
-            dosen_id=1,
-            is_active=True,
-        )
-    ]
-
     update_dto = UpdateJadwalDto(
         id=1,
         hari="Senin",
@@ -138,15 +111,12 @@ def test_update_jadwal_invalid_time_range_raises_exception(
         is_active=True,
     )
 
-    # Mock: jadwal exists
-    mock_jadwal_repo.read.return_value = existing_jadwal
-
     # Act & Assert
     with pytest.raises(InvalidInputException) as exc_info:
         jadwal_service.update(update_dto)
 
     assert "Jam mulai must be before jam selesai" in str(exc_info.value)
-    mock_jadwal_repo.read.assert_called_once_with(GetJadwalPort(id=1))
+    mock_jadwal_repo.read.assert_not_called()
     mock_jadwal_repo.update.assert_not_called()
 
 
@@ -156,19 +126,6 @@ def test_update_jadwal_same_start_and_end_time_raises_exception(
     """
     Test that updating jadwal with same start and end time raises InvalidInputException.
     """
-    existing_jadwal = [
-        JadwalDto(
-            id=1,
-            hari="Senin",
-            jam_mulai=time(8, 0),
-            jam_selesai=time(10, 0),
-            ruangan="R101",
-            mata_kuliah_id=1,
-            dosen_id=1,
-            is_active=True,
-        )
-    ]
-
     update_dto = UpdateJadwalDto(
         id=1,
         hari="Senin",
@@ -180,9 +137,6 @@ def test_update_jadwal_same_start_and_end_time_raises_exception(
         is_active=True,
     )
 
-    # Mock: jadwal exists
-    mock_jadwal_repo.read.return_value = existing_jadwal
-
     # Act & Assert
     with pytest.raises(InvalidInputException) as exc_info:
         jadwal_service.update(update_dto)
@@ -197,19 +151,6 @@ def test_update_jadwal_change_only_hari(
     """
     Test updating only the hari field of a jadwal.
     """
-    existing_jadwal = [
-        JadwalDto(
-            id=1,
-            hari="Senin",
-            jam_mulai=time(8, 0),
-            jam_selesai=time(10, 0),
-            ruangan="R101",
-            mata_kuliah_id=1,
-            dosen_id=1,
-            is_active=True,
-        )
-    ]
-
     update_dto = UpdateJadwalDto(
         id=1,
         hari="Rabu",
@@ -232,8 +173,6 @@ def test_update_jadwal_change_only_hari(
         is_active=True,
     )
 
-    # Mock: jadwal exists
-    mock_jadwal_repo.read.return_value = existing_jadwal
     mock_jadwal_repo.update.return_value = updated_jadwal
 
     # Act
@@ -251,19 +190,6 @@ def test_update_jadwal_change_only_ruangan(
     """
     Test updating only the ruangan field of a jadwal.
     """
-    existing_jadwal = [
-        JadwalDto(
-            id=1,
-            hari="Senin",
-            jam_mulai=time(8, 0),
-            jam_selesai=time(10, 0),
-            ruangan="R101",
-            mata_kuliah_id=1,
-            dosen_id=1,
-            is_active=True,
-        )
-    ]
-
     update_dto = UpdateJadwalDto(
         id=1,
         hari="Senin",
@@ -286,8 +212,6 @@ def test_update_jadwal_change_only_ruangan(
         is_active=True,
     )
 
-    # Mock: jadwal exists
-    mock_jadwal_repo.read.return_value = existing_jadwal
     mock_jadwal_repo.update.return_value = updated_jadwal
 
     # Act
@@ -304,19 +228,6 @@ def test_update_jadwal_change_time_range(
     """
     Test updating the time range of a jadwal.
     """
-    existing_jadwal = [
-        JadwalDto(
-            id=1,
-            hari="Senin",
-            jam_mulai=time(8, 0),
-            jam_selesai=time(10, 0),
-            ruangan="R101",
-            mata_kuliah_id=1,
-            dosen_id=1,
-            is_active=True,
-        )
-    ]
-
     update_dto = UpdateJadwalDto(
         id=1,
         hari="Senin",
@@ -339,8 +250,6 @@ def test_update_jadwal_change_time_range(
         is_active=True,
     )
 
-    # Mock: jadwal exists
-    mock_jadwal_repo.read.return_value = existing_jadwal
     mock_jadwal_repo.update.return_value = updated_jadwal
 
     # Act
@@ -358,19 +267,6 @@ def test_update_jadwal_change_mata_kuliah_and_dosen(
     """
     Test updating mata_kuliah_id and dosen_id of a jadwal.
     """
-    existing_jadwal = [
-        JadwalDto(
-            id=1,
-            hari="Senin",
-            jam_mulai=time(8, 0),
-            jam_selesai=time(10, 0),
-            ruangan="R101",
-            mata_kuliah_id=1,
-            dosen_id=1,
-            is_active=True,
-        )
-    ]
-
     update_dto = UpdateJadwalDto(
         id=1,
         hari="Senin",
@@ -393,8 +289,6 @@ def test_update_jadwal_change_mata_kuliah_and_dosen(
         is_active=True,
     )
 
-    # Mock: jadwal exists
-    mock_jadwal_repo.read.return_value = existing_jadwal
     mock_jadwal_repo.update.return_value = updated_jadwal
 
     # Act
@@ -0,0 +1,95 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.dtos.mahasiswa_dto import CreateMahasiswaDto, MahasiswaDto
+from src.application.enums import MahasiswaStatus
+from src.application.usecases.interfaces.mahasiswa_repository import (
+    MahasiswaRepositoryInterface,
+)
+from src.application.usecases.mahasiswa import MahasiswaService
+
+
+@pytest.fixture
+def mock_mahasiswa_repo() -> MagicMock:
+    """Fixture for a mocked MahasiswaRepositoryInterface."""
+    return MagicMock(spec=MahasiswaRepositoryInterface)
+
+
+@pytest.fixture
+def mahasiswa_service(mock_mahasiswa_repo: MagicMock) -> MahasiswaService:
+    """Fixture for MahasiswaService with a mocked repository."""
+    return MahasiswaService(mahasiswa_repo=mock_mahasiswa_repo)
+
+
+def make_create_dto(nim: str) -> CreateMahasiswaDto:
+    return CreateMahasiswaDto(
+        nim=nim,
+        nama=f"Mahasiswa {nim}",
+        kelas="TI-3A",
+        tempat_lahir="Jakarta",
+        tanggal_lahir=date(2002, 5, 15),
+    )
+
+
+def make_dto(id: int, create_dto: CreateMahasiswaDto) -> MahasiswaDto:
+    return MahasiswaDto(
+        id=id,
+        status=MahasiswaStatus.ACTIVE,
+        **create_dto.model_dump(exclude={"status"}),
+    )
+
+
+def test_bulk_create_mahasiswa_success(
+    mahasiswa_service: MahasiswaService, mock_mahasiswa_repo: MagicMock
+):
+    """
+    Test that all items are checked with one set-based query and inserted at once.
+    """
+    create_dtos = [make_create_dto("2024000001"), make_create_dto("2024000002")]
+    created = [make_dto(1, create_dtos[0]), make_dto(2, create_dtos[1])]
+    mock_mahasiswa_repo.read_existing_values.return_value = set()
+    mock_mahasiswa_repo.bulk_create.return_value = created
+
+    result = mahasiswa_service.bulk_create(create_dtos)
+
+    mock_mahasiswa_repo.read_existing_values.assert_called_once_with(
+        "nim", ["2024000001", "2024000002"]
+    )
+    mock_mahasiswa_repo.bulk_create.assert_called_once_with(create_dtos)
+    mock_mahasiswa_repo.read.assert_not_called()
+    mock_mahasiswa_repo.create.assert_not_called()
+    assert result.created == created
+    assert result.errors == []
+
+
+def test_bulk_create_mahasiswa_reports_duplicates(
+    mahasiswa_service: MahasiswaService, mock_mahasiswa_repo: MagicMock
+):
+    """
+    Test that NIMs already stored, or repeated within the batch, are reported
+    per item while the remaining items are still created.
+    """
+    create_dtos = [
+        make_create_dto("2024000001"),
+        make_create_dto("2024000002"),
+        make_create_dto("2024000003"),
+        make_create_dto("2024000003"),
+    ]
+    mock_mahasiswa_repo.read_existing_values.return_value = {"2024000002"}
+    mock_mahasiswa_repo.bulk_create.return_value = [
+        make_dto(1, create_dtos[0]),
+        make_dto(2, create_dtos[2]),
+    ]
+
+    result = mahasiswa_service.bulk_create(create_dtos)
+
+    mock_mahasiswa_repo.bulk_create.assert_called_once_with(
+        [create_dtos[0], create_dtos[2]]
+    )
+    assert len(result.created) == 2
+    assert [error.index for error in result.errors] == [1, 3]
+    assert result.errors[0].message == (
+        "Mahasiswa with NIM '2024000002' already exists."
+    )
@@ -10,7 +10,6 @@ from src.application.usecases.interfaces.mahasiswa_repository import (
     MahasiswaRepositoryInterface,
 )
 from src.application.usecases.mahasiswa import MahasiswaService
-from src.ports.mahasiswa import GetMahasiswaPort
 
 
 @pytest.fixture
@@ -49,17 +48,13 @@ def test_create_mahasiswa_success(
         status=MahasiswaStatus.ACTIVE,
     )
 
-    # Mock: NIM doesn't exist yet
-    mock_mahasiswa_repo.read.return_value = []
     # Mock: Create returns the new mahasiswa
     mock_mahasiswa_repo.create.return_value = expected_result
 
     result = mahasiswa_service.create(create_dto)
 
-    # Verify repository was called to check for existing NIM
-    mock_mahasiswa_repo.read.assert_called_once_with(
-        GetMahasiswaPort(nim=create_dto.nim)
-    )
+    # Verify no separate read is issued to check for an existing NIM
+    mock_mahasiswa_repo.read.assert_not_called()
     # Verify repository was called to create
     mock_mahasiswa_repo.create.assert_called_once_with(create_dto)
     # Verify result
@@ -80,30 +75,17 @@ def test_create_mahasiswa_duplicate_nim(
         tanggal_lahir=date(2002, 5, 15),
     )
 
-    existing_mahasiswa = [
-        MahasiswaDto(
-            id=1,
-            nim="2024000001",
-            nama="Existing Student",
-            kelas="TI-3B",
-            tempat_lahir="Bandung",
-            tanggal_lahir=date(2001, 1, 1),
-            status=MahasiswaStatus.ACTIVE,
-        )
-    ]
-
-    # Mock: NIM already exists
-    mock_mahasiswa_repo.read.return_value = existing_mahasiswa
+    # Mock: the unique constraint on NIM rejects the insert
+    mock_mahasiswa_repo.create.side_effect = DuplicateEntryException(
+        resource_name="Mahasiswa", field_name="NIM", field_value=create_dto.nim
+    )
 
     with pytest.raises(DuplicateEntryException) as exc_info:
         mahasiswa_service.create(create_dto)
 
     assert "2024000001" in str(exc_info.value.message)
-    mock_mahasiswa_repo.read.assert_called_once_with(
-        GetMahasiswaPort(nim=create_dto.nim)
-    )
-    # Verify create was NOT called
-    mock_mahasiswa_repo.create.assert_not_called()
+    mock_mahasiswa_repo.create.assert_called_once_with(create_dto)
+    mock_mahasiswa_repo.read.assert_not_called()
 
 
 def test_create_mahasiswa_empty_nim_allowed(
@@ -165,13 +147,12 @@ def test_create_mahasiswa_repository_called_correctly(
         status=MahasiswaStatus.ACTIVE,
     )
 
-    mock_mahasiswa_repo.read.return_value = []
     mock_mahasiswa_repo.create.return_value = expected_result
 
     result = mahasiswa_service.create(create_dto)
 
-    # Verify read was called first to check for duplicates
-    assert mock_mahasiswa_repo.read.call_count == 1
+    # Verify the create is a single repository call
+    assert mock_mahasiswa_repo.read.call_count == 0
     # Verify create was called with the DTO
     mock_mahasiswa_repo.create.assert_called_once_with(create_dto)
     assert result == expected_result